@@ -1,14 +1,31 @@
+import argparse
+import bisect
+import heapq
 import html as _html
 import json
 import logging
 import os
 import re
+import secrets
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
 import time
+import traceback
+import unicodedata
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, Optional
 from urllib.parse import unquote
 
+# Nullpunkt der Start-Timeline (--startup-profile); der Selenium-Import zählt schon zur Startzeit
+_STARTUP_T0 = time.perf_counter()
+
 from selenium import webdriver
-from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -18,6 +35,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.actions.action_builder import ActionBuilder
 from selenium.webdriver.common.actions.pointer_input import PointerInput
 
+try:
+    import psutil  # Prozess-Metriken (CPU, I/O, Speicher) – ohne psutil nur unter Linux über /proc
+except ImportError:
+    psutil = None
+
 # === CONFIGURATION ===
 HEADLESS: bool = os.getenv("BW_HEADLESS", "false").lower() in {"1", "true", "yes"}
 START_URL: str = os.getenv("BW_START_URL", "https://s.to/")
@@ -25,12 +47,79 @@ INTRO_SKIP_SECONDS: int = int(os.getenv("BW_INTRO_SKIP", "80"))
 MAX_RETRIES: int = int(os.getenv("BW_MAX_RETRIES", "3"))
 WAIT_TIMEOUT: int = int(os.getenv("BW_WAIT_TIMEOUT", "25"))
 PROGRESS_SAVE_INTERVAL: int = int(os.getenv("BW_PROGRESS_INTERVAL", "5"))
+AUTO_HOSTER: bool = os.getenv("BW_AUTO_HOSTER", "true").lower() in {"1", "true", "yes"}
+HOSTER_MAX_ERROR_RATE: float = float(os.getenv("BW_HOSTER_MAX_ERROR_RATE", "0.5"))
+
+# Kadenzen der Playback-Schleife (Sekunden)
+UI_POLL_INTERVAL: float = float(os.getenv("BW_UI_POLL_INTERVAL", "0.5"))
+URL_CHECK_INTERVAL: float = 2.0
+SOURCE_CHECK_INTERVAL: float = 5.0
+HEALTH_CHECK_INTERVAL: float = 30.0
+END_CHECK_MIN_INTERVAL: float = 0.5
+END_CHECK_MAX_INTERVAL: float = 20.0
+# Antwortfrist der Video-Bridge (postMessage Top-Dokument ↔ Video-Frame), Sekunden
+VIDEO_CALL_TIMEOUT: float = 1.5
+
+# Idle-Modus der Hauptschleife: nach so vielen leeren Durchläufen ereignisgesteuert warten
+IDLE_AFTER_PASSES: int = 6
+IDLE_WAIT_MAX: float = float(os.getenv("BW_IDLE_WAIT", "10"))
+
+# Sidebar als WebExtension (Content-Script) statt Injektion pro Navigation
+SIDEBAR_EXTENSION: bool = os.getenv("BW_SIDEBAR_EXTENSION", "true").lower() in {"1", "true", "yes"}
+
+# Schlanke Arbeitskopie des Profils im RAM (tmpfs) statt des vollen Profils; Zustand wird beim Beenden zurückgeschrieben
+SLIM_PROFILE: bool = os.getenv("BW_SLIM_PROFILE", "true").lower() in {"1", "true", "yes"}
+PROFILE_RAM_DIR: str = os.getenv("BW_PROFILE_RAMDIR", "")
+
+# Reserve-Browser im Hintergrund vorhalten, der bei einem Absturz sofort übernimmt (kostet RAM)
+STANDBY_BROWSER: bool = os.getenv("BW_STANDBY", "false").lower() in {"1", "true", "yes"}
+
+# An einen dauerhaft laufenden Firefox andocken (geckodriver --connect-existing) statt ihn jedes Mal zu starten
+CONNECT_EXISTING: bool = os.getenv("BW_CONNECT_EXISTING", "false").lower() in {"1", "true", "yes"}
+MARIONETTE_PORT: int = int(os.getenv("BW_MARIONETTE_PORT", "2828"))
+FIREFOX_BINARY: str = os.getenv("BW_FIREFOX_BINARY", "")
+
+# Beim Start die zuletzt laufende Folge aus dem Session-Snapshot direkt fortsetzen (ohne Startseite/Sidebar-Auswahl)
+RESUME_SESSION: bool = os.getenv("BW_RESUME_SESSION", "true").lower() in {"1", "true", "yes"}
+
+# Speicher-Governor: Firefox-Speicher (PSS aller Prozesse, MB) zwischen zwei Folgen begrenzen; 0 = aus
+MEM_SOFT_MB: int = int(os.getenv("BW_MEM_SOFT_MB", "1500"))   # darüber: Minimize-Memory (wie about:memory)
+MEM_HARD_MB: int = int(os.getenv("BW_MEM_HARD_MB", "3000"))   # darüber: Tab neu anlegen (Content-Prozess weg)
+MEMORY_LOG: str = os.getenv("BW_MEMORY_LOG", "")               # optional: Samples als CSV zum Plotten
+# Hoster-Domains, in deren Frames die Extension die Video-Bridge lädt (weitere per BW_HOSTER_DOMAINS, kommagetrennt).
+# Unbekannte Domains (z. B. wechselnde Spiegel) bekommen die Bridge wie ohne Extension per execute_script.
+HOSTER_DOMAINS: list = [
+    "voe.sx", "streamtape.com", "vidoza.net", "doodstream.com", "dood.li", "d0000d.com",
+    "filemoon.sx", "vidmoly.to", "speedfiles.net", "loadx.ws", "luluvdo.com",
+] + [d.strip() for d in os.getenv("BW_HOSTER_DOMAINS", "").split(",") if d.strip()]
+
+# Popups/neue Tabs der Hoster schließen (alles außer dem Wiedergabe-Tab)
+REAP_WINDOWS: bool = os.getenv("BW_REAP_WINDOWS", "true").lower() in {"1", "true", "yes"}
+
+# Watchdog: Frist je WebDriver-Befehl (Script-Timeout), Seitenladen, und ab wann eine hängende Schleife
+# den Browser-Failover auslöst (Sekunden; 0 = Watchdog-Thread aus)
+CALL_DEADLINE: float = float(os.getenv("BW_CALL_DEADLINE", "30"))
+PAGE_LOAD_DEADLINE: float = float(os.getenv("BW_PAGE_LOAD_DEADLINE", "60"))
+STALL_AFTER: float = float(os.getenv("BW_STALL_AFTER", "120"))
+
+# Start-Timeline pro Phase ausgeben (auch per --startup-profile)
+STARTUP_PROFILE: bool = os.getenv("BW_STARTUP_PROFILE", "false").lower() in {"1", "true", "yes"}
+
+# Benchmarks (Sidebar usw.) beim Start ausführen und ins Log schreiben
+BENCH: bool = os.getenv("BW_BENCH", "false").lower() in {"1", "true", "yes"}
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 GECKO_DRIVER_PATH = os.path.join(SCRIPT_DIR, "geckodriver.exe")
+PROFILE_DIR = os.path.join(SCRIPT_DIR, "user.BingeWatcher")
+BROWSER_STATE_FILE = os.path.join(SCRIPT_DIR, "browser_session.json")
 
 PROGRESS_DB_FILE = os.path.join(SCRIPT_DIR, "progress.json")
 SETTINGS_DB_FILE = os.path.join(SCRIPT_DIR, "settings.json")
+HOSTER_STATS_FILE = os.path.join(SCRIPT_DIR, "hoster_stats.json")
+CATALOG_FILE = os.path.join(SCRIPT_DIR, "catalog.json")
+SESSION_FILE = os.path.join(SCRIPT_DIR, "session.json")
+CATALOG_MAX_AGE: float = float(os.getenv("BW_CATALOG_MAX_AGE", "86400"))
+CATALOG_RESULTS: int = 8
 
 # === STREAMING PROVIDERS ===
 STREAMING_PROVIDERS = {
@@ -39,6 +128,8 @@ STREAMING_PROVIDERS = {
         "base_url": "https://s.to/",
         "url_pattern": r"https://s\.to/serie/stream/([^/]+)/staffel-(\d+)(?:/episode-(\d+))?",
         "episode_url_template": "https://s.to/serie/stream/{series}/staffel-{season}/episode-{episode}",
+        "catalog_url": "https://s.to/serien",
+        "catalog_link": r"/serie/stream/([^/\"?#]+)/?$",
         "color": "#3b82f6"
     },
     "aniworld.to": {
@@ -46,6 +137,8 @@ STREAMING_PROVIDERS = {
         "base_url": "https://aniworld.to/",
         "url_pattern": r"https://aniworld\.to/anime/stream/([^/]+)/staffel-(\d+)/episode-(\d+)",
         "episode_url_template": "https://aniworld.to/anime/stream/{series}/staffel-{season}/episode-{episode}",
+        "catalog_url": "https://aniworld.to/animes",
+        "catalog_link": r"/anime/stream/([^/\"?#]+)/?$",
         "color": "#8b5cf6"
     }
 }
@@ -78,11 +171,31 @@ def get_tor_setting() -> bool:
     except Exception:
         return False
 
-USE_TOR_PROXY: bool = get_tor_setting()
 TOR_SOCKS_PORT: int = int(os.getenv("BW_TOR_PORT", "9050"))
 
 # === UTILS: PROGRESS ===
+# Datei-Schreibzugriffe aus der Playback-Schleife (Fortschritt, Telemetrie) laufen hier nacheinander im
+# Hintergrund; wer auf dem Haupt-Thread liest oder synchron schreibt, wartet vorher auf den letzten Auftrag
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bw-io")
+_IO_LAST: Dict[str, Any] = {"future": None}
+
+
+def submit_io(fn, *args, **kwargs) -> None:
+    _IO_LAST["future"] = _IO_POOL.submit(fn, *args, **kwargs)
+
+
+def flush_io() -> None:
+    fut = _IO_LAST["future"]
+    if fut is None or threading.current_thread() is not threading.main_thread():
+        return
+    try:
+        fut.result(timeout=10)
+    except Exception:
+        pass
+
+
 def load_progress() -> Dict[str, Dict[str, Any]]:
+    flush_io()
     try:
         if os.path.exists(PROGRESS_DB_FILE):
             with open(PROGRESS_DB_FILE, "r", encoding="utf-8") as f:
@@ -107,7 +220,7 @@ def save_progress(
     provider: str = "s.to",
 ) -> bool:
     try:
-        db = load_progress()
+        db = load_progress()  # wartet auch auf ausstehende Hintergrund-Saves (Reihenfolge bleibt erhalten)
         entry = db.get(series, {}) if isinstance(db.get(series, {}), dict) else {}
         entry.update(
             {
@@ -124,12 +237,128 @@ def save_progress(
 
         with open(PROGRESS_DB_FILE, "w", encoding="utf-8") as f:
             json.dump(db, f, indent=2, ensure_ascii=False)
+        if is_playing and series == current_series:
+            note_session(
+                series=series, season=int(season), episode=int(episode), provider=provider,
+                position=round(float(position), 2),
+            )
         return True
     except Exception as e:
         logging.error(f"Error saving progress: {e}")
         return False
 
 
+# === SESSION SNAPSHOT ===
+# Kompakter Zustand der laufenden Folge (session.json): URL, Serie/Staffel/Folge/Provider, Position mit
+# Sekundenbruchteilen, Hoster/Player-Frame, Vollbild-Weg, Sidebar-Tab + Scroll. Wird mit jedem
+# Fortschritts-Save geschrieben und beim Start/Failover zum direkten Fortsetzen genutzt.
+_SESSION: Dict[str, Any] = {}
+# note_session läuft im Hauptthread und (über save_progress) im I/O-Worker: Update + Dump nur unter dem Lock
+_SESSION_LOCK = threading.Lock()
+
+
+def load_session_snapshot() -> Dict[str, Any]:
+    try:
+        with open(SESSION_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def note_session(reset: bool = False, **fields: Any) -> None:
+    """Felder in den Snapshot übernehmen (reset=True: vorher leeren) und ihn (klein, atomar per replace)
+    schreiben."""
+    with _SESSION_LOCK:
+        if reset:
+            _SESSION.clear()
+        _SESSION.update(fields)
+        _SESSION["ts"] = time.time()
+        try:
+            tmp = SESSION_FILE + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(_SESSION, f, ensure_ascii=False)
+            os.replace(tmp, SESSION_FILE)
+        except Exception as e:
+            logging.debug(f"Session snapshot not written: {e}")
+
+
+def session_resume_job(series: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Fortsetzungs-Job {series, season, episode, provider, position, hint}. Ohne series nur, wenn laut
+    Snapshot gerade eine Folge lief. Staffel/Folge kommen aus dem Fortschritt; passt der Snapshot dazu,
+    liefert er die genaue Position und die Player-Hinweise (Hoster, Vollbild-Weg, Sidebar-Tab/Scroll)."""
+    snap = load_session_snapshot()
+    if series is None:
+        if not snap.get("playing"):
+            return None
+        series = snap.get("series")
+    entry = load_progress().get(series or "")
+    if not isinstance(entry, dict):
+        return None
+    job: Dict[str, Any] = {
+        "series": series,
+        "season": int(entry.get("season", 1)),
+        "episode": int(entry.get("episode", 1)),
+        "provider": entry.get("provider") or "s.to",
+        "position": int(entry.get("position", 0)),
+        "hint": {},
+    }
+    if snap.get("series") == series and (snap.get("season"), snap.get("episode")) == (job["season"], job["episode"]):
+        try:
+            job["position"] = float(snap.get("position", job["position"]))
+        except (TypeError, ValueError):
+            pass
+        job["hint"] = {k: snap[k] for k in ("hoster", "fs", "tab", "scroll") if snap.get(k) is not None}
+    return job
+
+
+def read_player_fingerprint(driver) -> Dict[str, Any]:
+    """Ein Round-Trip im Top-Dokument: URL, Player-Frame und Sidebar-Tab/-Scroll (localStorage der Seite)."""
+    try:
+        driver.switch_to.default_content()
+        return driver.execute_script(
+            """
+            const f = document.querySelector('.inSiteWebStream iframe') || document.querySelector('iframe');
+            let frame = null;
+            try { frame = f && f.src ? new URL(f.src, location.href).host : null; } catch (_) {}
+            const ls = k => { try { return localStorage.getItem(k); } catch (_) { return null; } };
+            return { url: location.href, frame, tab: ls('bw_active_provider'),
+                     scroll: parseInt(ls('bw_sidebar_scroll') || '0', 10) || 0 };
+        """
+        ) or {}
+    except Exception:
+        return {}
+
+
+def restore_sidebar_view(driver, hint: Dict[str, Any]) -> None:
+    """Sidebar-Tab und -Scroll aus dem Snapshot in den localStorage der Zielseite legen; die Sidebar liest
+    beides beim ersten Füllen der Liste."""
+    if not hint.get("tab") and not hint.get("scroll"):
+        return
+    try:
+        driver.execute_script(
+            """
+            try {
+              if (arguments[0]) localStorage.setItem('bw_active_provider', arguments[0]);
+              if (arguments[1]) localStorage.setItem('bw_sidebar_scroll', String(arguments[1]));
+            } catch (_) {}
+        """,
+            hint.get("tab"),
+            int(hint.get("scroll") or 0),
+        )
+    except Exception:
+        pass
+
+
+def end_playback() -> None:
+    """play_episodes_loop ist zurück. Wurde nicht das Programm beendet (dann soll der nächste Start dort
+    weitermachen), ist die Folge bewusst verlassen: Snapshot nicht mehr fortsetzen."""
+    global is_playing
+    is_playing = False
+    if not should_quit and _SESSION.get("playing"):
+        note_session(playing=False)
+
+
 def handle_list_item_deletion(name: str) -> bool:
     try:
         db = load_progress()
@@ -219,7 +448,7 @@ def detect_intro_start(driver, series: str, season: int = 1) -> bool:
         series_data = intro_times.get(series, {})
         
         # Get current video time
-        current_time = driver.execute_script("return document.querySelector('video')?.currentTime || 0;")
+        current_time = get_current_position(driver)
         
         # Check if we're in the intro time window
         for intro in series_data.get("intros", []):
@@ -232,11 +461,8 @@ def detect_intro_start(driver, series: str, season: int = 1) -> bool:
                     detection_patterns = intro.get("detection_patterns", [])
                     
                     # Check for intro indicators in the page
-                    page_text = driver.execute_script("return document.body.innerText.toLowerCase();")
-                    
-                    for pattern in detection_patterns:
-                        if pattern.lower() in page_text:
-                            return True
+                    if detection_patterns and video_call(driver, "textHas", detection_patterns, default=False):
+                        return True
                     
                     # If we're in the time window and no specific patterns found, assume it's an intro
                     return True
@@ -251,11 +477,7 @@ def smart_skip_intro(driver, series: str, season: int = 1):
     """Smart intro skipping that only skips when an intro is detected"""
     try:
         # Wait for video to be ready
-        WebDriverWait(driver, 15).until(
-            lambda d: d.execute_script(
-                "return document.querySelector('video')?.readyState > 0;"
-            )
-        )
+        wait_for_video_ready(driver)
 
         progress_entry = load_progress().get(series, {})
         has_custom_intro = (
@@ -266,14 +488,9 @@ def smart_skip_intro(driver, series: str, season: int = 1):
             intro_start = get_intro_skip_seconds(series)
             intro_end = get_intro_skip_end_seconds(series)
             if intro_end > intro_start:
-                current_time = driver.execute_script(
-                    "return document.querySelector('video')?.currentTime || 0;"
-                )
+                current_time = get_current_position(driver)
                 if intro_start <= current_time <= intro_end:
-                    driver.execute_script(
-                        "document.querySelector('video').currentTime = arguments[0];",
-                        intro_end,
-                    )
+                    video_call(driver, "seek", intro_end)
             return
 
         # Get intro times
@@ -282,10 +499,7 @@ def smart_skip_intro(driver, series: str, season: int = 1):
         # Check if we should skip intro
         if detect_intro_start(driver, series, season):
             logging.info(f"Intro detected for {series}, skipping to {intro_end} seconds")
-            driver.execute_script(
-                "document.querySelector('video').currentTime = arguments[0];",
-                intro_end,
-            )
+            video_call(driver, "seek", intro_end)
         else:
             logging.info(f"No intro detected for {series}, continuing normally")
             
@@ -295,6 +509,42 @@ def smart_skip_intro(driver, series: str, season: int = 1):
         skip_intro(driver, get_intro_skip_seconds(series))
 
 
+def resolve_start_position(series: str, season: int, position: float, auto_skip: bool) -> float:
+    """Ermittelt die Startposition, bevor das Video lädt (Resume bzw. Intro-Ende, falls die Position im Intro liegt).
+    Sekundenbruchteile (Session-Snapshot) bleiben erhalten."""
+    try:
+        position = max(0.0, float(position or 0))
+        entry = load_progress().get(series, {})
+        if position > 0 or "intro_skip_start" in entry or "intro_skip_end" in entry:
+            intro_start = get_intro_skip_seconds(series)
+            intro_end = get_intro_skip_end_seconds(series)
+        elif auto_skip:
+            intro_start, intro_end = get_default_intro_times(series, season)
+        else:
+            return 0
+        if position == 0 and not auto_skip:
+            return 0
+        if intro_end > intro_start and intro_start <= position <= intro_end:
+            return intro_end
+        return position
+    except Exception:
+        return max(0.0, float(position or 0))
+
+
+def get_intro_window(series: str, season: int = 1) -> tuple[int, int]:
+    """Intro-Fenster für das In-Page-Skipping: eigene Werte aus progress.json, sonst intro_times.json, sonst keins."""
+    try:
+        entry = load_progress().get(series, {})
+        if "intro_skip_start" in entry or "intro_skip_end" in entry:
+            return get_intro_skip_seconds(series), get_intro_skip_end_seconds(series)
+        for intro in load_intro_times().get(series, {}).get("intros", []):
+            if intro.get("season") == season:
+                return int(intro.get("start_time", 0)), int(intro.get("end_time", 0))
+    except Exception:
+        pass
+    return 0, 0
+
+
 def get_end_skip_seconds(series: str) -> int:
     try:
         data = load_progress().get(series, {})
@@ -326,48 +576,327 @@ def norm_series_key(s: str) -> str:
         return str(s or "").strip()
 
 
+# === UTILS: HOSTER TELEMETRY ===
+def load_hoster_stats() -> Dict[str, Dict[str, Any]]:
+    flush_io()
+    try:
+        if os.path.exists(HOSTER_STATS_FILE):
+            with open(HOSTER_STATS_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                if isinstance(data, dict):
+                    return data
+        return {}
+    except Exception as e:
+        logging.debug(f"Hoster stats could not be loaded: {e}")
+        return {}
+
+
+def record_hoster_sample(
+    hoster: str,
+    ttff: Optional[float] = None,
+    stalls: int = 0,
+    error_232011: bool = False,
+    fullscreen_ok: Optional[bool] = None,
+    failed: bool = False,
+) -> bool:
+    """Merged eine Messung (time-to-first-frame, Stalls, 232011, Fullscreen) in hoster_stats.json.
+    failed: der Hoster lieferte gar kein abspielbares Video (zählt wie 232011 gegen ihn)."""
+    if not hoster:
+        return False
+    try:
+        db = load_hoster_stats()
+        entry = db.get(hoster, {}) if isinstance(db.get(hoster, {}), dict) else {}
+        entry["samples"] = int(entry.get("samples", 0)) + 1
+        if ttff is not None and ttff > 0:
+            # EWMA, damit sich ein Hoster nach Ausfällen wieder "erholen" kann
+            prev = entry.get("ttff_avg")
+            entry["ttff_avg"] = round(
+                float(ttff) if prev is None else 0.7 * float(prev) + 0.3 * float(ttff), 3
+            )
+            entry["ttff_count"] = int(entry.get("ttff_count", 0)) + 1
+        entry["stalls"] = int(entry.get("stalls", 0)) + max(0, int(stalls or 0))
+        if error_232011:
+            entry["err_232011"] = int(entry.get("err_232011", 0)) + 1
+        if failed:
+            entry["failed"] = int(entry.get("failed", 0)) + 1
+        if fullscreen_ok is not None:
+            entry["fs_attempts"] = int(entry.get("fs_attempts", 0)) + 1
+            if fullscreen_ok:
+                entry["fs_ok"] = int(entry.get("fs_ok", 0)) + 1
+        entry["last"] = time.time()
+        db[hoster] = entry
+
+        with open(HOSTER_STATS_FILE, "w", encoding="utf-8") as f:
+            json.dump(db, f, indent=2, ensure_ascii=False)
+        return True
+    except Exception as e:
+        logging.error(f"Hoster stats could not be saved: {e}")
+        return False
+
+
+def hoster_error_rate(entry: Dict[str, Any]) -> float:
+    samples = int(entry.get("samples", 0))
+    if samples <= 0:
+        return 0.0
+    return (int(entry.get("err_232011", 0)) + int(entry.get("failed", 0))) / samples
+
+
+def rank_hosters(available: list, stats: Optional[Dict[str, Dict[str, Any]]] = None) -> list:
+    """Sortiert verfügbare Hoster: gesunde mit bekannter TTFF zuerst (schnellste vorne),
+    dann unbekannte in Seitenreihenfolge, ungesunde zuletzt."""
+    if stats is None:
+        stats = load_hoster_stats()
+
+    def key(item):
+        idx, name = item
+        entry = stats.get(name) or {}
+        if hoster_error_rate(entry) > HOSTER_MAX_ERROR_RATE:
+            return (2, hoster_error_rate(entry), idx)
+        if entry.get("ttff_avg") is None:
+            return (1, 0.0, idx)
+        stall_rate = int(entry.get("stalls", 0)) / max(1, int(entry.get("samples", 1)))
+        return (0, float(entry["ttff_avg"]) + stall_rate, idx)
+
+    return [name for _, name in sorted(enumerate(available), key=key)]
+
+
+# === STARTUP PROFILE --------------------------- ===
+# (Phase, Start, Ende) in Sekunden seit _STARTUP_T0; parallele Phasen laufen neben der Hauptkette
+STARTUP_TIMELINE: list = []
+_STARTUP_LAST = {"t": 0.0, "done": False}
+
+
+def startup_mark(phase: str) -> None:
+    """Schließt eine Phase der Startkette ab (Beginn = Ende der vorigen Phase)."""
+    if _STARTUP_LAST["done"]:
+        return
+    now = time.perf_counter() - _STARTUP_T0
+    STARTUP_TIMELINE.append((phase, _STARTUP_LAST["t"], now))
+    _STARTUP_LAST["t"] = now
+
+
+def startup_span(phase: str, start: float, end: float) -> None:
+    """Trägt eine parallel gelaufene Phase ein (perf_counter-Werte)."""
+    if not _STARTUP_LAST["done"]:
+        STARTUP_TIMELINE.append((phase + " ∥", start - _STARTUP_T0, end - _STARTUP_T0))
+
+
+def format_startup_timeline(timeline: list) -> str:
+    lines = ["Startup timeline:"]
+    for phase, start, end in sorted(timeline, key=lambda p: (p[1], p[2])):
+        lines.append(f"  {start:7.3f} → {end:7.3f}s  {(end - start) * 1000:7.0f} ms  {phase}")
+    return "\n".join(lines)
+
+
+def finish_startup(resumed: bool = False) -> None:
+    """Sidebar ist gefüllt und bedienbar (bzw. die Folge aus dem Session-Snapshot ist geladen):
+    Zeit bis dahin loggen (Timeline bei --startup-profile)."""
+    if _STARTUP_LAST["done"]:
+        return
+    if not resumed:
+        startup_mark("sidebar filled")
+    _STARTUP_LAST["done"] = True
+    what = "Episode resumed" if resumed else "Sidebar usable"
+    logging.info(f"{what} after {_STARTUP_LAST['t']:.2f}s")
+    if STARTUP_PROFILE:
+        logging.info(format_startup_timeline(STARTUP_TIMELINE))
+
+
+def prefetch_startup_data() -> Dict[str, Dict[str, Any]]:
+    """Läuft parallel zum Browserstart: Fortschritt laden, Sidebar-Zeilen rendern (_ROW_CACHE)
+    und die Reihenfolge vorsortieren (_ROW_ORDER). Der erste Sidebar-Push ist dann nur noch ein Dump."""
+    t0 = time.perf_counter()
+    db = load_progress()
+    sidebar_payload(sidebar_rows(db))
+    startup_span("prefetch progress + sidebar rows", t0, time.perf_counter())
+    return db
+
+
+# === PROFILE MANAGER --------------------------- ===
+# Goldenes Profil = nur diese Einträge aus user.BingeWatcher (Prefs, userChrome, uBlock & Co.);
+# Safebrowsing-Listen, Startup-Caches, extensions.json mit fremden Pfaden usw. bleiben draußen
+PROFILE_SEED = ("prefs.js", "user.js", "extension-preferences.json", "chrome", "extensions")
+# Wertvoller Zustand: wird mitgeklont und beim Beenden zurückgeschrieben (inkl. -wal/-shm)
+PROFILE_STATE = (
+    "cookies.sqlite", "webappsstore.sqlite", "permissions.sqlite", "storage.sqlite", "storage/default",
+)
+# Arbeitskopien laufender Sessions: session_id → Profilpfad (aktive Session + ggf. Standby)
+_PROFILE_WORK: Dict[str, str] = {}
+
+
+def profile_ram_root() -> str:
+    """Verzeichnis für die Arbeitskopie: BW_PROFILE_RAMDIR, sonst /dev/shm (tmpfs), sonst Temp."""
+    if PROFILE_RAM_DIR:
+        return PROFILE_RAM_DIR
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def _profile_entries(base: str, names: tuple) -> list:
+    """Relative Pfade der vorhandenen Einträge (SQLite samt -wal/-shm)."""
+    out = []
+    for name in names:
+        if os.path.exists(os.path.join(base, name)):
+            out.append(name)
+        for suffix in ("-wal", "-shm"):
+            if name.endswith(".sqlite") and os.path.exists(os.path.join(base, name + suffix)):
+                out.append(name + suffix)
+    return out
+
+
+def _copy_entry(src_base: str, dst_base: str, rel: str) -> int:
+    """Kopiert eine Datei/einen Ordner; ersetzt das Ziel erst, wenn die Kopie vollständig ist. Gibt Bytes zurück."""
+    src, dst = os.path.join(src_base, rel), os.path.join(dst_base, rel)
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp = dst + ".bwsync"
+    if os.path.isdir(src):
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.copytree(src, tmp)
+        shutil.rmtree(dst, ignore_errors=True)
+        os.replace(tmp, dst)
+        return dir_size(dst)[0]
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+    return os.path.getsize(dst)
+
+
+def dir_size(path: str) -> tuple:
+    """(Bytes, Dateien) unterhalb von path."""
+    total = files = 0
+    for root, _, names in os.walk(path):
+        for n in names:
+            try:
+                total += os.path.getsize(os.path.join(root, n))
+                files += 1
+            except OSError:
+                continue
+    return total, files
+
+
+def clone_profile() -> str:
+    """Legt eine schlanke Arbeitskopie des goldenen Profils im RAM an und gibt ihren Pfad zurück."""
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    work = tempfile.mkdtemp(prefix="bw-profile-", dir=profile_ram_root())
+    for rel in _profile_entries(PROFILE_DIR, PROFILE_SEED + PROFILE_STATE):
+        try:
+            _copy_entry(PROFILE_DIR, work, rel)
+        except Exception as e:
+            logging.debug(f"Profile clone: {rel} skipped: {e}")
+    return work
+
+
+def release_profile(work: Optional[str], sync: bool = True) -> None:
+    """Schreibt Cookies/localStorage & Co. aus der Arbeitskopie zurück und räumt sie weg.
+    prefs.js wird bewusst nicht zurückgeschrieben (enthält die Automations-Prefs von geckodriver)."""
+    if not work or not os.path.isdir(work):
+        return
+    if sync:
+        synced = 0
+        for rel in _profile_entries(work, PROFILE_STATE):
+            try:
+                synced += _copy_entry(work, PROFILE_DIR, rel)
+            except Exception as e:
+                logging.warning(f"Profile sync-back failed for {rel}: {e}")
+        # -wal/-shm, die es in der Arbeitskopie nicht mehr gibt, gehören nicht mehr zur Datenbank
+        for name in PROFILE_STATE:
+            for suffix in ("-wal", "-shm"):
+                stale = os.path.join(PROFILE_DIR, name + suffix)
+                if name.endswith(".sqlite") and os.path.exists(stale) and not os.path.exists(
+                    os.path.join(work, name + suffix)
+                ):
+                    try:
+                        os.remove(stale)
+                    except OSError:
+                        pass
+        logging.info(f"Profile state synced back ({synced / 1024:.0f} KB)")
+    shutil.rmtree(work, ignore_errors=True)
+
+
+def quit_browser(driver: Optional[webdriver.Firefox]) -> None:
+    """Beendet Firefox und schreibt danach den Zustand der Profil-Arbeitskopie zurück."""
+    if not driver:
+        return
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    _WINDOWS.pop(driver.session_id, None)
+    release_profile(_PROFILE_WORK.pop(driver.session_id, None))
+
+
+def apply_profile(options, work: Optional[str]) -> None:
+    """Profil an Firefox übergeben: Arbeitskopie direkt per -profile (kein Kopieren/Zippen durch Selenium),
+    sonst wie bisher das volle Profil über Selenium."""
+    if work:
+        options.add_argument("-profile")
+        options.add_argument(work)
+        # Add-ons aus dem Profilordner ohne Rückfrage aktiv lassen (extensions.json wird nicht mitgeklont)
+        options.set_preference("extensions.autoDisableScopes", 0)
+    else:
+        options.profile = PROFILE_DIR
+
+
 # === BROWSER HANDLING --------------------------- ===
-def start_browser() -> webdriver.Firefox:
+def browser_prefs(use_tor: bool) -> Dict[str, Any]:
+    """Firefox-Prefs des Bots (Popups, Vollbild, Autoplay, Proxy) – für Selenium-Start und persistenten Browser."""
+    prefs: Dict[str, Any] = {
+        "dom.popup_allowed_events": "change click dblclick mouseup pointerup touchend",
+        "dom.allow_scripts_to_close_windows": False,
+        "browser.tabs.warnOnClose": False,
+        "browser.warnOnQuit": False,
+        "browser.sessionstore.warnOnQuit": False,
+        "full-screen-api.enabled": True,
+        "full-screen-api.allow-trusted-requests-only": False,
+        "full-screen-api.mouse-event-allow-button": True,
+        "full-screen-api.warning.delay": 0,
+        "full-screen-api.warning.timeout": 0,
+        "layers.acceleration.disabled": True,
+        "gfx.webrender.force-disabled": True,
+        "media.wmf.dxva.enabled": False,
+        "media.eme.enabled": True,
+        "media.gmp-widevinecdm.enabled": True,
+        "media.autoplay.default": 0,
+        "media.block-autoplay-until-in-foreground": False,
+        "media.autoplay.blocking_policy": 0,
+        "media.autoplay.allow-muted": True,
+    }
+    if use_tor:
+        prefs.update({
+            "network.proxy.type": 1,
+            "network.proxy.socks": "127.0.0.1",
+            "network.proxy.socks_port": TOR_SOCKS_PORT,
+            "network.proxy.socks_remote_dns": True,
+        })
+    else:
+        prefs.update({
+            "network.proxy.type": 0,
+            "network.proxy.socks": "",
+            "network.proxy.socks_port": 0,
+            "network.proxy.socks_remote_dns": False,
+        })
+    return prefs
+
+
+def start_browser(standby: bool = False) -> webdriver.Firefox:
+    """Startet Firefox. standby=True: Reserve-Session für den Failover, minimiert und ohne Startup-Timeline."""
+    if CONNECT_EXISTING and not standby:
+        return attach_browser()
+    work: Optional[str] = None
     try:
-        profile_path = os.path.join(SCRIPT_DIR, "user.BingeWatcher")
-        os.makedirs(profile_path, exist_ok=True)
+        if SLIM_PROFILE:
+            profile_path = work = clone_profile()
+            if not standby:
+                startup_mark("profile clone")
+        else:
+            profile_path = PROFILE_DIR
+            os.makedirs(profile_path, exist_ok=True)
         options = webdriver.FirefoxOptions()
-        options.set_preference(
-            "dom.popup_allowed_events",
-            "change click dblclick mouseup pointerup touchend",
-        )
-        options.set_preference("dom.allow_scripts_to_close_windows", False)
-        options.set_preference("browser.tabs.warnOnClose", False)
-        options.set_preference("browser.warnOnQuit", False)
-        options.set_preference("browser.sessionstore.warnOnQuit", False)
-
-        options.set_preference("full-screen-api.enabled", True)
-        options.set_preference("full-screen-api.allow-trusted-requests-only", False)
-        options.set_preference("full-screen-api.mouse-event-allow-button", True)
-        options.set_preference("full-screen-api.warning.delay", 0)
-        options.set_preference("full-screen-api.warning.timeout", 0)
-        options.set_preference("layers.acceleration.disabled", True)
-        options.set_preference("gfx.webrender.force-disabled", True)
-        options.set_preference("media.wmf.dxva.enabled", False)
-        options.set_preference("media.eme.enabled", True)
-        options.set_preference("media.gmp-widevinecdm.enabled", True)
-        options.set_preference("media.autoplay.default", 0)
-        options.set_preference("media.block-autoplay-until-in-foreground", False)
-        options.set_preference("media.autoplay.blocking_policy", 0)
-        options.set_preference("media.autoplay.allow-muted", True)
-
+        use_tor = get_tor_setting()
+        for name, value in browser_prefs(use_tor).items():
+            options.set_preference(name, value)
         options.set_preference("profile", profile_path)
-        options.profile = profile_path
-        if USE_TOR_PROXY:
-            options.set_preference("network.proxy.type", 1)
-            options.set_preference("network.proxy.socks", "127.0.0.1")
-            options.set_preference("network.proxy.socks_port", TOR_SOCKS_PORT)
-            options.set_preference("network.proxy.socks_remote_dns", True)
-        else:
-            options.set_preference("network.proxy.type", 0)
-            options.set_preference("network.proxy.socks", "")
-            options.set_preference("network.proxy.socks_port", 0)
-            options.set_preference("network.proxy.socks_remote_dns", False)
+        apply_profile(options, work)
 
         if HEADLESS:
             options.headless = True
@@ -377,24 +906,300 @@ def start_browser() -> webdriver.Firefox:
 
         service = Service(executable_path=GECKO_DRIVER_PATH)
         driver = webdriver.Firefox(service=service, options=options)
-
-        if os.getenv("BW_KIOSK", "false").lower() in {"1", "true", "yes"}:
-            try:
-                driver.fullscreen_window()
-            except Exception:
-                pass
-
-        move_to_primary_and_maximize(driver)
+        if work:
+            _PROFILE_WORK[driver.session_id] = work
+            work = None
+        if standby:
+            if not HEADLESS:
+                try:
+                    driver.minimize_window()
+                except Exception:
+                    pass
+            if SIDEBAR_EXTENSION:
+                install_sidebar_extension(driver)
+            count_frame_switches(driver)
+            guard_driver(driver)
+            logging.info(f"Standby browser ready. Profile: {profile_path}")
+            return driver
+
+        startup_mark("geckodriver + Firefox launch")
+        count_frame_switches(driver)
+        guard_driver(driver)
+        if SIDEBAR_EXTENSION:
+            install_sidebar_extension(driver)
+            startup_mark("sidebar extension install")
+
+        show_browser(driver)
+        claim_main_window(driver)
+        startup_mark("window placement")
 
         logging.info(
-            f"Browser started. Profile: {profile_path} | Tor: {'on' if USE_TOR_PROXY else 'off'}"
+            f"Browser started. Profile: {profile_path} | Tor: {'on' if use_tor else 'off'}"
         )
         return driver
     except Exception as e:
         logging.error(f"Browser startup failed: {e}")
+        release_profile(work, sync=False)
         raise BingeWatcherError("Browser startup failed")
 
 
+def show_browser(driver: webdriver.Firefox) -> None:
+    """Kiosk-Modus (BW_KIOSK) bzw. Fenster auf den Primärmonitor legen und maximieren."""
+    if os.getenv("BW_KIOSK", "false").lower() in {"1", "true", "yes"}:
+        try:
+            driver.fullscreen_window()
+        except Exception:
+            pass
+    move_to_primary_and_maximize(driver)
+
+
+# Reserve-Browser (BW_STANDBY): läuft minimiert im Hintergrund und übernimmt, wenn die aktive Session stirbt
+_STANDBY: Dict[str, Any] = {"future": None}
+_STANDBY_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bw-standby")
+
+
+def _launch_standby() -> webdriver.Firefox:
+    driver = start_browser(standby=True)
+    safe_navigate(driver, START_URL, settle=0)
+    return driver
+
+
+def ensure_standby() -> None:
+    """Startet die Reserve-Session im Hintergrund, falls keine läuft oder startet."""
+    if STANDBY_BROWSER and _STANDBY["future"] is None and not should_quit:
+        _STANDBY["future"] = _STANDBY_POOL.submit(_launch_standby)
+
+
+def standby_ready() -> bool:
+    fut = _STANDBY["future"]
+    return bool(fut and fut.done() and not fut.exception())
+
+
+def promote_standby() -> Optional[webdriver.Firefox]:
+    """Holt die Reserve-Session nach vorn (wartet notfalls auf ihren Start); None, wenn keine brauchbar ist."""
+    fut, _STANDBY["future"] = _STANDBY["future"], None
+    if fut is None:
+        return None
+    try:
+        driver = fut.result(timeout=WAIT_TIMEOUT * 2)
+    except Exception as e:
+        logging.warning(f"Standby browser unavailable: {e}")
+        return None
+    try:
+        driver.current_url  # lebt sie noch?
+    except Exception as e:
+        logging.warning(f"Standby browser died: {e}")
+        quit_browser(driver)
+        return None
+    show_browser(driver)
+    claim_main_window(driver)
+    return driver
+
+
+def drop_standby() -> None:
+    """Reserve-Session beim Beenden mit abbauen (auch wenn sie gerade noch startet)."""
+    fut, _STANDBY["future"] = _STANDBY["future"], None
+    if fut is None:
+        return
+    try:
+        quit_browser(fut.result(timeout=WAIT_TIMEOUT * 2))
+    except Exception:
+        pass
+
+
+# === PERSISTENT BROWSER (--connect-existing / --browser) --------------------------- ===
+def _load_browser_state() -> Dict[str, Any]:
+    try:
+        with open(BROWSER_STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _save_browser_state(state: Dict[str, Any]) -> None:
+    try:
+        with open(BROWSER_STATE_FILE, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+    except Exception as e:
+        logging.warning(f"Browser state could not be saved: {e}")
+
+
+def marionette_listening(port: int) -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.3):
+            return True
+    except OSError:
+        return False
+
+
+def find_firefox_binary() -> Optional[str]:
+    """BW_FIREFOX_BINARY, sonst firefox im PATH, sonst die üblichen Windows-Installationspfade."""
+    candidates = [
+        FIREFOX_BINARY,
+        shutil.which("firefox") or "",
+        os.path.join(os.getenv("PROGRAMFILES", r"C:\Program Files"), "Mozilla Firefox", "firefox.exe"),
+        os.path.join(os.getenv("PROGRAMFILES(X86)", r"C:\Program Files (x86)"), "Mozilla Firefox", "firefox.exe"),
+    ]
+    return next((c for c in candidates if c and os.path.isfile(c)), None)
+
+
+def write_user_js(profile: str, prefs: Dict[str, Any]) -> None:
+    """Prefs als user.js ablegen – beim persistenten Browser setzt sie kein geckodriver."""
+    with open(os.path.join(profile, "user.js"), "w", encoding="utf-8") as f:
+        for name, value in prefs.items():
+            f.write(f"user_pref({json.dumps(name)}, {json.dumps(value)});\n")
+
+
+def start_persistent_browser() -> Dict[str, Any]:
+    """Startet Firefox mit Marionette als eigenständigen Prozess (überlebt das Skript); gibt den Zustand zurück."""
+    state = _load_browser_state()
+    if state and marionette_listening(int(state.get("port", 0))):
+        return state
+    if marionette_listening(MARIONETTE_PORT):
+        raise BingeWatcherError(f"Port {MARIONETTE_PORT} is taken by another Firefox (BW_MARIONETTE_PORT)")
+    binary = find_firefox_binary()
+    if not binary:
+        raise BingeWatcherError("Firefox not found, set BW_FIREFOX_BINARY")
+    release_profile(state.get("profile"))  # Rest eines abgestürzten Laufs zurückschreiben
+    work = clone_profile()
+    prefs = browser_prefs(get_tor_setting())
+    prefs.update({
+        "marionette.port": MARIONETTE_PORT,
+        "extensions.autoDisableScopes": 0,
+        "browser.shell.checkDefaultBrowser": False,
+        "browser.startup.homepage_override.mstone": "ignore",
+        "datareporting.policy.dataSubmissionEnabled": False,
+    })
+    write_user_js(work, prefs)
+    args = [binary, "-marionette", "-no-remote", "-profile", work]
+    if HEADLESS:
+        args.append("-headless")
+    args.append(START_URL)
+    if os.name == "nt":
+        flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        proc = subprocess.Popen(args, creationflags=flags, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        proc = subprocess.Popen(args, start_new_session=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + WAIT_TIMEOUT
+    while not marionette_listening(MARIONETTE_PORT):
+        if proc.poll() is not None or time.time() > deadline:
+            release_profile(work, sync=False)
+            raise BingeWatcherError("Persistent Firefox did not open its Marionette port")
+        time.sleep(0.2)
+    state = {"pid": proc.pid, "port": MARIONETTE_PORT, "profile": work, "started": time.time()}
+    _save_browser_state(state)
+    logging.info(f"Persistent Firefox started (pid {proc.pid}, Marionette port {MARIONETTE_PORT})")
+    return state
+
+
+def attach_browser() -> webdriver.Firefox:
+    """Dockt per geckodriver --connect-existing an den persistenten Firefox an (startet ihn bei Bedarf).
+    Offener Tab und geladene Sidebar bleiben erhalten; die Sidebar-Extension wird nur einmal pro Prozess installiert."""
+    try:
+        state = start_persistent_browser()
+        startup_mark("persistent Firefox")
+        if not os.path.exists(GECKO_DRIVER_PATH):
+            raise BingeWatcherError(f"Geckodriver missing under {GECKO_DRIVER_PATH}")
+        service = Service(
+            executable_path=GECKO_DRIVER_PATH,
+            service_args=["--connect-existing", "--marionette-port", str(state["port"])],
+        )
+        driver = webdriver.Firefox(service=service, options=webdriver.FirefoxOptions())
+        startup_mark("attach (geckodriver --connect-existing)")
+        count_frame_switches(driver)
+        guard_driver(driver)
+        if SIDEBAR_EXTENSION and state.get("extension") == state.get("pid") and state.get("token"):
+            _SIDEBAR_TOKEN["value"] = state["token"]  # Extension stammt von einem früheren Lauf
+        elif SIDEBAR_EXTENSION:
+            if install_sidebar_extension(driver):
+                state["extension"] = state.get("pid")
+                state["token"] = _SIDEBAR_TOKEN["value"]
+                _save_browser_state(state)
+            startup_mark("sidebar extension install")
+        logging.info(f"Attached to running Firefox (pid {state.get('pid')}, port {state['port']})")
+        return driver
+    except Exception as e:
+        logging.error(f"Attaching to Firefox failed: {e}")
+        raise BingeWatcherError("Browser attach failed")
+
+
+def stop_persistent_browser() -> bool:
+    """Schließt den persistenten Firefox (Fenster zu, notfalls Prozess beenden) und schreibt sein Profil zurück."""
+    state = _load_browser_state()
+    if not state:
+        return False
+    port = int(state.get("port", 0))
+    if marionette_listening(port):
+        try:
+            service = Service(
+                executable_path=GECKO_DRIVER_PATH, service_args=["--connect-existing", "--marionette-port", str(port)]
+            )
+            driver = webdriver.Firefox(service=service, options=webdriver.FirefoxOptions())
+            for handle in list(driver.window_handles):
+                driver.switch_to.window(handle)
+                driver.close()
+        except Exception:
+            pass
+        deadline = time.time() + 15
+        while marionette_listening(port) and time.time() < deadline:
+            time.sleep(0.3)
+        if marionette_listening(port):
+            import signal
+
+            try:
+                os.kill(int(state["pid"]), signal.SIGTERM)
+                time.sleep(2)
+            except Exception:
+                pass
+    release_profile(state.get("profile"))
+    try:
+        os.remove(BROWSER_STATE_FILE)
+    except OSError:
+        pass
+    return True
+
+
+def supervise_browser(command: str) -> int:
+    """--browser start|stop|status: persistenten Firefox für --connect-existing verwalten. Exit-Code für die Shell."""
+    try:
+        if command == "start":
+            state = start_persistent_browser()
+            print(f"Firefox running (pid {state.get('pid')}, Marionette port {state.get('port')})")
+        elif command == "stop":
+            print("Firefox stopped" if stop_persistent_browser() else "No persistent Firefox")
+        else:
+            state = _load_browser_state()
+            up = bool(state) and marionette_listening(int(state.get("port", 0)))
+            print(f"Firefox running (pid {state.get('pid')}, Marionette port {state.get('port')})" if up else "Not running")
+            return 0 if up else 1
+        return 0
+    except Exception as e:
+        logging.error(f"Browser {command} failed: {e}")
+        return 1
+
+
+def on_provider_page(driver: webdriver.Firefox) -> bool:
+    try:
+        url = driver.current_url or ""
+    except Exception:
+        return False
+    return url.startswith(tuple(p["base_url"] for p in STREAMING_PROVIDERS.values()))
+
+
+def kill_browser(driver: webdriver.Firefox) -> int:
+    """Beendet die Firefox-Prozesse der Session hart (Failover-Übung); gibt die Anzahl zurück."""
+    import signal
+
+    killed = 0
+    for pid in browser_pids(driver):
+        try:
+            os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+            killed += 1
+        except Exception:
+            continue
+    return killed
+
+
 def arm_window_close_guard(driver):
     try:
         driver.switch_to.default_content()
@@ -412,63 +1217,60 @@ def arm_window_close_guard(driver):
 
 
 def move_to_primary_and_maximize(driver):
-    """Platziert das Fenster auf dem Primärmonitor (Monitor 1) und maximiert es."""
+    """Platziert das Fenster auf dem Primärmonitor (Monitor 1) und maximiert es.
+    Die Bildschirmgröße per tkinter wird nur noch geholt, wenn das OS-Maximize scheitert."""
     if HEADLESS:
         return
+    # 1) Windows: Arbeitsbereich (Taskleiste ausgenommen), billig per ctypes
     try:
-        # 1) Windows: Arbeitsbereich (Taskleiste ausgenommen)
-        try:
-            import ctypes
-            from ctypes import wintypes
-
-            SPI_GETWORKAREA = 0x0030
-            rect = wintypes.RECT()
-            ctypes.windll.user32.SystemParametersInfoW(
-                SPI_GETWORKAREA, 0, ctypes.byref(rect), 0
-            )
-            x, y = int(rect.left), int(rect.top)
-            w, h = int(rect.right - rect.left), int(rect.bottom - rect.top)
-        except Exception:
-            # 2) Sonst: Primärbildschirm-Größe per tkinter
-            try:
-                import tkinter as tk
+        import ctypes
+        from ctypes import wintypes
 
-                root = tk.Tk()
-                root.withdraw()
-                w, h = root.winfo_screenwidth(), root.winfo_screenheight()
-                root.destroy()
-                x, y = 0, 0
-            except Exception:
-                # 3) Fallback
-                x, y, w, h = 0, 0, 1920, 1080
+        SPI_GETWORKAREA = 0x0030
+        rect = wintypes.RECT()
+        ctypes.windll.user32.SystemParametersInfoW(
+            SPI_GETWORKAREA, 0, ctypes.byref(rect), 0
+        )
+        driver.set_window_position(int(rect.left), int(rect.top))
+        driver.set_window_size(int(rect.right - rect.left), int(rect.bottom - rect.top))
+    except Exception:
+        pass
+    # 2) OS-Maximize (auf dem Monitor, auf dem Firefox geöffnet hat)
+    try:
+        driver.maximize_window()
+        return
+    except Exception:
+        pass
+    # 3) Letzte Rettung: Primärbildschirm-Größe per tkinter (startet extra einen Tk-Interpreter)
+    try:
+        import tkinter as tk
 
-        driver.set_window_position(x, y)
-        # Entweder explizit auf Arbeitsbereich…
+        root = tk.Tk()
+        root.withdraw()
+        w, h = root.winfo_screenwidth(), root.winfo_screenheight()
+        root.destroy()
+    except Exception:
+        w, h = 1920, 1080
+    try:
+        driver.set_window_position(0, 0)
         driver.set_window_size(w, h)
-        # …oder OS-Maximize als Alternative:
-        try:
-            driver.maximize_window()
-        except Exception:
-            pass
     except Exception:
-        # Letzte Rettung
-        try:
-            driver.maximize_window()
-        except Exception:
-            pass
+        pass
 
 
 def safe_navigate(
-    driver: webdriver.Firefox, url: str, max_retries: int = MAX_RETRIES
+    driver: webdriver.Firefox, url: str, max_retries: int = MAX_RETRIES, settle: float = 1.0
 ) -> bool:
     for attempt in range(max_retries):
+        WATCHDOG.beat("navigate", driver)
         try:
             driver.get(url)
             arm_window_close_guard(driver)
             WebDriverWait(driver, WAIT_TIMEOUT).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
-            time.sleep(1.0)
+            if settle > 0:
+                time.sleep(settle)
             return True
         except WebDriverException as e:
             logging.warning(
@@ -704,25 +1506,6 @@ def _default_settings() -> Dict[str, Any]:
     }
 
 
-def read_localstorage_value(
-    driver: webdriver.Firefox,
-    key: str,
-) -> Optional[str]:
-    try:
-        driver.switch_to.default_content()
-        value = driver.execute_script(
-            """
-            let r = localStorage.getItem(arguments[0]);
-            if (r) localStorage.removeItem(arguments[0]);
-            return r;
-        """,
-            key,
-        )
-        return value if isinstance(value, str) else None
-    except Exception:
-        return None
-
-
 # === NAVIGATION HANDLING --------------------------- ===
 def slugify_series(s: str) -> str:
     s = (s or "").strip().lower()
@@ -875,6 +1658,563 @@ def resolve_next_episode_aniworld(
         return None
 
 
+# === HOSTER SELECTION --------------------------- ===
+def list_episode_hosters(driver) -> list:
+    """Liest die Hoster-Liste der Episodenseite (nur die aktuell gewählte Sprache)."""
+    try:
+        driver.switch_to.default_content()
+        items = driver.execute_script(
+            """
+            const lis = Array.from(document.querySelectorAll(
+              '.hosterSiteVideo li[data-link-target], li.episodeLink[data-link-target]'));
+            const frame = document.querySelector('.inSiteWebStream iframe') || document.querySelector('iframe');
+            const src = frame ? (frame.getAttribute('src') || '') : '';
+            const visible = lis.filter(li => li.offsetParent !== null);
+            const pool = visible.length ? visible : lis;
+            return pool.map(li => {
+              const h = li.querySelector('h4');
+              const i = li.querySelector('i[title]');
+              const name = ((h && h.textContent) || (i && i.getAttribute('title')) || '')
+                             .replace(/^Hoster\\s+/i, '').trim();
+              const target = li.getAttribute('data-link-target') || '';
+              return { name, target, lang: li.getAttribute('data-lang-key') || '',
+                       active: !!(target && src && src.indexOf(target) !== -1) };
+            }).filter(h => h.name && h.target);
+        """
+        )
+        return items if isinstance(items, list) else []
+    except Exception:
+        return []
+
+
+def select_fastest_hoster(driver, prefer: Optional[str] = None) -> Optional[str]:
+    """Wählt vor dem Abspielen den historisch schnellsten gesunden Hoster. Gibt den Hoster-Namen zurück.
+    prefer: Hoster aus dem Session-Snapshot, wird genommen, solange die Folge ihn anbietet."""
+    hosters = list_episode_hosters(driver)
+    if not hosters:
+        return None
+    active = next((h for h in hosters if h.get("active")), hosters[0])
+    preferred = next((h for h in hosters if prefer and h["name"] == prefer), None)
+    if (not AUTO_HOSTER and not preferred) or len(hosters) < 2:
+        return active.get("name")
+
+    if preferred:
+        best = preferred
+    else:
+        ranked = rank_hosters([h["name"] for h in hosters])
+        best = next(h for h in hosters if h["name"] == ranked[0])
+    if best["name"] == active.get("name"):
+        return best["name"]
+
+    try:
+        driver.switch_to.default_content()
+        switched = driver.execute_script(
+            """
+            const target = arguments[0];
+            const frame = document.querySelector('.inSiteWebStream iframe') || document.querySelector('iframe');
+            if (!frame) return false;
+            frame.src = new URL(target, location.href).href;
+            return true;
+        """,
+            best["target"],
+        )
+        if switched:
+            logging.info(f"Hoster selected: {best['name']} (default was {active.get('name')})")
+            return best["name"]
+    except Exception as e:
+        logging.debug(f"Hoster switch failed: {e}")
+    return active.get("name")
+
+
+# === HOOK REGISTRY --------------------------- ===
+# Eine Registry pro Fenster (und Welt: Seite bzw. Content-Script), die jedem injizierten Script vorangestellt
+# wird. Listener/Timer laufen über einen Schlüssel: erneutes Registrieren ersetzt statt zu stapeln, einmalige
+# Patches (history-Wrapper) über once(). counts() liefert die Zahlen für die Diagnose.
+HOOKS_JS = """
+if (!window.__bwHooks) {
+  window.__bwHooks = (() => {
+    const subs = new Map(), timers = new Map(), marks = new Set();
+    const off = key => {
+      const s = subs.get(key); if (!s) return false;
+      subs.delete(key);
+      try { s.target.removeEventListener(s.type, s.fn, s.capture); } catch (_) {}
+      return true;
+    };
+    const clear = key => {
+      if (!timers.has(key)) return false;
+      clearTimeout(timers.get(key)); timers.delete(key);
+      return true;
+    };
+    const counts = () => {
+      const byType = {};
+      subs.forEach(s => { byType[s.type] = (byType[s.type] || 0) + 1; });
+      return { listeners: subs.size, timers: timers.size, hooks: marks.size, byType };
+    };
+    return {
+      on(key, target, type, fn, opts) {
+        off(key);
+        const capture = typeof opts === 'boolean' ? opts : !!(opts && opts.capture);
+        const h = (opts && opts.once)
+          ? function (e) { if (subs.get(key) && subs.get(key).fn === h) subs.delete(key); return fn.call(this, e); }
+          : fn;
+        target.addEventListener(type, h, opts);
+        subs.set(key, { target, type, fn: h, capture });
+        return h;
+      },
+      off,
+      every(key, ms, fn) { clear(key); timers.set(key, setInterval(fn, ms)); },
+      after(key, ms, fn) { clear(key); timers.set(key, setTimeout(() => { timers.delete(key); fn(); }, ms)); },
+      clear,
+      once(key) { if (marks.has(key)) return false; marks.add(key); return true; },
+      counts,
+      // inkl. der Registry der Seite, falls wir im Content-Script laufen (wrappedJSObject)
+      all() {
+        const own = counts();
+        let page = null;
+        try {
+          const w = window.wrappedJSObject;
+          if (w && w.__bwHooks) page = JSON.parse(JSON.stringify(w.__bwHooks.counts()));
+        } catch (_) {}
+        if (!page) return own;
+        const byType = Object.assign({}, own.byType);
+        Object.keys(page.byType || {}).forEach(k => { byType[k] = (byType[k] || 0) + page.byType[k]; });
+        return { listeners: own.listeners + page.listeners, timers: own.timers + page.timers,
+                 hooks: own.hooks + page.hooks, byType };
+      },
+    };
+  })();
+}
+"""
+
+
+def hook_counts(driver) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Listener/Timer/Hooks der Registry im Top-Dokument und im Video-Frame (je Seite + Extension-Welt)."""
+    out: Dict[str, Optional[Dict[str, Any]]] = {"top": None, "video": None}
+    try:
+        driver.switch_to.default_content()
+        out["top"] = driver.execute_script(
+            sidebar_js(
+                """
+            try { const r = __bwSb('__bwHookCounts'); if (r && r !== 'missing' && r !== 'denied') return JSON.parse(r); } catch (_) {}
+            return window.__bwHooks ? window.__bwHooks.counts() : null;
+        """
+            )
+        )
+    except Exception:
+        pass
+    out["video"] = video_call(driver, "hooks")
+    return out
+
+
+def format_hook_counts(counts: Dict[str, Optional[Dict[str, Any]]]) -> str:
+    parts = []
+    for where in ("top", "video"):
+        c = counts.get(where)
+        if isinstance(c, dict):
+            parts.append(f"{where} {c.get('listeners', 0)} listeners/{c.get('timers', 0)} timers")
+    return ", ".join(parts) or "n/a"
+
+
+# === VIDEO BRIDGE --------------------------- ===
+# Läuft in jedem Frame (Extension: Content-Script in allen Frames, sonst einmalig per execute_script in den
+# Video-Frame). Der Frame mit dem <video> meldet sich per postMessage beim Top-Dokument und führt dort
+# ankommende Befehle aus; der Zustand (Probe, Skip-Fenster, Events) gehört allein der Bridge.
+# Befehle werden nur vom Top-Dokument einer Provider-Seite angenommen, Antworten gehen nur an dessen Origin.
+PROVIDER_ORIGINS = [info["base_url"].rstrip("/") for info in STREAMING_PROVIDERS.values()]
+VIDEO_BRIDGE_JS = HOOKS_JS + "const BW_ORIGINS = " + json.dumps(PROVIDER_ORIGINS) + ";\n" + """
+(function () {
+  const root = document.documentElement;
+  if (!root || root.hasAttribute('data-bw-bridge')) return;
+  root.setAttribute('data-bw-bridge', '1');
+  const H = window.__bwHooks;
+  const PREFIX = '__bw:';
+  const state = new WeakMap();
+  const events = [];
+  const video = () => document.querySelector('video');
+  const S = v => { let s = state.get(v); if (!s) { s = {}; state.set(v, s); } return s; };
+  const post = (w, m, origin) => { try { w.postMessage(PREFIX + JSON.stringify(m), origin); } catch (_) {} };
+  // Origin des Top-Dokuments ist im Cross-Origin-Frame unbekannt: an jede Provider-Origin adressieren,
+  // der Browser stellt nur an die passende zu. Ausgeklappter Player (Video im Top-Dokument): an sich selbst.
+  const hello = () => {
+    const v = video(); if (!v) return;
+    const r = v.getBoundingClientRect();
+    const m = { t: 'hello', area: Math.round(r.width * r.height) };
+    if (window === window.top) post(window, m, '/');
+    else BW_ORIGINS.forEach(o => post(window.top, m, o));
+  };
+  const report = (type, from, to) => {
+    events.push({ type, from: Math.round(from * 10) / 10, to: Math.round(to * 10) / 10 });
+    if (events.length > 50) events.shift();
+  };
+  // JW-Fehlerseite: ersetzt das <video> oft im selben Frame, darum auch ohne Video auswertbar (FRAME_OPS)
+  const JW_232011 = () => {
+    const el = document.querySelector('.jw-error-msg,.jw-error-text,[class*="jw-error"]');
+    return ((el && (el.textContent || '').toLowerCase()) || '').includes('232011');
+  };
+  const bytesSoFar = () => {
+    let n = 0;
+    try { performance.getEntriesByType('resource').forEach(e => { n += (e.transferSize || e.encodedBodySize || 0); }); } catch (_) {}
+    return n;
+  };
+
+  const ops = {
+    ping: () => true,
+
+    // Stalls ('waiting') zählen und die bis zum ersten Frame übertragenen Bytes merken
+    probe: v => {
+      const s = S(v); if (s.probe) return true;
+      try { performance.setResourceTimingBufferSize(1000); } catch (_) {}
+      s.probe = { stalls: 0, firstFrame: false, bytes: null };
+      H.on('probe:waiting', v, 'waiting', () => { if (s.probe.firstFrame) s.probe.stalls++; }, { passive: true });
+      H.on('probe:timeupdate', v, 'timeupdate', () => {
+        if (s.probe.firstFrame || v.currentTime <= 0) return;
+        s.probe.firstFrame = true;
+        s.probe.bytes = bytesSoFar();
+      }, { passive: true });
+      return true;
+    },
+    firstFrame: v => !!(v.currentTime > 0 && v.readyState > 2),
+    bytesFF: v => (S(v).probe ? S(v).probe.bytes : null),
+    stalls: v => (S(v).probe ? S(v).probe.stalls : 0),
+
+    // Startposition vor der Wiedergabe setzen, damit nicht erst Anfang/Intro geladen wird
+    prime: (v, t) => {
+      const seek = () => { try { if (Math.abs((v.currentTime || 0) - t) > 1) v.currentTime = t; } catch (_) {} };
+      // Falls der Player beim ersten 'playing' doch wieder bei 0 anfängt (Source-Reset), nachziehen
+      H.on('prime:playing', v, 'playing', () => { if ((v.currentTime || 0) < t - 2) seek(); }, { once: true, passive: true });
+      if (v.readyState >= 1) { seek(); return 'seek'; }
+      try { v.preload = 'metadata'; } catch (_) {}
+      H.on('prime:loadedmetadata', v, 'loadedmetadata', seek, { once: true, passive: true });
+      const src = v.getAttribute('src') || '';
+      // Progressive Datei (kein MSE/blob): Media-Fragment, damit der erste Range-Request bei t beginnt
+      if (src && !src.startsWith('blob:') && !/[#&]t=/.test(src)) {
+        v.src = src.split('#')[0] + '#t=' + t;
+        return 'fragment';
+      }
+      return 'loadedmetadata';
+    },
+
+    // Skip-Fenster: timeupdate/seeking springt framegenau, Sprünge landen in events (siehe 'tick')
+    armSkip: (v, introStart, introEnd, endSkip, intro, end) => {
+      const s = S(v), prev = s.skip || {};
+      const cfg = { introStart, introEnd, endSkip, intro, end };
+      const same = prev.introStart === introStart && prev.introEnd === introEnd && prev.endSkip === endSkip;
+      cfg.introDone = same ? !!prev.introDone : false;
+      cfg.endDone = same ? !!prev.endDone : false;
+      s.skip = cfg;
+      if (s.skipArmed) return true;
+      s.skipArmed = true;
+      const check = () => {
+        const c = s.skip; if (!c) return;
+        const t = v.currentTime || 0, d = v.duration;
+        if (c.intro && !c.introDone && c.introEnd > c.introStart
+            && t >= c.introStart && t < c.introEnd - 0.5
+            && !(isFinite(d) && c.introEnd >= d - 1)) {
+          c.introDone = true;
+          v.currentTime = c.introEnd;
+          report('intro', t, c.introEnd);
+          return;
+        }
+        if (c.end && !c.endDone && c.endSkip > 0 && isFinite(d) && d > 1 && (d - t) <= c.endSkip) {
+          c.endDone = true;
+          v.currentTime = Math.max(0, d - 1);
+          try { v.play().catch(() => {}); } catch (_) {}
+          report('end', t, d - 1);
+        }
+      };
+      H.on('skip:timeupdate', v, 'timeupdate', check, { passive: true });
+      H.on('skip:seeking', v, 'seeking', check, { passive: true });
+      // Neue Quelle (z. B. Werbung → Episode): Fenster wieder scharf schalten
+      H.on('skip:emptied', v, 'emptied', () => { if (s.skip) { s.skip.introDone = false; s.skip.endDone = false; } }, { passive: true });
+      check();
+      return true;
+    },
+    tick: v => {
+      const ev = events.splice(0);
+      if (!isFinite(v.duration)) return { remaining: 99999, events: ev };
+      return { remaining: v.duration - v.currentTime, events: ev };
+    },
+
+    pos: v => v.currentTime || 0,
+    state: v => ({
+      time: v.currentTime || 0,
+      duration: isFinite(v.duration) ? v.duration : null,
+      paused: v.paused,
+      ready: v.readyState,
+      src: v.currentSrc || v.src || '',
+    }),
+    seek: (v, t) => { v.currentTime = t; return true; },
+    skipEnd: v => {
+      if (!(isFinite(v.duration) && v.duration > 1)) return false;
+      v.currentTime = Math.max(0, v.duration - 1);
+      try { v.muted = true; v.play(); } catch (_) {}
+      return true;
+    },
+    // true, wenn das Video schon läuft; sonst play() anstoßen
+    play: (v, mute) => {
+      if (mute) v.muted = true;
+      if (!v.paused && v.readyState > 2) return true;
+      try { v.focus(); v.play().catch(() => {}); } catch (_) {}
+      return false;
+    },
+    pause: v => { try { v.pause(); } catch (_) {} return true; },
+    reload: v => { const t = v.currentTime || 0; if (v.load) v.load(); v.currentTime = t; return true; },
+
+    // playbackRate/Volume/Unmute sofort setzen und kurzzeitig stabil halten (Events/Interval)
+    media: (v, rate, vol) => {
+      const s = S(v);
+      const setit = () => {
+        try {
+          // manche Player setzen 'muted' als Attribut → komplett entfernen
+          v.removeAttribute('muted');
+          v.defaultMuted = false;
+          v.muted = (vol === 0);
+          if (v.volume !== vol) v.volume = vol;
+          if (v.playbackRate !== rate) v.playbackRate = rate;
+        } catch (_) {}
+      };
+      setit();
+      // für einige Sekunden „gegenhalten", falls src/MSE/Player neu setzt
+      if (!s.pin) {
+        s.pin = true;
+        const evs = ['loadedmetadata', 'canplay', 'playing', 'ratechange', 'volumechange', 'stalled'];
+        evs.forEach(e => H.on('media:' + e, v, e, setit, { passive: true }));
+        const cleanup = () => {
+          evs.forEach(e => H.off('media:' + e));
+          H.clear('media:pin'); H.clear('media:unpin');
+          s.pin = false;
+        };
+        let n = 0;
+        H.every('media:pin', 150, () => { setit(); if (++n > 20) cleanup(); });
+        H.after('media:unpin', 4000, cleanup);
+      }
+      return true;
+    },
+
+    jwError: () => JW_232011(),
+    // Nur ja/nein: der Seitentext selbst verlässt den Frame nicht
+    textHas: (v, patterns) => {
+      const text = ((document.body && document.body.innerText) || '').toLowerCase();
+      return (patterns || []).some(p => text.includes(String(p).toLowerCase()));
+    },
+    hooks: () => H.all(),
+  };
+  // Ops, die nur den Frame selbst lesen und deshalb auch ohne <video> antworten
+  const FRAME_OPS = ['jwError', 'textHas', 'hooks'];
+
+  H.on('bridge:message', window, 'message', ev => {
+    const d = ev.data;
+    if (typeof d !== 'string' || d.lastIndexOf(PREFIX, 0) !== 0) return;
+    if (ev.source !== window.top || (ev.source !== window && !BW_ORIGINS.includes(ev.origin))) return;
+    let m; try { m = JSON.parse(d.slice(PREFIX.length)); } catch (_) { return; }
+    if (m.t === 'who') { hello(); return; }
+    if (m.t !== 'cmd') return;
+    const reply = r => post(ev.source, Object.assign({ t: 'res', id: m.id }, r), ev.source === window ? '/' : ev.origin);
+    const fn = ops[m.op];
+    if (!fn) return reply({ ok: false, error: 'unknown op ' + m.op });
+    const v = video();
+    if (!v && !FRAME_OPS.includes(m.op)) return reply({ ok: false, error: 'no-video' });
+    try {
+      const value = fn(v, ...(m.args || []));
+      reply({ ok: true, value: value === undefined ? null : value });
+    } catch (e) { reply({ ok: false, error: String(e) }); }
+  });
+  H.on('bridge:hello', document, 'loadedmetadata', hello, true);
+  hello();
+})();
+"""
+
+# Top-Dokument: sammelt die hello-Meldungen, merkt sich den Frame mit dem größten Video und reicht
+# Befehle per postMessage weiter. Wird bei jedem Aufruf mitgeschickt, installiert sich aber nur einmal.
+VIDEO_CALL_JS = HOOKS_JS + """
+const done = arguments[arguments.length - 1];
+if (!window.__bwVideoCall) {
+  const PREFIX = '__bw:';
+  const agg = { target: null, area: -1, seq: 0, pending: new Map(), waiters: [] };
+  const send = (w, m) => { try { w.postMessage(PREFIX + JSON.stringify(m), '*'); } catch (_) {} };
+  const broadcast = (w, m) => {
+    send(w, m);
+    let n = 0; try { n = w.length; } catch (_) {}
+    for (let i = 0; i < n; i++) { try { broadcast(w[i], m); } catch (_) {} }
+  };
+  // iframe-Element dieser Seite, in dem (ggf. verschachtelt) das Fenster w liegt; null = kein eigener Frame
+  const hostFrame = w => {
+    for (const f of document.querySelectorAll('iframe')) {
+      let x = f.contentWindow;
+      if (!x) continue;
+      if (x === w) return f;
+      try { for (let p = w; p && p !== window; p = p.parent) if (p === x) return f; } catch (_) {}
+    }
+    return null;
+  };
+  window.__bwHooks.on('call:message', window, 'message', ev => {
+    const d = ev.data;
+    if (typeof d !== 'string' || d.lastIndexOf(PREFIX, 0) !== 0) return;
+    let m; try { m = JSON.parse(d.slice(PREFIX.length)); } catch (_) { return; }
+    if (m.t === 'hello') {
+      // Nur Frames dieser Seite; die gemeldete Fläche ist höchstens so groß wie ihr iframe hier sichtbar ist
+      let area = Number(m.area) || 0;
+      if (ev.source !== window) {
+        const f = hostFrame(ev.source); if (!f) return;
+        const r = f.getBoundingClientRect();
+        area = Math.min(area, Math.round(r.width * r.height));
+      }
+      if (!agg.target || ev.source === agg.target || area > agg.area) {
+        agg.target = ev.source; agg.area = area;
+      }
+      agg.waiters.splice(0).forEach(f => f());
+    } else if (m.t === 'res') {
+      if (ev.source !== agg.target) return;
+      const p = agg.pending.get(m.id); if (!p) return;
+      agg.pending.delete(m.id); clearTimeout(p.timer);
+      if (!m.ok && m.error === 'no-video') { agg.target = null; agg.area = -1; }
+      p.resolve(m);
+    }
+  });
+  const locate = ms => new Promise(res => {
+    if (agg.target) return res(true);
+    const timer = setTimeout(() => res(false), ms);
+    agg.waiters.push(() => { clearTimeout(timer); res(true); });
+    broadcast(window, { t: 'who' });
+  });
+  window.__bwVideoCall = (op, args, ms) => locate(ms).then(found => {
+    if (!found) return { ok: false, error: 'no-frame' };
+    return new Promise(res => {
+      const id = ++agg.seq;
+      const timer = setTimeout(() => {
+        agg.pending.delete(id); agg.target = null; agg.area = -1;
+        res({ ok: false, error: 'timeout' });
+      }, ms);
+      agg.pending.set(id, { resolve: res, timer });
+      send(agg.target, { t: 'cmd', id, op, args });
+    });
+  });
+}
+window.__bwVideoCall(arguments[0], JSON.parse(arguments[1]), arguments[2])
+  .then(done, e => done({ ok: false, error: String(e) }));
+"""
+
+# Zähler für switch_to.frame/parent_frame/default_content (siehe count_frame_switches)
+FRAME_SWITCHES: Dict[str, int] = {"n": 0}
+
+
+def count_frame_switches(driver: webdriver.Firefox) -> None:
+    """Zählt jeden Frame-Wechsel des Drivers, damit die Playback-Schleife ihn pro Episode loggen kann."""
+    sw = driver.switch_to
+
+    def counted(fn):
+        def wrapper(*args, **kwargs):
+            FRAME_SWITCHES["n"] += 1
+            return fn(*args, **kwargs)
+        return wrapper
+
+    for name in ("frame", "parent_frame", "default_content"):
+        setattr(sw, name, counted(getattr(sw, name)))
+
+
+def video_call(driver, op: str, *args, default: Any = None, timeout: float = VIDEO_CALL_TIMEOUT) -> Any:
+    """Führt einen Video-Befehl aus dem Top-Dokument über die Bridge aus – ohne Frame-Wechsel.
+    Gibt bei fehlender Bridge/Video oder Timeout `default` zurück."""
+    try:
+        res = driver.execute_async_script(VIDEO_CALL_JS, op, json.dumps(args), int(timeout * 1000))
+    except Exception as e:
+        logging.debug(f"Video bridge call {op} failed: {e}")
+        return default
+    if not isinstance(res, dict) or not res.get("ok"):
+        logging.debug(f"Video bridge call {op}: {(res or {}).get('error') if isinstance(res, dict) else res}")
+        return default
+    return res.get("value")
+
+
+def attach_video_bridge(driver) -> bool:
+    """Stellt sicher, dass der Video-Frame über die Bridge erreichbar ist, und endet im Top-Dokument.
+    Mit der Extension meldet sich der Frame selbst; sonst wird die Bridge einmal per Frame-Wechsel injiziert."""
+    try:
+        driver.switch_to.default_content()
+        if video_call(driver, "ping"):
+            return True
+        if ensure_video_context(driver):
+            driver.execute_script(VIDEO_BRIDGE_JS)
+        driver.switch_to.default_content()
+        return bool(video_call(driver, "ping"))
+    except Exception as e:
+        logging.debug(f"Video bridge attach failed: {e}")
+        return False
+
+
+def arm_playback_probe(driver) -> None:
+    """Zählt im Video-Frame Stalls ('waiting') und merkt sich den ersten abgespielten Frame
+    samt der bis dahin übertragenen Bytes (Resource Timing)."""
+    video_call(driver, "probe")
+
+
+def prime_start_position(driver, seconds: float) -> Optional[str]:
+    """Setzt die Startposition, bevor die Wiedergabe beginnt, damit nicht erst Anfang/Intro geladen wird.
+    Gibt die verwendete Methode zurück."""
+    if not seconds or seconds <= 0:
+        return None
+    return video_call(driver, "prime", round(float(seconds), 2))
+
+
+def arm_skip_windows(driver, series: str, season: int, skip_intro_on: bool, skip_end_on: bool) -> bool:
+    """Überträgt die Skip-Fenster der Serie einmalig an die Bridge im Video-Frame. Ein timeupdate/seeking-
+    Listener springt dort framegenau und meldet jeden Sprung (siehe read_video_tick).
+    Erneuter Aufruf aktualisiert nur die Konfiguration."""
+    intro_start, intro_end = get_intro_window(series, season)
+    return bool(
+        video_call(
+            driver,
+            "armSkip",
+            int(intro_start),
+            int(intro_end),
+            int(get_end_skip_seconds(series)),
+            bool(skip_intro_on),
+            bool(skip_end_on),
+            default=False,
+        )
+    )
+
+
+def read_video_tick(driver) -> Optional[Dict[str, Any]]:
+    """Ein Round-Trip pro Tick: Restzeit plus alle seit dem letzten Aufruf gemeldeten In-Page-Events.
+    None, wenn die Bridge nicht antwortet (Frame neu geladen/entfernt)."""
+    data = video_call(driver, "tick")
+    if not isinstance(data, dict):
+        return None
+    return data
+
+
+def read_bytes_before_first_frame(driver) -> Optional[int]:
+    val = video_call(driver, "bytesFF")
+    return int(val) if val is not None else None
+
+
+def wait_for_first_frame(driver, started: float, timeout: float = 15) -> Optional[float]:
+    """Wartet, bis tatsächlich Bild läuft, und liefert die Zeit seit started in Sekunden.
+    Bricht bei JW-Fehler 232011 ab (None), damit die Wiederherstellung nicht auf das Timeout wartet."""
+    end = time.time() + timeout
+    polls = 0
+    while time.time() < end:
+        if video_call(driver, "firstFrame"):
+            return time.time() - started
+        polls += 1
+        if polls % 10 == 0 and detect_232011(driver):
+            return None
+        time.sleep(0.1)
+    return None
+
+
+def time_to_first_frame(driver, switched_at: float, setup: float = 0.0, timeout: float = 15) -> Optional[float]:
+    """TTFF des Hosters: vom Hoster-Wechsel (switched_at; iframe laden, Bridge erreichbar, play()) bis zum
+    ersten Frame, abzüglich der eigenen Bridge-/Prime-Befehle (setup Sekunden). None bei Timeout/232011."""
+    ttff = wait_for_first_frame(driver, switched_at, timeout)
+    return None if ttff is None else max(0.0, ttff - setup)
+
+
+def read_playback_stalls(driver) -> int:
+    return int(video_call(driver, "stalls", default=0) or 0)
+
+
 def find_and_switch_to_video_frame(driver, timeout=12) -> bool:
     """Search up to depth 2 for a <video> and switch to the appropriate frame."""
     end = time.time() + timeout
@@ -930,16 +2270,9 @@ def ensure_video_context(driver) -> bool:
 def safe_save_progress(driver, series, season, episode, provider="s.to") -> int:
     pos = 0
     try:
-        if ensure_video_context(driver):
-            try:
-                pos = int(
-                    driver.execute_script(
-                        "return (document.querySelector('video')?.currentTime||0)"
-                    )
-                )
-            except Exception:
-                pos = 0
-        save_progress(series, season, episode, pos, provider=provider)
+        exact = float(get_current_position(driver) or 0)
+        pos = int(exact)
+        save_progress(series, season, episode, exact, provider=provider)
     except Exception:
         pass
     return pos
@@ -947,11 +2280,7 @@ def safe_save_progress(driver, series, season, episode, provider="s.to") -> int:
 
 def cleanup_before_switch(driver):
     try:
-        try:
-            if ensure_video_context(driver):
-                pause_video(driver)
-        except Exception:
-            pass
+        pause_video(driver)
         exit_fullscreen(driver)
         _hide_sidebar(driver, False)
         time.sleep(0.2)
@@ -960,17 +2289,23 @@ def cleanup_before_switch(driver):
 
 
 def poll_ui_flags(driver):
-    driver.switch_to.default_content()
+    """Liest (und verbraucht) alle Sidebar-Signale in einem einzigen Round-Trip (Top-Dokument)."""
     return driver.execute_script(
         """
       const out={};
-      try{out.quit = localStorage.getItem('bw_quit')==='1'; localStorage.removeItem('bw_quit');}catch(_){}
-      try{out.skip = localStorage.getItem('bw_skip_now')==='1'; localStorage.removeItem('bw_skip_now');}catch(_){}
-      try{out.del  = localStorage.getItem('bw_seriesToDelete'); if(out.del) localStorage.removeItem('bw_seriesToDelete');}catch(_){}
+      const take = k => { try { const v = localStorage.getItem(k); if (v !== null) localStorage.removeItem(k); return v; } catch(_) { return null; } };
+      out.quit = take('bw_quit') === '1';
+      out.skip = take('bw_skip_now') === '1';
+      out.del  = take('bw_seriesToDelete');
       try{ out.sel = localStorage.getItem('bw_series'); }catch(_){}
+      out.settings    = take('bw_settings_update');
+      out.intro_start = take('bw_intro_start_update');
+      out.intro_end   = take('bw_intro_end_update');
+      out.end         = take('bw_end_update');
+      out.catalog     = take('bw_catalog_query');
       return out;
     """
-    )
+    ) or {}
 
 
 def popout_player_iframe(driver) -> bool:
@@ -1004,15 +2339,113 @@ def popout_player_iframe(driver) -> bool:
         return False
 
 
+# === PLAYBACK SCHEDULER --------------------------- ===
+class TickScheduler:
+    """Führt periodische Aufgaben mit eigener Kadenz (Sekunden oder Callable) und Priorität aus
+    und zählt pro Aufgabe Läufe und verbrauchte Zeit."""
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, name: str, interval, priority: int = 0) -> None:
+        self._tasks[name] = {"interval": interval, "priority": priority, "next": 0.0, "runs": 0, "time": 0.0}
+
+    def due(self) -> list:
+        now = time.monotonic()
+        ready = [(t["priority"], n) for n, t in self._tasks.items() if t["next"] <= now]
+        return [n for _, n in sorted(ready)]
+
+    def done(self, name: str, started: float) -> None:
+        task = self._tasks[name]
+        task["runs"] += 1
+        task["time"] += time.perf_counter() - started
+        try:
+            iv = task["interval"]
+            interval = float(iv() if callable(iv) else iv)
+        except Exception:
+            interval = 1.0
+        task["next"] = time.monotonic() + max(0.05, interval)
+
+    def trigger(self, name: str) -> None:
+        if name in self._tasks:
+            self._tasks[name]["next"] = 0.0
+
+    def sleep_time(self) -> float:
+        if not self._tasks:
+            return 1.0
+        nxt = min(t["next"] for t in self._tasks.values())
+        return max(0.02, nxt - time.monotonic())
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {n: {"runs": t["runs"], "time": t["time"]} for n, t in self._tasks.items()}
+
+
+# Summen über die ganze Sitzung (alle Episoden), siehe merge_tick_stats/format_tick_stats
+TICK_STATS: Dict[str, Dict[str, float]] = {}
+
+
+def merge_tick_stats(stats: Dict[str, Dict[str, float]]) -> None:
+    for name, st in stats.items():
+        agg = TICK_STATS.setdefault(name, {"runs": 0, "time": 0.0})
+        agg["runs"] += st.get("runs", 0)
+        agg["time"] += st.get("time", 0.0)
+
+
+def format_tick_stats(stats: Dict[str, Dict[str, float]]) -> str:
+    return ", ".join(
+        f"{name} {int(st['runs'])}x/{st['time']:.2f}s"
+        for name, st in sorted(stats.items(), key=lambda kv: -kv[1]["time"])
+    )
+
+
+def end_check_interval(remaining: float, end_skip: int = 0, rate: float = 1.0) -> float:
+    """Abstand bis zum nächsten Ende-Check: eng kurz vor Schluss, entspannt mitten in der Folge."""
+    if remaining >= 99999:
+        return 2.0
+    margin = remaining - max(3, end_skip)
+    return min(END_CHECK_MAX_INTERVAL, max(END_CHECK_MIN_INTERVAL, margin / (2.0 * max(rate, 0.1))))
+
+
+def apply_skip_time_updates(updates: Dict[str, Any]) -> bool:
+    """Verarbeitet die Skip-Zeit-Eingaben der Sidebar (intro_start/intro_end/end als JSON-Strings)."""
+    changed = False
+    for key in ("intro_start", "intro_end", "end"):
+        raw = updates.get(key)
+        if not raw:
+            continue
+        try:
+            data = json.loads(raw)
+            ser = norm_series_key(data.get("series", ""))
+            try:
+                secs = max(0, int(float(data.get("seconds", 0))))
+            except Exception:
+                secs = 0
+            if not ser:
+                continue
+            if key == "intro_start":
+                ok = set_intro_skip_seconds(ser, secs, get_intro_skip_end_seconds(ser))
+            elif key == "intro_end":
+                ok = set_intro_skip_seconds(ser, get_intro_skip_seconds(ser), secs)
+            else:
+                ok = set_end_skip_seconds(ser, secs)
+            changed = changed or ok
+        except Exception:
+            pass
+    return changed
+
+
 def play_episodes_loop(
     driver: webdriver.Firefox,
     series: str,
     season: int,
     episode: int,
-    position: int = 0,
+    position: float = 0,
     provider: str = "s.to",
+    hint: Optional[Dict[str, Any]] = None,
 ) -> None:
-    global should_quit
+    """Spielt ab series/season/episode Folge für Folge. hint (Session-Snapshot, nur erste Folge):
+    bevorzugter Hoster und Vollbild-Weg."""
+    global should_quit, current_series, is_playing
     current_episode = episode
     current_season = season
     current_provider = provider
@@ -1021,6 +2454,10 @@ def play_episodes_loop(
     is_one_piece = series.lower() in ['one-piece', 'one piece', 'onepiece']
 
     while True:
+        WATCHDOG.beat("episode", driver)
+        # Sicherer Punkt vor der nächsten Folge: Popups schließen, Speicher prüfen, ggf. Minimize/Tab-Recycle
+        reap_windows(driver)
+        govern_memory(driver)
         db = load_progress()
         settings = get_settings(driver)
         auto_fs = settings["autoFullscreen"]
@@ -1043,6 +2480,9 @@ def play_episodes_loop(
             logging.info(f"Canonical slug applied: {series} → {new_series}")
             series = new_series
             is_one_piece = series.replace('-', '').replace(' ', '') in ('onepiece',)
+        # Für den Failover: welche Serie gerade läuft (Staffel/Folge/Position stehen im Fortschritt)
+        current_series, is_playing = series, True
+        hint = hint or {}
 
         if (actual_season != current_season) or (actual_episode is not None and actual_episode != current_episode) or (actual_provider != current_provider):
             logging.info(f"Navigation angepasst: S{current_season}E{current_episode} → S{actual_season}E{actual_episode} (Provider: {current_provider} → {actual_provider})")
@@ -1054,22 +2494,49 @@ def play_episodes_loop(
             
         sync_settings_to_localstorage(driver)
 
-        if not ensure_video_context(driver):
+        WATCHDOG.beat("episode", driver)
+        # TTFF läuft ab dem Hoster-Wechsel: iframe-Load, Bridge-Attach und play() bis zum ersten Frame
+        hoster_started = time.time()
+        hoster = select_fastest_hoster(driver, prefer=hint.get("hoster"))
+        hit_232011 = False
+        fs_ok: Optional[bool] = None
+        popped_out = False
+        stalls_seen = 0
+
+        # Ab hier laufen alle Video-Befehle aus dem Top-Dokument über die Bridge (postMessage)
+        if not attach_video_bridge(driver):
             ok_ctx = False
             for _ in range(3):
                 time.sleep(0.4)
-                if ensure_video_context(driver):
+                if attach_video_bridge(driver):
                     ok_ctx = True
                     break
             if not ok_ctx:
+                # Kein erreichbares Video: zählt gegen den Hoster
+                submit_io(record_hoster_sample, hoster, failed=True)
                 break
 
+        # Resume-/Intro-Ziel setzen, BEVOR abgespielt wird – das erste geladene Segment ist dann das gesehene
+        start_at = resolve_start_position(series, current_season, position, auto_skip)
+        setup_started = time.time()
+        arm_playback_probe(driver)
+        prime_mode = prime_start_position(driver, start_at)
+        # Probe/Prime sind eigene Round-Trips, kein Verdienst des Hosters: aus der TTFF herausrechnen
+        setup = time.time() - setup_started
+        if prime_mode:
+            logging.info(f"Start position {start_at}s primed before playback ({prime_mode})")
+
         play_video(driver)
+        ttff = time_to_first_frame(driver, hoster_started, setup)
+        if ttff is not None:
+            bytes_ff = read_bytes_before_first_frame(driver)
+            logging.info(
+                f"Hoster {hoster or '?'}: first frame after {ttff:.2f}s"
+                + (f", {bytes_ff / 1024:.0f} KiB fetched before it" if bytes_ff is not None else "")
+            )
         apply_media_settings(driver, rate, vol)
-        
-        if position and position > 0:
-            skip_intro(driver, position)
-        elif auto_skip:
+
+        if start_at <= 0 and auto_skip:
             smart_skip_intro(driver, series, current_season)
         position = 0
 
@@ -1077,14 +2544,10 @@ def play_episodes_loop(
         while detect_232011(driver) and recovery_tries < 3:
             logging.warning("JW 232011 detected - attempting recovery...")
             recovery_tries += 1
+            hit_232011 = True
 
             try:
-                driver.execute_script(
-                    """
-                    const v = document.querySelector('video');
-                    if (v){ const t = v.currentTime || 0; v.load?.(); v.currentTime = t; }
-                """
-                )
+                video_call(driver, "reload")
                 time.sleep(0.6)
                 play_video(driver)
                 if not detect_232011(driver):
@@ -1093,7 +2556,8 @@ def play_episodes_loop(
                 pass
 
             if popout_player_iframe(driver):
-                ensure_video_context(driver)
+                popped_out = True
+                attach_video_bridge(driver)
                 play_video(driver)
                 if not detect_232011(driver):
                     break
@@ -1102,38 +2566,23 @@ def play_episodes_loop(
             WebDriverWait(driver, 10).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
-            ensure_video_context(driver)
+            attach_video_bridge(driver)
             play_video(driver)
 
-        try:
-            const_ser = series
-            const_secs = get_intro_skip_seconds(const_ser)
-            const_secs_end = get_intro_skip_end_seconds(const_ser)
-            driver.execute_script(
-                """
-                const v = document.querySelector('video');
-                const secs = arguments[0];
-                const secsEnd = arguments[1];
-                if (!v || !isFinite(v.duration)) return;
-                if (secsEnd <= secs || secsEnd >= (v.duration - 1)) return;
-                const currentTime = v.currentTime;
-                if (currentTime >= secs && currentTime <= secsEnd) {
-                    v.currentTime = secsEnd;
-                    try { v.play().catch(()=>{}); } catch(_) {}
-                }
-            """,
-                const_secs,
-                const_secs_end,
-            )
-        except Exception:
-            pass
+        # Intro-/End-Skip läuft ab hier im Video-Frame (timeupdate/seeking), kein Python-Polling mehr
+        arm_skip_windows(driver, series, current_season, auto_skip, auto_skip_end)
 
+        # Vollbild braucht echte Klicks im Frame; danach zurück ins Top-Dokument
         if auto_fs and not HEADLESS:
+            # Laut Snapshot klappte Vollbild zuletzt nur ausgeklappt → gleich so versuchen
+            if hint.get("fs") == "popout" and not popped_out and popout_player_iframe(driver):
+                popped_out = True
+                attach_video_bridge(driver)
             _hide_sidebar(driver, True)
-            ensure_video_context(driver)
             time.sleep(0.1)
             ok = ensure_fullscreen_for_episode(driver)
             fullscreen_attempted = True
+            fs_ok = ok
             
             if not ok and os.getenv("BW_POPOUT_IFRAME", "false").lower() in {
                 "1",
@@ -1141,398 +2590,302 @@ def play_episodes_loop(
                 "yes",
             }:
                 if popout_player_iframe(driver):
-                    ensure_video_context(driver)
+                    popped_out = True
+                    attach_video_bridge(driver)
                     _hide_sidebar(driver, True)
-                    ensure_video_context(driver)
                     time.sleep(0.1)
                     ok = ensure_fullscreen_for_episode(driver)
                     fullscreen_attempted = True
+                    fs_ok = ok
+            driver.switch_to.default_content()
 
-        try:
-            for _ in range(8):
-                playing = driver.execute_script(
-                    "const v=document.querySelector('video'); return !!(v && !v.paused && v.readyState>2);"
-                )
-                if playing:
-                    break
-                driver.execute_script(
-                    "const v=document.querySelector('video'); if(v){ try{ v.focus(); v.play().catch(()=>{}); }catch(e){} }"
-                )
-                time.sleep(0.1)
-        except Exception:
-            pass
+        WATCHDOG.beat("episode", driver)
+        for _ in range(8):
+            if video_call(driver, "play", False):
+                break
+            time.sleep(0.1)
 
-        initial_src = ""
-        try:
-            initial_src = (
-                driver.execute_script(
-                    "const v=document.querySelector('video');return v?(v.currentSrc||v.src||''):'';"
-                )
-                or ""
-            )
-        except Exception:
-            pass
+        st = video_call(driver, "state")
+        initial_src = st.get("src", "") if isinstance(st, dict) else ""
+
+        # Snapshot dieser Folge neu anlegen; die Position schreibt danach jeder Fortschritts-Save mit
+        fp = read_player_fingerprint(driver)
+        note_session(
+            reset=True, playing=True, url=fp.get("url") or driver.current_url, series=series, season=current_season,
+            episode=current_episode, provider=current_provider, position=round(float(start_at or 0), 2),
+            hoster=hoster, frame=fp.get("frame"), src=initial_src.split("?")[0][:120] or None,
+            fs=("popout" if popped_out else "direct") if fs_ok else None,
+            tab=fp.get("tab"), scroll=fp.get("scroll", 0),
+        )
+        hint = {}
 
         user_switched = False
-        last_save = time.time()
 
         try:
-            cur_pos = 0
-            try:
-                if ensure_video_context(driver):
-                    cur_pos = int(
-                        driver.execute_script(
-                            "return (document.querySelector('video')?.currentTime||0)"
-                        )
-                        or 0
-                    )
-            except Exception:
-                cur_pos = 0
-
+            cur_pos = int(get_current_position(driver))
             save_progress(series, current_season, current_episode, cur_pos, provider=current_provider)
-
-            driver.switch_to.default_content()
-            html = build_items_html(load_progress(), settings)
-            driver.execute_script(
-                "if (window.__bwSetList){window.__bwSetList(arguments[0]);}",
-                html,
-            )
+            refresh_sidebar(driver)
         except Exception:
             pass
-        finally:
-            try:
-                ensure_video_context(driver)
-            except Exception:
-                pass
             
         auto_nav = False
+        stop = False
+        remaining_time = 99999.0
+        end_skip_secs = get_end_skip_seconds(series) if auto_skip_end else 0
+
+        # Jede Aufgabe mit eigener Kadenz statt alles im 1-Hz-Takt
+        sched = TickScheduler()
+        sched.add("ui", UI_POLL_INTERVAL, priority=0)
+        sched.add("url", URL_CHECK_INTERVAL, priority=1)
+        sched.add("end", lambda: end_check_interval(remaining_time, end_skip_secs, rate), priority=2)
+        sched.add("save", PROGRESS_SAVE_INTERVAL, priority=3)
+        sched.add("src", SOURCE_CHECK_INTERVAL, priority=4)
+        sched.add("health", HEALTH_CHECK_INTERVAL, priority=5)
+
+        # Die Schleife bleibt im Top-Dokument: Sidebar-Signale direkt, Video über die Bridge
+        driver.switch_to.default_content()
+        switches_before = FRAME_SWITCHES["n"]
 
-        while True:
-            flags = poll_ui_flags(driver)
-
-            if flags.get("sel"):
-                safe_save_progress(driver, series, current_season, current_episode, current_provider)
-                cleanup_before_switch(driver)
-                time.sleep(0.5)
-
+        while not stop:
+            WATCHDOG.beat("play", driver)
+            for task in sched.due():
+                started = time.perf_counter()
                 try:
-                    driver.switch_to.default_content()
-                    driver.execute_script(
-                        "document.cookie = 'bw_series=' + encodeURIComponent(arguments[0]) + '; path=/';",
-                        flags["sel"],
-                    )
-                finally:
-                    ensure_video_context(driver)
-
-                user_switched = True
-                clear_nav_lock(driver)
-                break
+                    # --- Sidebar-Signale -------------------------------------------
+                    if task == "ui":
+                        flags = poll_ui_flags(driver)
 
-            try:
-                driver.switch_to.default_content()
-                cur_url = driver.current_url or ""
-                s2, se2, ep2, p2 = parse_episode_info(cur_url)
-
-                if s2 == series and (se2 is not None and ep2 is not None) \
-                and (se2 != current_season or ep2 != current_episode):
-                    # Interne Auto-Navigation (z. B. Next Episode / Redirect)
-                    safe_save_progress(driver, series, current_season, current_episode, current_provider)
-                    current_season, current_episode = se2, ep2
-                    auto_nav = True
-                    break  # raus aus innerer Loop, outer Loop startet mit aktualisiertem Zustand
-
-                elif s2 and s2 != series:
-                    # Wirklicher Serienwechsel (vom User)
-                    safe_save_progress(driver, series, current_season, current_episode, current_provider)
-                    cleanup_before_switch(driver)
-                    time.sleep(0.5)
-                    user_switched = True
-                    break
-            finally:
-                ensure_video_context(driver)
+                        if flags.get("sel"):
+                            safe_save_progress(driver, series, current_season, current_episode, current_provider)
+                            cleanup_before_switch(driver)
+                            time.sleep(0.5)
 
-            try:
-                cur_src = (
-                    driver.execute_script(
-                        "const v=document.querySelector('video');return v?(v.currentSrc||v.src||''):'';"
-                    )
-                    or ""
-                )
-                if initial_src and cur_src and cur_src != initial_src:
-                    try:
-                        WebDriverWait(driver, 10).until(
-                            lambda d: d.execute_script(
-                                "return document.querySelector('video')?.readyState>0;"
+                            driver.execute_script(
+                                "document.cookie = 'bw_series=' + encodeURIComponent(arguments[0]) + '; path=/';",
+                                flags["sel"],
                             )
-                        )
-                    except Exception:
-                        pass
-                    apply_media_settings(driver, rate, vol)
 
-                    try:
-                        if auto_fs:
-                            _hide_sidebar(driver, True)
-                            ensure_video_context(driver)
-                            enable_fullscreen(driver)
-                    except Exception:
-                        pass
-                    initial_src = cur_src
-            except Exception:
-                pass
+                            user_switched = True
+                            clear_nav_lock(driver)
+                            stop = True
+                            break
 
-            # --- LIVE SETTINGS UPDATE ---------------------------------------
-            try:
-                raw = read_localstorage_value(driver, "bw_settings_update")
-                if raw:
-                    upd = json.loads(raw)
-                    # Datei persistieren
-                    save_settings_file(upd)
-
-                    # Lokale Variablen MERGEN
-                    auto_fs = bool(upd.get("autoFullscreen", auto_fs))
-                    auto_skip = bool(upd.get("autoSkipIntro", auto_skip))
-                    auto_skip_end = bool(upd.get("autoSkipEndScreen", auto_skip_end))
-                    auto_next = bool(upd.get("autoNext", auto_next))
-                    rate = float(upd.get("playbackRate", rate))
-                    vol = float(upd.get("volume", vol))
-
-                    # In-memory Settings-Objekt konsistent halten
-                    settings.update(
-                        {
-                            "autoFullscreen": auto_fs,
-                            "autoSkipIntro": auto_skip,
-                            "autoSkipEndScreen": auto_skip_end,
-                            "autoNext": auto_next,
-                            "playbackRate": rate,
-                            "volume": vol,
-                        }
-                    )
+                        if flags.get("catalog"):
+                            answer_catalog_query(driver, flags["catalog"])
 
-                    # Sofort auf das Video anwenden
-                    try:
-                        if ensure_video_context(driver):
-                            apply_media_settings(driver, rate, vol)
-                    finally:
+                        # --- LIVE SETTINGS UPDATE -------------------------------
                         try:
-                            driver.switch_to.default_content()
+                            raw = flags.get("settings")
+                            if raw:
+                                upd = json.loads(raw)
+                                # Datei persistieren
+                                save_settings_file(upd)
+
+                                # Lokale Variablen MERGEN
+                                auto_fs = bool(upd.get("autoFullscreen", auto_fs))
+                                auto_skip = bool(upd.get("autoSkipIntro", auto_skip))
+                                auto_skip_end = bool(upd.get("autoSkipEndScreen", auto_skip_end))
+                                auto_next = bool(upd.get("autoNext", auto_next))
+                                rate = float(upd.get("playbackRate", rate))
+                                vol = float(upd.get("volume", vol))
+                                end_skip_secs = get_end_skip_seconds(series) if auto_skip_end else 0
+
+                                # In-memory Settings-Objekt konsistent halten
+                                settings.update(
+                                    {
+                                        "autoFullscreen": auto_fs,
+                                        "autoSkipIntro": auto_skip,
+                                        "autoSkipEndScreen": auto_skip_end,
+                                        "autoNext": auto_next,
+                                        "playbackRate": rate,
+                                        "volume": vol,
+                                    }
+                                )
+
+                                # Sofort auf das Video anwenden
+                                apply_media_settings(driver, rate, vol)
+                                arm_skip_windows(driver, series, current_season, auto_skip, auto_skip_end)
+
+                                # Fullscreen bei Änderung direkt toggeln (echte Klicks → Frame, danach zurück)
+                                try:
+                                    const_fs = _is_fullscreen(driver)
+                                    if auto_fs and not const_fs and not HEADLESS:
+                                        _hide_sidebar(driver, True)
+                                        time.sleep(0.45)
+                                        enable_fullscreen(driver)
+                                    elif not auto_fs and const_fs:
+                                        exit_fullscreen(driver)
+                                        _hide_sidebar(driver, False)
+                                except Exception:
+                                    pass
+                                finally:
+                                    driver.switch_to.default_content()
+
+                                # LocalStorage mit Datei-Version synchron halten
+                                try:
+                                    driver.execute_script(
+                                        "localStorage.setItem('bw_settings', arguments[0]);",
+                                        json.dumps(load_settings_file()),
+                                    )
+                                except Exception:
+                                    pass
+
+                                # UI sofort aktualisieren, um neue Eingabefelder anzuzeigen/verstecken
+                                refresh_sidebar(driver)
                         except Exception:
                             pass
 
-                    # Fullscreen bei Änderung direkt toggeln
-                    try:
-                        driver.switch_to.default_content()
-                        const_fs = _is_fullscreen(driver)
-                        ensure_video_context(driver)
-                        if auto_fs and not const_fs and not HEADLESS:
-                            _hide_sidebar(driver, True)
-                            ensure_video_context(driver)
-                            time.sleep(0.45)
-                            enable_fullscreen(driver)
-                        elif not auto_fs and const_fs:
-                            exit_fullscreen(driver)
-                            _hide_sidebar(driver, False)
-                    except Exception:
-                        pass
+                        # --- LIVE SERIES SKIP UPDATES ---------------------------
+                        if apply_skip_time_updates(flags):
+                            end_skip_secs = get_end_skip_seconds(series) if auto_skip_end else 0
+                            refresh_sidebar(driver)
+                            arm_skip_windows(driver, series, current_season, auto_skip, auto_skip_end)
+                            sched.trigger("end")
+
+                        if flags.get("quit"):
+                            should_quit = True
+                            stop = True
+                            break
+
+                        if flags.get("del"):
+                            deleted = str(flags["del"])
+                            handle_list_item_deletion(deleted)
+                            refresh_sidebar(driver)
+
+                            if deleted == series:
+                                try:
+                                    cleanup_before_switch(driver)
+                                    time.sleep(0.5)
+
+                                    driver.execute_script(
+                                        """
+                                        try { localStorage.removeItem('bw_series'); } catch(e){}
+                                        document.cookie = 'bw_series=; expires=Thu, 01 Jan 1970 00:00:01 GMT; path=/';
+                                    """
+                                    )
+                                except Exception:
+                                    pass
+
+                                submit_io(record_hoster_sample, hoster, ttff, stalls_seen, hit_232011, fs_ok)
+                                safe_navigate(driver, START_URL)
+                                arm_window_close_guard(driver)
+                                return
+
+                        if flags.get("skip"):
+                            video_call(driver, "skipEnd")
+                            sched.trigger("end")
+                        continue
 
-                    # LocalStorage mit Datei-Version synchron halten
-                    try:
-                        driver.execute_script(
-                            "localStorage.setItem('bw_settings', arguments[0]);",
-                            json.dumps(load_settings_file()),
-                        )
-                    except Exception:
-                        pass
+                    # --- Top-Level-URL ----------------------------------------------
+                    if task == "url":
+                        cur_url = driver.current_url or ""
+                        s2, se2, ep2, p2 = parse_episode_info(cur_url)
+
+                        if s2 == series and (se2 is not None and ep2 is not None) \
+                        and (se2 != current_season or ep2 != current_episode):
+                            # Interne Auto-Navigation (z. B. Next Episode / Redirect)
+                            safe_save_progress(driver, series, current_season, current_episode, current_provider)
+                            current_season, current_episode = se2, ep2
+                            auto_nav = True
+                            stop = True
+                            break  # raus aus innerer Loop, outer Loop startet mit aktualisiertem Zustand
+
+                        elif s2 and s2 != series:
+                            # Wirklicher Serienwechsel (vom User)
+                            safe_save_progress(driver, series, current_season, current_episode, current_provider)
+                            cleanup_before_switch(driver)
+                            time.sleep(0.5)
+                            user_switched = True
+                            stop = True
+                            break
+                        continue
 
-                    # UI sofort aktualisieren, um neue Eingabefelder anzuzeigen/verstecken
-                    try:
-                        html = build_items_html(load_progress(), settings)
-                        driver.execute_script(
-                            "if (window.__bwSetList){window.__bwSetList(arguments[0]);}",
-                            html,
-                        )
-                    except Exception:
-                        pass
-                ensure_video_context(driver)
-            except Exception:
-                pass
-            # ----------------------------------------------------------------
+                    # --- Video-Aufgaben über die Bridge --------------------------
+                    if task == "end":
+                        tick = read_video_tick(driver)
+                        if tick is None:
+                            # Frame neu geladen/ersetzt: Bridge neu anbinden (einziger Frame-Wechsel im Takt)
+                            if not attach_video_bridge(driver):
+                                stop = True
+                                break
+                            arm_skip_windows(driver, series, current_season, auto_skip, auto_skip_end)
+                            sched.trigger("end")
+                            continue
+                        remaining_time = float(tick.get("remaining", 99999))
+                        for ev in tick.get("events") or []:
+                            logging.info(f"In-page {ev.get('type')} skip: {ev.get('from')}s → {ev.get('to')}s")
+                            if ev.get("type") == "end":
+                                end_skip_applied = True
+
+                        # End-Screen wurde im Frame übersprungen: kurz warten, dann zur nächsten Episode
+                        if end_skip_applied:
+                            time.sleep(0.5)
+                            stop = True
+                            break
+
+                        if remaining_time <= 3:
+                            stop = True
+                            break
+
+                    elif task == "save":
+                        current_pos = get_current_position(driver)
+                        submit_io(save_progress, series, current_season, current_episode, current_pos, provider=current_provider)
+                        stalls_seen = max(stalls_seen, read_playback_stalls(driver))
+
+                    elif task == "src":
+                        st = video_call(driver, "state")
+                        cur_src = st.get("src", "") if isinstance(st, dict) else ""
+                        if initial_src and cur_src and cur_src != initial_src:
+                            wait_for_video_ready(driver, timeout=10)
+                            apply_media_settings(driver, rate, vol)
+                            arm_skip_windows(driver, series, current_season, auto_skip, auto_skip_end)
+
+                            try:
+                                if auto_fs:
+                                    _hide_sidebar(driver, True)
+                                    enable_fullscreen(driver)
+                            except Exception:
+                                pass
+                            finally:
+                                driver.switch_to.default_content()
+                            initial_src = cur_src
+                            sched.trigger("end")
+
+                    elif task == "health":
+                        reap_windows(driver)
+                        submit_io(sample_memory, driver)
+                        # Seltene Checks: Fullscreen-Nachversuch bzw. Sidebar noch vorhanden?
+                        if auto_fs and not HEADLESS and not fullscreen_attempted:
+                            try:
+                                fs_ok = ensure_fullscreen_for_episode(driver)
+                                fullscreen_attempted = True
+                            except Exception:
+                                pass
+                            finally:
+                                driver.switch_to.default_content()
+                        elif not _is_fullscreen(driver):
+                            try:
+                                if not driver.execute_script("return !!document.getElementById('bingeSidebar');"):
+                                    inject_sidebar(driver, load_progress())
+                            except Exception:
+                                pass
+                finally:
+                    sched.done(task, started)
 
-            # --- LIVE SERIES SKIP UPDATES ----------------------------------
-            try:
-                skip_settings_changed = False
-                upd = read_localstorage_value(driver, "bw_intro_start_update")
-                if upd:
-                    data = json.loads(upd)
-                    ser_raw = data.get("series", "")
-                    secs_raw = data.get("seconds", 0)
-                    ser = norm_series_key(ser_raw)
-                    try:
-                        secs = max(0, int(float(secs_raw)))
-                    except Exception:
-                        secs = 0
+            if not stop:
+                DRIVER_ACTOR.serve(driver, sched.sleep_time())
 
-                    if ser:
-                        current_end = get_intro_skip_end_seconds(ser)
-                        if set_intro_skip_seconds(ser, secs, current_end):
-                            skip_settings_changed = True
-            except Exception:
-                pass
+        stats = sched.stats()
+        merge_tick_stats(stats)
+        ticks = sum(int(st["runs"]) for st in stats.values())
+        switches = FRAME_SWITCHES["n"] - switches_before
+        logging.info(
+            f"Tick stats S{current_season}E{current_episode}: {format_tick_stats(stats)}"
+            f" | frame switches {switches} in {ticks} ticks ({switches / max(ticks, 1):.2f}/tick)"
+            f" | hooks {format_hook_counts(hook_counts(driver))}"
+        )
 
-            try:
-                upd = read_localstorage_value(driver, "bw_intro_end_update")
-                if upd:
-                    data = json.loads(upd)
-                    ser_raw = data.get("series", "")
-                    secs_raw = data.get("seconds", 0)
-                    ser = norm_series_key(ser_raw)
-                    try:
-                        secs = max(0, int(float(secs_raw)))
-                    except Exception:
-                        secs = 0
-
-                    if ser:
-                        current_start = get_intro_skip_seconds(ser)
-                        if set_intro_skip_seconds(ser, current_start, secs):
-                            skip_settings_changed = True
-            except Exception:
-                pass
-
-            try:
-                upd = read_localstorage_value(driver, "bw_end_update")
-                if upd:
-                    data = json.loads(upd)
-                    ser_raw = data.get("series", "")
-                    secs_raw = data.get("seconds", 0)
-                    ser = norm_series_key(ser_raw)
-                    try:
-                        secs = max(0, int(float(secs_raw)))
-                    except Exception:
-                        secs = 0
-
-                    if ser:
-                        if set_end_skip_seconds(ser, secs):
-                            skip_settings_changed = True
-            except Exception:
-                pass
-            if skip_settings_changed:
-                try:
-                    html = build_items_html(load_progress(), settings)
-                    driver.execute_script(
-                        "if (window.__bwSetList){window.__bwSetList(arguments[0]);}",
-                        html,
-                    )
-                except Exception:
-                    pass
-            # ----------------------------------------------------------------
-
-            if flags.get("quit"):
-                should_quit = True
-                break
-
-            if flags.get("del"):
-                deleted = str(flags["del"])
-                handle_list_item_deletion(deleted)
-                try:
-                    driver.switch_to.default_content()
-                    settings = get_settings(driver)
-                    html = build_items_html(load_progress(), settings)
-                    driver.execute_script(
-                        "if (window.__bwSetList){window.__bwSetList(arguments[0]);}",
-                        html,
-                    )
-                finally:
-                    ensure_video_context(driver)
-
-                if deleted == series:
-                    try:
-                        cleanup_before_switch(driver)
-                        time.sleep(0.5)
-                        driver.switch_to.default_content()
-
-                        driver.execute_script(
-                            """
-                            try { localStorage.removeItem('bw_series'); } catch(e){}
-                            document.cookie = 'bw_series=; expires=Thu, 01 Jan 1970 00:00:01 GMT; path=/';
-                        """
-                        )
-                    except Exception:
-                        pass
-
-                    safe_navigate(driver, START_URL)
-                    arm_window_close_guard(driver)
-                    return
-
-            if not ensure_video_context(driver):
-                time.sleep(0.2)
-                if not ensure_video_context(driver):
-                    break
-
-            if flags.get("skip"):
-                try:
-                    driver.execute_script(
-                        """
-                        const v = document.querySelector('video');
-                        if (v && isFinite(v.duration) && v.duration > 1) {
-                            v.currentTime = Math.max(0, v.duration - 1);
-                            try { v.muted = true; v.play(); } catch(_){}
-                        }
-                    """
-                    )
-                except Exception:
-                    pass
-
-            if not ensure_video_context(driver):
-                time.sleep(0.2)
-                continue
-
-            remaining_time = driver.execute_script(
-                """
-                const v = document.querySelector('video');
-                if (!v || !isFinite(v.duration)) return 99999;
-                return v.duration - v.currentTime;
-            """
-            )
-
-            now = time.time()
-            if now - last_save >= PROGRESS_SAVE_INTERVAL:
-                current_pos = get_current_position(driver)
-                save_progress(series, current_season, current_episode, int(current_pos), provider=current_provider)
-                last_save = now
-
-            # End-Screen-Skip Logik
-            if auto_skip_end and not end_skip_applied:
-                end_skip_seconds = get_end_skip_seconds(series)
-                if end_skip_seconds > 0 and remaining_time <= end_skip_seconds:
-                    try:
-                        driver.execute_script(
-                            """
-                            const v = document.querySelector('video');
-                            if (v && isFinite(v.duration)) {
-                                const skipTo = Math.max(0, v.duration - 1);
-                                v.currentTime = skipTo;
-                                try { v.play().catch(()=>{}); } catch(_) {}
-                            }
-                        """,
-                            end_skip_seconds,
-                        )
-                        end_skip_applied = True
-                    except Exception:
-                        pass
-                    # Wenn wir das Ende überspringen, warten wir kurz und brechen dann ab
-                    time.sleep(0.5)
-                    break
-            
-            if remaining_time <= 3:
-                break
-
-            if auto_fs and not HEADLESS and not fullscreen_attempted:
-                try:
-                    ensure_fullscreen_for_episode(driver)
-                    fullscreen_attempted = True
-                except Exception:
-                    pass
-
-            time.sleep(1.0)
+        submit_io(record_hoster_sample, hoster, ttff, stalls_seen, hit_232011, fs_ok)
 
         if auto_nav:
             position = get_intro_skip_seconds(series) if auto_skip else 0
@@ -1691,10 +3044,8 @@ def _mark_probable_fs_button(driver):
 
 def _gesture_fullscreen_in_frame(driver) -> bool:
     try:
-        driver.execute_script("""
+        driver.execute_script(HOOKS_JS + """
             const v = document.querySelector('video'); if(!v) return false;
-            if (window.__bw_fs_armed) return true;
-            window.__bw_fs_armed = true;
             const tryFS = ()=>{
                 let el=v;
                 for(let i=0;i<4 && el && el.parentElement; i++) el = el.parentElement;
@@ -1702,8 +3053,8 @@ def _gesture_fullscreen_in_frame(driver) -> bool:
                 const p = (tgt.requestFullscreen?.() || tgt.webkitRequestFullscreen?.() || tgt.mozRequestFullScreen?.());
                 if (p && p.catch) p.catch(()=>{});
             };
-            const once = (ev)=>{ document.removeEventListener('click', once, true); tryFS(); setTimeout(()=>{window.__bw_fs_armed=false;},0); };
-            document.addEventListener('click', once, true);
+            // ein scharfer Klick-Handler pro Frame; erneutes Scharfmachen ersetzt ihn (neues Video)
+            window.__bwHooks.on('fs:gesture', document, 'click', () => tryFS(), { capture: true, once: true });
             return true;
         """)
         v = driver.find_element(By.TAG_NAME, "video")
@@ -1728,17 +3079,12 @@ def _gesture_fullscreen_on_iframe_from_top(driver) -> bool:
         iframe = driver.find_element(By.ID, iframe_id)
         _arm_iframe_for_fullscreen(driver, iframe)
 
-        driver.execute_script("""
+        driver.execute_script(HOOKS_JS + """
             const f = arguments[0];
-            if (!window.__bw_fs_top_armed){
-                window.__bw_fs_top_armed = true;
-                const handler = ()=>{ document.removeEventListener('click', handler, true);
-                    const p = (f.requestFullscreen?.()|| f.webkitRequestFullscreen?.()|| f.mozRequestFullScreen?.());
-                    if (p && p.catch) p.catch(()=>{});
-                    setTimeout(()=>{ window.__bw_fs_top_armed = false; }, 0);
-                };
-                document.addEventListener('click', handler, true);
-            }
+            window.__bwHooks.on('fs:iframe-gesture', document, 'click', () => {
+                const p = (f.requestFullscreen?.()|| f.webkitRequestFullscreen?.()|| f.mozRequestFullScreen?.());
+                if (p && p.catch) p.catch(()=>{});
+            }, { capture: true, once: true });
         """, iframe)
         ActionChains(driver).move_to_element(iframe).click().perform()
         time.sleep(0.25)
@@ -1752,6 +3098,7 @@ def _gesture_fullscreen_on_iframe_from_top(driver) -> bool:
 
 
 def _hide_sidebar(driver, hide: bool):
+    """Blendet die Sidebar im Top-Dokument aus/ein und bleibt dort (Video-Befehle laufen über die Bridge)."""
     try:
         driver.switch_to.default_content()
         if hide:
@@ -1768,11 +3115,8 @@ def _hide_sidebar(driver, hide: bool):
                 if (s){ s.style.display = s.dataset._prevDisplay || ''; delete s.dataset._prevDisplay; }
             """
             )
-    finally:
-        try:
-            ensure_video_context(driver)
-        except:
-            pass
+    except Exception:
+        pass
 
 
 def _arm_iframe_for_fullscreen(driver, iframe_el):
@@ -1816,33 +3160,19 @@ def switch_to_video_frame(driver):
 
 
 def play_video(driver):
-    """Start robust: Overlays klicken, Video fokusieren, play() als Fallback."""
+    """Start robust: play() über die Bridge, erst wenn das nicht greift Overlays/Video im Frame klicken.
+    Endet im Top-Dokument."""
     try:
-        # Wir sind im iframe (ensure_video_context vorher!)
-        driver.execute_script(
-            "const v=document.querySelector('video'); if(v){ v.muted=true; }"
-        )
-
-        # 1) Schneller: Direkt play() versuchen (häufig erfolgreich)
-        try:
-            driver.execute_script(
-                """
-                const v=document.querySelector('video');
-                if (v && v.paused) { 
-                    try{ 
-                        v.play().catch(()=>{}); 
-                        return true;
-                    }catch(e){ 
-                        return false; 
-                    } 
-                }
-                return true;
-            """
-            )
-        except Exception:
-            pass
+        # 1) Schneller: stumm direkt play() versuchen (häufig erfolgreich, ohne Frame-Wechsel)
+        video_call(driver, "play", True)
+        time.sleep(0.1)
+        st = video_call(driver, "state")
+        if isinstance(st, dict) and not st.get("paused", True):
+            return
 
-        # 2) Falls nötig: Overlay-Buttons klicken (reduzierte Pausen)
+        # 2) Falls nötig: Overlay-Buttons klicken (reduzierte Pausen) – braucht den Frame
+        if not ensure_video_context(driver):
+            return
         overlay_selectors = [
             ".vjs-big-play-button",
             ".jw-display-icon-container",
@@ -1873,26 +3203,19 @@ def play_video(driver):
             pass
 
         # 4) Finaler play() Aufruf
-        driver.execute_script(
-            """
-            const v=document.querySelector('video');
-            if (v && v.paused) { try{ v.play().catch(()=>{}); }catch(e){} }
-        """
-        )
+        driver.switch_to.default_content()
+        video_call(driver, "play", False)
     except Exception as e:
         print(f"[!] Could not start video: {e}")
+    finally:
+        try:
+            driver.switch_to.default_content()
+        except Exception:
+            pass
 
 
 def pause_video(driver):
-    try:
-        driver.execute_script(
-            """
-            const v=document.querySelector('video');
-            if (v) { try{ v.pause(); }catch(e){} }
-        """
-        )
-    except Exception:
-        pass
+    video_call(driver, "pause")
 
 
 def ensure_fullscreen_for_episode(driver: webdriver.Firefox) -> bool:
@@ -2043,25 +3366,22 @@ def enable_fullscreen(driver: webdriver.Firefox) -> bool:
         try:
             # Video fokussieren
             driver.execute_script(
-                """
+                HOOKS_JS + """
                 const v = document.querySelector('video');
                 if (v) {
                     v.tabIndex = 0;
                     v.focus();
-                    // Event-Listener für 'f' hinzufügen
-                    if (!v.__bw_fs_listener) {
-                        v.__bw_fs_listener = true;
-                        document.addEventListener('keydown', (e) => {
-                            if (e.key === 'f' || e.key === 'F') {
-                                e.preventDefault();
-                                const target = v.parentElement || v;
-                                const p = (target.requestFullscreen?.() || 
-                                          target.webkitRequestFullscreen?.() || 
-                                          target.mozRequestFullScreen?.());
-                                if (p && p.catch) p.catch(() => {});
-                            }
-                        }, { passive: false });
-                    }
+                    // Event-Listener für 'f' (ersetzt den vom letzten Aufruf, statt einen weiteren anzuhängen)
+                    window.__bwHooks.on('fs:key', document, 'keydown', (e) => {
+                        if (e.key === 'f' || e.key === 'F') {
+                            e.preventDefault();
+                            const target = v.parentElement || v;
+                            const p = (target.requestFullscreen?.() || 
+                                      target.webkitRequestFullscreen?.() || 
+                                      target.mozRequestFullScreen?.());
+                            if (p && p.catch) p.catch(() => {});
+                        }
+                    }, { passive: false });
                 }
             """
             )
@@ -2245,77 +3565,57 @@ def enable_fullscreen(driver: webdriver.Firefox) -> bool:
 
 def apply_media_settings(driver, rate, vol):
     """Setzt playbackRate/Volume/Unmute sofort und hält sie kurzzeitig stabil (Events/Interval)."""
-    try:
-        driver.execute_script(
-            """
-            const rate = arguments[0], vol = arguments[1];
-            const v = document.querySelector('video');
-            if (!v) return;
-
-            const setit = () => {
-              try {
-                // manche Player setzen 'muted' als Attribut → komplett entfernen
-                v.removeAttribute('muted');
-                v.defaultMuted = false;
-                v.muted = (vol === 0);
-                if (v.volume !== vol) v.volume = vol;
-                if (v.playbackRate !== rate) v.playbackRate = rate;
-              } catch(_) {}
-            };
+    video_call(driver, "media", float(rate), float(vol))
 
-            setit();
 
-            // für einige Sekunden „gegenhalten", falls src/MSE/Player neu setzt
-            if (!v.__bwPin){
-            v.__bwPin = true;
-            const evs = ['loadedmetadata','canplay','playing','ratechange','volumechange','stalled'];
-            evs.forEach(e => v.addEventListener(e, setit, {passive:true}));
+def skip_intro(driver, seconds):
+    wait_for_video_ready(driver)
+    video_call(driver, "seek", seconds)
 
-            const cleanup = () => {
-                try { evs.forEach(e => v.removeEventListener(e, setit)); } catch(_){}
-                v.__bwPin = false;
-            };
 
-            let n = 0;
-            const iv = setInterval(()=>{ setit(); if (++n > 20) { clearInterval(iv); cleanup(); } }, 150);
-            setTimeout(()=>{ try{ clearInterval(iv); cleanup(); }catch(_){} }, 4000);
-            }
-        """,
-            rate,
-            vol,
-        )
-    except Exception:
-        pass
+def wait_for_video_ready(driver, timeout: float = 15) -> bool:
+    """Wartet über die Bridge, bis das Video Metadaten hat (readyState > 0)."""
+    end = time.time() + timeout
+    while time.time() < end:
+        st = video_call(driver, "state")
+        if isinstance(st, dict) and st.get("ready", 0) > 0:
+            return True
+        time.sleep(0.2)
+    return False
 
 
-def skip_intro(driver, seconds):
-    WebDriverWait(driver, 15).until(
-        lambda d: d.execute_script(
-            "return document.querySelector('video')?.readyState > 0;"
-        )
-    )
-    driver.execute_script(f"document.querySelector('video').currentTime = {seconds};")
+def get_current_position(driver):
+    return video_call(driver, "pos", default=0) or 0
 
 
-def get_current_position(driver):
-    return driver.execute_script(
-        "return document.querySelector('video').currentTime || 0;"
-    )
+JW_232011_JS = """
+const el = document.querySelector('.jw-error-msg,.jw-error-text,[class*="jw-error"]');
+return ((el && (el.textContent || '').toLowerCase()) || '').includes('232011');
+"""
 
 
 def detect_232011(driver) -> bool:
+    """JW-Fehler 232011 über die Bridge; antwortet sie nicht (Fehlerseite ohne <video> hat sich nie gemeldet),
+    direkt im Top-Dokument und in den Player-iframes nachsehen. Endet im Top-Dokument."""
+    hit = video_call(driver, "jwError")
+    if hit is not None:
+        return bool(hit)
     try:
-        return bool(
-            driver.execute_script(
-                """
-            const el = document.querySelector('.jw-error-msg,.jw-error-text,[class*="jw-error"]');
-            const txt = (el && (el.textContent||'').toLowerCase()) || '';
-            return txt.includes('232011');
-        """
-            )
-        )
+        driver.switch_to.default_content()
+        if driver.execute_script(JW_232011_JS):
+            return True
+        for frame in driver.find_elements(By.TAG_NAME, "iframe"):
+            try:
+                driver.switch_to.frame(frame)
+                if driver.execute_script(JW_232011_JS):
+                    return True
+            except Exception:
+                continue
+            finally:
+                driver.switch_to.default_content()
     except Exception:
-        return False
+        pass
+    return False
 
 
 def _is_fullscreen(driver) -> bool:
@@ -2344,21 +3644,295 @@ def _is_fullscreen(driver) -> bool:
 
 
 # === COOKIE FUNCTIONS --------------------------- ===
-def delete_cookie(driver: webdriver.Firefox, name: str) -> bool:
+def read_main_signals(driver: webdriver.Firefox) -> Dict[str, Any]:
+    """Liest alle bw_*-Signale der Sidebar (Cookies + localStorage) in EINEM Round-Trip und räumt
+    verbrauchte Keys/Cookies im selben Aufruf auf."""
+    driver.switch_to.default_content()
+    data = driver.execute_script(
+        """
+        const out = {};
+        const take = k => { try { const v = localStorage.getItem(k); if (v !== null) localStorage.removeItem(k); return v; } catch(_) { return null; } };
+        const peek = k => { try { return localStorage.getItem(k); } catch(_) { return null; } };
+        const expire = k => { document.cookie = k + '=; expires=Thu, 01 Jan 1970 00:00:01 GMT; path=/'; };
+        const cookies = {};
+        (document.cookie || '').split(';').forEach(p => {
+          const i = p.indexOf('=');
+          const k = (i < 0 ? p : p.slice(0, i)).trim();
+          if (k.startsWith('bw_')) cookies[k] = i < 0 ? '' : p.slice(i + 1).trim();
+        });
+
+        const sb = document.getElementById('bingeSidebar');
+        out.sidebar = !!sb;
+        out.rev = sb ? (sb.dataset.rev || '') : '';
+        out.quit = take('bw_quit') === '1' || cookies.bw_quit === '1';
+        if ('bw_quit' in cookies) expire('bw_quit');
+        out.del = take('bw_seriesToDelete');
+        out.ui_update = take('bw_ui_update_needed');
+        out.settings = take('bw_settings_update');
+        out.intro_start = take('bw_intro_start_update');
+        out.intro_end = take('bw_intro_end_update');
+        out.end = take('bw_end_update');
+        out.catalog = take('bw_catalog_query');
+
+        // Auswahl: Cookie bevorzugt, localStorage als Fallback – beides direkt aufräumen
+        out.sel = cookies.bw_series || peek('bw_series');
+        out.sel_provider = cookies.bw_series_provider || peek('bw_series_provider');
+        if (out.sel) {
+          expire('bw_series'); expire('bw_series_provider');
+          try { localStorage.removeItem('bw_series'); localStorage.removeItem('bw_series_provider'); } catch(_) {}
+        }
+        out.website = peek('bw_website_switch') || 's.to';
+        return out;
+    """
+    )
+    return data if isinstance(data, dict) else {}
+
+
+# === CATALOG SEARCH --------------------------- ===
+# Lokaler Katalog aller Serien je Provider (aus den Index-Seiten), kompakt als [slug, name, alt] gespeichert.
+# Der Trigramm-Index wird beim Laden im Speicher aufgebaut (billig, hält catalog.json klein).
+_CATALOG: Dict[str, Any] = {}
+_CATALOG_ATTEMPTS: Dict[str, float] = {}
+_CATALOG_LINK_RE = re.compile(r"<a\b([^>]*)>(.*?)</a>", re.S | re.I)
+_ATTR_RE = re.compile(r'([\w-]+)\s*=\s*"([^"]*)"')
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def fold_text(s: str) -> str:
+    """Suchnormalisierung: klein, ohne Akzente, Bindestriche/Satzzeichen → Leerzeichen."""
+    s = unicodedata.normalize("NFKD", str(s or ""))
+    s = "".join(ch for ch in s if not unicodedata.combining(ch)).lower()
+    return " ".join(re.sub(r"[^\w]+|_", " ", s).split())
+
+
+def _trigrams(folded: str) -> set:
+    if len(folded) < 3:
+        return {folded} if folded else set()
+    return {folded[i:i + 3] for i in range(len(folded) - 2)}
+
+
+def parse_catalog_html(page: str, provider: str) -> list:
+    """Extrahiert [slug, name, alt] aus einer Serien-Index-Seite (z. B. s.to/serien, aniworld.to/animes)."""
+    info = STREAMING_PROVIDERS.get(provider) or {}
+    link_re = re.compile(info.get("catalog_link", r"/(?:serie|anime)/stream/([^/\"?#]+)/?$"))
+    seen, out = set(), []
+    for attrs_raw, inner in _CATALOG_LINK_RE.findall(page or ""):
+        attrs = dict(_ATTR_RE.findall(attrs_raw))
+        href = _html.unescape(attrs.get("href", ""))
+        m = link_re.search(href)
+        if not m:
+            continue
+        slug = m.group(1)
+        name = " ".join(_html.unescape(_TAG_RE.sub(" ", inner)).split())
+        if not name or slug in seen:
+            continue
+        seen.add(slug)
+        alt = " ".join(_html.unescape(attrs.get("data-alternative-title", "")).split())
+        out.append([slug, name, alt] if alt else [slug, name])
+    return out
+
+
+class CatalogIndex:
+    """Trigramm-Index über alle Katalog-Einträge (Name, Alternativtitel, Slug) aller Provider."""
+
+    def __init__(self, catalog: Dict[str, Any]) -> None:
+        self.entries: list = []  # (provider, slug, name, folded_name, folded_alt)
+        self.postings: Dict[str, list] = {}
+        for provider, data in catalog.items():
+            for item in (data or {}).get("series", []):
+                try:
+                    slug, name = str(item[0]), str(item[1])
+                    alt = str(item[2]) if len(item) > 2 else ""
+                except Exception:
+                    continue
+                idx = len(self.entries)
+                fname = fold_text(name)
+                falt = fold_text(f"{alt} {slug}")
+                self.entries.append((provider, slug, name, fname, falt))
+                for g in _trigrams(fname) | _trigrams(falt):
+                    self.postings.setdefault(g, []).append(idx)
+
+    @staticmethod
+    def _score(text: str, tokens: list) -> float:
+        score = 0.0
+        for tok, tris in tokens:
+            i = text.find(tok)
+            if i == 0:
+                sc = 3.0
+            elif i > 0:
+                sc = 2.0 if text[i - 1] == " " else 1.5
+            elif len(tok) >= 3:
+                sc = len(tris & _trigrams(text)) / len(tris)
+                sc = sc if sc >= 0.5 else 0.0
+            else:
+                sc = 0.0
+            if not sc:
+                return 0.0
+            score += sc
+        return score
+
+    def search(self, query: str, limit: int = 8) -> list:
+        q = fold_text(query)
+        if len(q) < 2:
+            return []
+        tokens = [(t, _trigrams(t)) for t in q.split()]
+        longest = max(tokens, key=lambda t: len(t[0]))
+        if len(longest[0]) >= 3:
+            cand: set = set()
+            for g in longest[1]:
+                cand.update(self.postings.get(g, ()))
+        else:
+            cand = set(range(len(self.entries)))
+        scored = []
+        for idx in cand:
+            provider, slug, name, fname, falt = self.entries[idx]
+            sc = max(self._score(fname, tokens), 0.9 * self._score(falt, tokens))
+            if sc:
+                scored.append((-sc, len(name), name, idx))
+        scored.sort()
+        return [
+            {"provider": self.entries[i][0], "slug": self.entries[i][1], "name": self.entries[i][2]}
+            for _, _, _, i in scored[:limit]
+        ]
+
+
+def load_catalog() -> Dict[str, Any]:
+    """catalog.json (gecacht, inkl. Index)."""
+    if _CATALOG.get("data") is None:
+        data: Dict[str, Any] = {}
+        try:
+            if os.path.exists(CATALOG_FILE):
+                with open(CATALOG_FILE, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+                    if isinstance(raw, dict):
+                        data = raw
+        except Exception as e:
+            logging.debug(f"Catalog could not be loaded: {e}")
+        _CATALOG["data"] = data
+        _CATALOG["index"] = None
+    return _CATALOG["data"]
+
+
+def save_catalog(provider: str, series: list) -> bool:
     try:
-        driver.delete_cookie(name)
+        data = dict(load_catalog())
+        data[provider] = {"fetched": time.time(), "series": series}
+        with open(CATALOG_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        _CATALOG["data"] = data
+        _CATALOG["index"] = None
         return True
-    except Exception:
+    except Exception as e:
+        logging.warning(f"Catalog could not be saved: {e}")
         return False
 
 
-def get_cookie(driver, name):
-    for c in driver.get_cookies():
-        if c["name"] == name:
-            return c["value"]
+def catalog_search(query: str, limit: int = CATALOG_RESULTS) -> list:
+    load_catalog()
+    index = _CATALOG.get("index")  # einmal lesen: der Katalog-Thread kann es jederzeit ersetzen
+    if index is None:
+        index = _CATALOG["index"] = CatalogIndex(_CATALOG["data"])
+    return index.search(query, limit)
+
+
+# fetch() läuft in der Seite weiter, der Katalog-Thread fragt nur kurz über den Driver-Actor nach
+CATALOG_FETCH_JS = """
+const [url, ms] = arguments;
+const jobs = window.__bwFetches = window.__bwFetches || {};
+if (jobs[url]) return true;
+const job = jobs[url] = { done: false, text: null };
+const ctl = new AbortController();
+const tm = setTimeout(() => ctl.abort(), ms);
+fetch(url, { credentials: 'include', signal: ctl.signal })
+  .then(r => r.ok ? r.text() : null)
+  .catch(() => null)
+  .then(t => { clearTimeout(tm); job.text = t; job.done = true; });
+return true;
+"""
+CATALOG_POLL_JS = """
+const jobs = window.__bwFetches || {};
+const job = jobs[arguments[0]];
+if (!job) return { gone: true };
+if (!job.done) return { done: false };
+delete jobs[arguments[0]];
+return { done: true, text: job.text };
+"""
+_CATALOG_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bw-catalog")
+_CATALOG_JOB: Dict[str, Any] = {"future": None}
+
+
+def fetch_catalog_in_background(url: str, timeout: float = 25.0) -> Optional[str]:
+    """Lädt die Index-Seite per fetch() aus dem aktuellen Dokument (gleicher Origin → Browser-Proxy/Cookies).
+    Start und Abfragen sind kurze Driver-Aufträge, die Hauptschleife blockiert nicht für den ganzen Download."""
+    try:
+        DRIVER_ACTOR.call(lambda d: d.execute_script(CATALOG_FETCH_JS, url, int(timeout * 1000)), priority=8)
+        end = time.time() + timeout + 5
+        while time.time() < end and not should_quit:
+            time.sleep(1.0)
+            res = DRIVER_ACTOR.call(lambda d: d.execute_script(CATALOG_POLL_JS, url), priority=8, key=("catalog", url))
+            if not isinstance(res, dict) or res.get("gone"):
+                return None  # weg navigiert → Dokument samt fetch() verworfen
+            if res.get("done"):
+                return res.get("text")
+    except Exception as e:
+        logging.debug(f"Catalog fetch failed: {e}")
     return None
 
 
+def refresh_catalog(provider: str, url: str) -> bool:
+    """Läuft im Katalog-Thread: Seite holen, parsen, speichern und den Suchindex vorbauen."""
+    page = fetch_catalog_in_background(url)
+    series = parse_catalog_html(page or "", provider)
+    if not series:
+        logging.info(f"Catalog {provider} could not be refreshed")
+        return False
+    if save_catalog(provider, series):
+        _CATALOG["index"] = CatalogIndex(_CATALOG["data"])
+    logging.info(f"Catalog {provider}: {len(series)} series")
+    return True
+
+
+def schedule_catalog_refresh(current_url: str) -> bool:
+    """Hintergrund-Refresh: höchstens ein veralteter Provider-Katalog gleichzeitig, und nur wenn die aktuelle
+    Seite zum Provider gehört (fetch bleibt same-origin). True, solange ein Refresh läuft."""
+    fut = _CATALOG_JOB["future"]
+    if fut is not None and not fut.done():
+        return True
+    catalog = load_catalog()
+    now = time.time()
+    for provider, info in STREAMING_PROVIDERS.items():
+        url = info.get("catalog_url")
+        if not url or not current_url.startswith(info["base_url"]):
+            continue
+        fetched = float((catalog.get(provider) or {}).get("fetched", 0))
+        if now - fetched < CATALOG_MAX_AGE or now - _CATALOG_ATTEMPTS.get(provider, 0) < 3600:
+            continue
+        _CATALOG_ATTEMPTS[provider] = now
+        _CATALOG_JOB["future"] = _CATALOG_POOL.submit(refresh_catalog, provider, url)
+        return True
+    return False
+
+
+def answer_catalog_query(driver: webdriver.Firefox, raw: str) -> None:
+    """Beantwortet eine Autocomplete-Anfrage der Sidebar (bw_catalog_query)."""
+    try:
+        q = str(json.loads(raw).get("q") or "")
+    except Exception:
+        q = str(raw or "")
+    try:
+        results = catalog_search(q)
+        for r in results:
+            r["label"] = (STREAMING_PROVIDERS.get(r["provider"]) or {}).get("name", r["provider"])
+        driver.switch_to.default_content()
+        driver.execute_script(
+            sidebar_js("__bwSb('__bwCatalogResults', arguments[0], arguments[1]);"),
+            q,
+            json.dumps(results),
+        )
+    except Exception as e:
+        logging.debug(f"Catalog query failed: {e}")
+
+
 # === SIDEBAR FUNCTIONS --------------------------- ===
 def read_settings(driver: webdriver.Firefox) -> Dict[str, Any]:
     try:
@@ -2378,33 +3952,9 @@ def read_settings(driver: webdriver.Firefox) -> Dict[str, Any]:
         return {}
 
 
-def build_items_html(db: Dict[str, Dict[str, Any]], settings: Optional[Dict[str, Any]] = None) -> str:
-    """Erstellt HTML für die Sidebar mit Streaming-Anbieter-Tabs."""
-    if settings is None:
-        settings = {}
-    auto_skip_intro = settings.get("autoSkipIntro", True)
-    auto_skip_end = settings.get("autoSkipEndScreen", False)
-    
-    # Gruppiere Serien nach Anbietern
-    provider_series = {}
-    for series_name, data in db.items():
-        provider = data.get("provider", "s.to")  # Standard ist s.to für Backward-Kompatibilität
-        if provider not in provider_series:
-            provider_series[provider] = []
-        provider_series[provider].append((series_name, data))
-    
-    # Erstelle Tabs für jeden Anbieter
-    tabs_html = []
-    content_html = []
-    
-    for provider_id, series_list in provider_series.items():
-        provider_info = STREAMING_PROVIDERS.get(provider_id, STREAMING_PROVIDERS["s.to"])
-        
-        # Sortiere Serien nach Timestamp
-        sorted_series = sorted(series_list, key=lambda kv: float(kv[1].get("timestamp", 0)), reverse=True)
-        
-        # Tab-Header
-        tabs_html.append(f'''
+def _render_provider_tab(provider_id: str) -> str:
+    provider_info = STREAMING_PROVIDERS.get(provider_id, STREAMING_PROVIDERS["s.to"])
+    return f'''
             <button class="bw-provider-tab" data-provider="{provider_id}" 
                     style="flex:1;padding:8px 12px;background:rgba(255,255,255,.05);border:1px solid rgba(255,255,255,.1);
                            color:#94a3b8;border-radius:8px 8px 0 0;cursor:pointer;font-size:12px;font-weight:500;
@@ -2414,90 +3964,219 @@ def build_items_html(db: Dict[str, Dict[str, Any]], settings: Optional[Dict[str,
                     {provider_info['name']}
                 </div>
             </button>
-        ''')
-        
-        # Tab-Inhalt
-        series_items = []
-        for series_name, data in sorted_series:
-            season = int(data.get("season", 1))
-            episode = int(data.get("episode", 1))
-            position = int(data.get("position", 0))
-            ts_val = float(data.get("timestamp", 0))
-            intro_val = int(data.get("intro_skip_start", INTRO_SKIP_SECONDS))
-            intro_end_val = int(data.get("intro_skip_end", INTRO_SKIP_SECONDS + 60))
-            end_skip_val = int(data.get("end_skip", 0))
-            safe_name = _html.escape(series_name, quote=True)
-
-            series_items.append(f"""
-                <div class="bw-series-item" data-series="{safe_name}" data-season="{season}" data-episode="{episode}" data-ts="{ts_val}" data-provider="{provider_id}"
-                     data-intro-start="{intro_val}" data-intro-end="{intro_end_val}" data-end-skip="{end_skip_val}"
-                     style="margin:8px;padding:16px;background:linear-gradient(135deg,rgba(255,255,255,.05),rgba(255,255,255,.02));
-                            border:1px solid rgba(255,255,255,.1);border-radius:12px;cursor:pointer;position:relative;">
-                    
-                    <!-- Header with title and delete button -->
-                    <div style="display:flex;justify-content:space-between;align-items:flex-start;margin-bottom:8px;">
-                        <div style="flex:1;">
-                            <div style="font-weight:600;font-size:14px;color:#f8fafc;margin-bottom:4px;">{safe_name}</div>
-                            <div style="font-size:12px;color:#94a3b8;display:flex;align-items:center;gap:8px;">
-                                <span style="background:{provider_info['color']}20;padding:2px 6px;border-radius:4px;border:1px solid {provider_info['color']}40;">S{season}E{episode}</span>
-                                <span style="opacity:.7;">{position}s</span>
-                            </div>
-                        </div>
-                        <div class="bw-delete" data-series="{safe_name}" style="color:#ef4444;cursor:pointer;padding:8px;border-radius:8px;background:rgba(239,68,68,.1);border:1px solid rgba(239,68,68,.2);font-size:12px;margin-left:8px;transition:all .2s ease;hover:background:rgba(239,68,68,.2);" title="Remove series">X</div>
-                    </div>
-                    <div style="display:flex;justify-content:flex-end;margin-top:12px;">
-                        <button class="bw-series-settings" data-series="{safe_name}" data-intro-start="{intro_val}" data-intro-end="{intro_end_val}" data-end-skip="{end_skip_val}"
-                                style="padding:6px 10px;border-radius:8px;border:1px solid rgba(59,130,246,.35);background:rgba(59,130,246,.12);color:#93c5fd;font-size:11px;cursor:pointer;transition:all .2s ease;">
-                            Skip Times
-                        </button>
-                    </div>
-                </div>
-            """)
-        
+        '''
+
+
+def _render_series_row(series_name: str, data: Dict[str, Any], provider_id: str) -> str:
+    """HTML einer einzelnen Serien-Zeile (Key = data-series). Nur Klassen, Styles kommen aus dem
+    Sidebar-Stylesheet, die Provider-Farbe als CSS-Variable vom Tab-Container."""
+    season = int(data.get("season", 1))
+    episode = int(data.get("episode", 1))
+    position = int(data.get("position", 0))
+    intro_val = int(data.get("intro_skip_start", INTRO_SKIP_SECONDS))
+    intro_end_val = int(data.get("intro_skip_end", INTRO_SKIP_SECONDS + 60))
+    end_skip_val = int(data.get("end_skip", 0))
+    safe_name = _html.escape(series_name, quote=True)
+
+    return (
+        f'<div class="bw-series-item" data-series="{safe_name}" data-provider="{provider_id}" '
+        f'data-intro-start="{intro_val}" data-intro-end="{intro_end_val}" data-end-skip="{end_skip_val}">'
+        f'<div class="bw-row-head"><div class="bw-row-main">'
+        f'<div class="bw-row-title" title="{safe_name}">{safe_name}</div>'
+        f'<div class="bw-row-meta"><span class="bw-row-ep">S{season}E{episode}</span><span class="bw-row-pos">{position}s</span></div>'
+        f'</div><div class="bw-delete" title="Remove series">X</div></div>'
+        f'<div class="bw-row-foot"><button class="bw-series-settings">Skip Times</button></div>'
+        f'</div>'
+    )
+
+
+# Render-Cache: Serie -> (Eingabe-Tupel, (Provider, Timestamp, Zeilen-HTML)); unveränderte Zeilen
+# werden weder neu escaped noch neu formatiert und behalten ihre Identität (billiger Diff)
+_ROW_CACHE: Dict[str, tuple] = {}
+
+
+def _row_inputs(data: Dict[str, Any], provider: str) -> tuple:
+    return (
+        provider,
+        data.get("season", 1),
+        data.get("episode", 1),
+        data.get("position", 0),
+        data.get("timestamp", 0),
+        data.get("intro_skip_start"),
+        data.get("intro_skip_end"),
+        data.get("end_skip"),
+    )
+
+
+def sidebar_rows(db: Dict[str, Dict[str, Any]]) -> Dict[str, tuple]:
+    """Keyed Sidebar-Modell: Serienname -> (Provider, Timestamp, Zeilen-HTML)."""
+    rows = {}
+    for series_name, data in db.items():
+        provider = data.get("provider", "s.to")  # Standard ist s.to für Backward-Kompatibilität
+        inputs = _row_inputs(data, provider)
+        cached = _ROW_CACHE.get(series_name)
+        if cached is None or cached[0] != inputs:
+            row = (provider, float(data.get("timestamp", 0)), _render_series_row(series_name, data, provider))
+            cached = _ROW_CACHE[series_name] = (inputs, row)
+        rows[series_name] = cached[1]
+    if len(_ROW_CACHE) > len(rows):
+        for key in [k for k in _ROW_CACHE if k not in rows]:
+            del _ROW_CACHE[key]
+    return rows
+
+
+class RowOrder:
+    """Sidebar-Reihenfolge (Timestamp absteigend), inkrementell per bisect gepflegt statt bei jedem
+    Voll-Update neu sortiert. Nur geänderte Zeilen (neue Tupel-Identität) werden umsortiert."""
+
+    def __init__(self) -> None:
+        self.entries: list = []  # (-timestamp, key), aufsteigend
+        self.seen: Dict[str, tuple] = {}  # key -> (row, entry)
+
+    def _drop(self, key: str) -> None:
+        entry = self.seen.pop(key)[1]
+        i = bisect.bisect_left(self.entries, entry)
+        if i < len(self.entries) and self.entries[i] == entry:
+            del self.entries[i]
+
+    def sync(self, rows: Dict[str, tuple]) -> list:
+        """Gleicht mit dem aktuellen Modell ab und liefert die Keys in Sortierreihenfolge."""
+        for key in [k for k in self.seen if k not in rows]:
+            self._drop(key)
+        for key, row in rows.items():
+            seen = self.seen.get(key)
+            if seen is not None:
+                if seen[0] is row:
+                    continue
+                self._drop(key)
+            entry = (-row[1], key)
+            bisect.insort(self.entries, entry)
+            self.seen[key] = (row, entry)
+        return [key for _, key in self.entries]
+
+
+_ROW_ORDER = RowOrder()
+
+
+def _sidebar_providers(rows: Dict[str, tuple]) -> tuple:
+    """Provider in Reihenfolge des ersten Auftretens (= Tab-Reihenfolge)."""
+    return tuple(dict.fromkeys(row[0] for row in rows.values()))
+
+
+def sidebar_payload(rows: Dict[str, tuple]) -> Dict[str, Any]:
+    """Voll-Update für die virtualisierte Liste: Tab-Gerüst (leere Provider-Container) + Zeilen-Daten.
+    Die Zeilen werden erst im Browser materialisiert, wenn sie ins Sichtfenster scrollen."""
+    tabs_html = []
+    content_html = []
+    for provider_id in _sidebar_providers(rows):
+        tabs_html.append(_render_provider_tab(provider_id))
+        color = STREAMING_PROVIDERS.get(provider_id, STREAMING_PROVIDERS["s.to"])["color"]
         content_html.append(f'''
-            <div class="bw-provider-content" data-provider="{provider_id}" style="display:flex;flex-direction:column;gap:6px;">
-                {"".join(series_items)}
-            </div>
+            <div class="bw-provider-content" data-provider="{provider_id}" style="--bw-pc-bg:{color}20;--bw-pc-bd:{color}40;"></div>
         ''')
-    
-    # Kombiniere alles
-    tabs_container = f'''
+
+    shell = f'''
         <div class="bw-provider-tabs" style="display:flex;gap:2px;margin-bottom:12px;">
             {"".join(tabs_html)}
         </div>
-    '''
-    
-    content_container = f'''
         <div class="bw-provider-contents">
             {"".join(content_html)}
         </div>
     '''
-    
-    return tabs_container + content_container
+    # Nach Timestamp vorsortiert (inkrementell gepflegt); die Seite sortiert nur bei Namens-Sortierung um
+    return {
+        "shell": shell,
+        "rows": [
+            {"key": key, "provider": rows[key][0], "ts": rows[key][1], "html": rows[key][2]}
+            for key in _ROW_ORDER.sync(rows)
+        ],
+    }
 
 
-def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) -> bool:
-    try:
-        driver.switch_to.default_content()
-        settings = get_settings(driver)
-        html_concat = build_items_html(db, settings)
-        driver.execute_script(
-            """
-        (function(html){
+# Was zuletzt an die Seite geschickt wurde (Revision + Zeilen), Basis für die Patches
+_SIDEBAR_SENT: Dict[str, Any] = {"rev": 0, "rows": {}, "providers": ()}
+
+
+def diff_sidebar_rows(old: Dict[str, tuple], new: Dict[str, tuple]) -> tuple:
+    """Liefert (upserts, removed) zwischen zwei Sidebar-Modellen."""
+    upserts = [
+        {"key": key, "provider": row[0], "ts": row[1], "html": row[2]}
+        for key, row in new.items()
+        if old.get(key) != row
+    ]
+    removed = [key for key in old if key not in new]
+    return upserts, removed
+
+
+def refresh_sidebar(
+    driver: webdriver.Firefox, db: Optional[Dict[str, Dict[str, Any]]] = None, force: bool = False
+) -> bool:
+    """Aktualisiert die Serienliste: schickt nur geänderte/entfernte Zeilen als Patch.
+    Passt die Revision der Seite nicht (Reload, neue Provider-Tabs) oder force=True,
+    wird die Liste komplett neu gesetzt."""
+    if db is None:
+        db = load_progress()
+    rows = sidebar_rows(db)
+    providers = _sidebar_providers(rows)
+    sent = _SIDEBAR_SENT
+    try:
+        driver.switch_to.default_content()
+        if not force and sent["rev"] and providers == sent["providers"]:
+            upserts, removed = diff_sidebar_rows(sent["rows"], rows)
+            if not upserts and not removed:
+                return True
+            patch = {"base": sent["rev"], "rev": sent["rev"] + 1, "upserts": upserts, "removed": removed}
+            res = driver.execute_script(
+                sidebar_js("const r = __bwSb('__bwApplyPatch', arguments[0]); return r === 'missing' ? 'resync' : r;"),
+                json.dumps(patch),
+            )
+            if res == "ok":
+                sent.update(rev=patch["rev"], rows=rows, providers=providers)
+                return True
+            if res == "busy":
+                return False
+
+        rev = sent["rev"] + 1
+        res = driver.execute_script(
+            sidebar_js("return __bwSb('__bwSetList', arguments[0], arguments[1]);"),
+            json.dumps(sidebar_payload(rows)),
+            rev,
+        )
+        if res == "ok":
+            sent.update(rev=rev, rows=rows, providers=providers)
+            return True
+    except Exception as e:
+        logging.debug(f"Sidebar refresh failed: {e}")
+    return False
+
+
+# Sidebar (HTML/CSS/JS) als eine Funktion bwSidebar(payload, rev): läuft entweder als Content-Script der
+# Sidebar-Extension oder – Fallback – per execute_script
+SIDEBAR_JS = HOOKS_JS + """
+        function bwSidebar(payload, rev) {
           try {
-            let d = document.getElementById('bingeSidebar');
-            if (!d) {
-              d = document.createElement('div');
-              d.id = 'bingeSidebar';
+            // Dokument-/Fenster-Listener nur über die Registry: ein Neuaufbau ersetzt sie statt sie zu stapeln
+            const H = window.__bwHooks;
+            let host = document.getElementById('bingeSidebar');
+            if (!host) {
+              // Eigene Ebene über der Seite: closed Shadow-Root, contain:strict → Seiten-CSS, -Layout und
+              // -Style-Recalcs erreichen die Sidebar nicht. Der Host lässt Klicks durch, nur Sidebar/Panels fangen sie.
+              host = document.createElement('div');
+              host.id = 'bingeSidebar';
+              host.style.cssText = 'position:fixed !important;inset:0 !important;z-index:2147483647 !important;'
+                + 'pointer-events:none !important;contain:strict !important;margin:0 !important;padding:0 !important;';
+              const root = host.attachShadow({ mode: 'closed' });
+              const d = document.createElement('div');
+              d.className = 'bw-sb';
               Object.assign(d.style, {
                 position:'fixed', left:0, top:0, width:'340px', height:'100vh',
-                background:'linear-gradient(180deg, rgba(15,23,42,.95), rgba(30,41,59,.95))',
-                color:'#f8fafc', zIndex:2147483647,
-                borderRight:'1px solid rgba(255,255,255,.1)', backdropFilter:'blur(18px)'
+                background:'linear-gradient(180deg, rgba(15,23,42,.97), rgba(30,41,59,.97))',
+                color:'#f8fafc', pointerEvents:'auto',
+                borderRight:'1px solid rgba(255,255,255,.1)'
               });
               d.innerHTML = `
               <div class="bw-head" style="position:sticky;top:0;z-index:2;padding:12px 16px;border-bottom:1px solid rgba(255,255,255,.08);
-                                          background:linear-gradient(180deg,rgba(15,23,42,.96),rgba(30,41,59,.92));backdrop-filter:blur(12px)">
+                                          background:linear-gradient(180deg,rgba(15,23,42,.98),rgba(30,41,59,.96))">
                   <div style="display:flex;justify-content:space-between;align-items:center;gap:12px;">
                   <div style="display:flex;align-items:center;gap:8px;">
                       <div style="width:8px;height:8px;background:linear-gradient(135deg,#3b82f6,#8b5cf6);border-radius:999px;"></div>
@@ -2515,8 +4194,9 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                   <span class="chev">❮</span>
                   </button>
 
-                  <div style="margin-top:12px;display:flex;gap:8px;flex-wrap:wrap;">
-                  <input id="bwSearch" placeholder="Search..." style="flex:1;padding:8px;border-radius:10px;border:1px solid rgba(255,255,255,.12);background:rgba(2,6,23,.35);color:#e2e8f0;"/>
+                  <div style="margin-top:12px;display:flex;gap:8px;flex-wrap:wrap;position:relative;">
+                  <input id="bwSearch" placeholder="Search..." autocomplete="off" style="flex:1;padding:8px;border-radius:10px;border:1px solid rgba(255,255,255,.12);background:rgba(2,6,23,.35);color:#e2e8f0;"/>
+                  <div id="bwCatalog" class="bw-catalog" hidden></div>
                   <select id="bwSort" style="padding:8px;border-radius:10px;border:1px solid rgba(255,255,255,.12);background:rgba(2,6,23,.35);color:#e2e8f0;min-width:120px;max-width:120px;flex:0 0 120px;white-space:nowrap;overflow:hidden;text-overflow:ellipsis;">
                       <option value="time">Last watched</option>
                       <option value="name">Name</option>
@@ -2538,61 +4218,64 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
               </div>
               `;
               
-              (document.body||document.documentElement).appendChild(d);
+              root.appendChild(d);
+              (document.body||document.documentElement).appendChild(host);
 
-              document.addEventListener('fullscreenchange', ()=>{
+              H.on('sb:fullscreenchange', document, 'fullscreenchange', ()=>{
                 const sb = document.getElementById('bingeSidebar');
                 if (!sb) return;
                 if (document.fullscreenElement) {
                     sb.style.display = 'none';
                 } else {
                     sb.style.display = '';
+                    if (window.__bwRenderWindow) window.__bwRenderWindow();
                 }
               }, {passive:true});
 
               const style = document.createElement('style');
               style.textContent = `
-              #bingeSidebar{ width:340px; transition: transform .28s cubic-bezier(.22,.61,.36,1); box-shadow:0 10px 30px rgba(0,0,0,.35); overflow:visible; }
+              :host([data-busy="1"]) .bw-body{ pointer-events:none; opacity:.6; }
+              .bw-sb{ width:340px; transition: transform .28s cubic-bezier(.22,.61,.36,1); box-shadow:0 10px 30px rgba(0,0,0,.35); overflow:visible; }
   
               /* Collapsed: 56px sichtbar lassen */
-              #bingeSidebar[data-collapsed="1"]{ transform: translateX(calc(-100% + 56px)); }
+              .bw-sb[data-collapsed="1"]{ transform: translateX(calc(-100% + 56px)); }
   
               /* PEEK - bei Hover ODER wenn JS data-peek="1" setzt */
-              #bingeSidebar[data-collapsed="1"]:is(:hover,[data-peek="1"]){
+              .bw-sb[data-collapsed="1"]:is(:hover,[data-peek="1"]){
                 transform: translateX(calc(-100% + 92px)); /* 56 + ~36 (Handlebreite) */
               }
   
               /* Handle stets oben */
-              #bingeSidebar .bw-handle{ z-index:5; }
+              .bw-sb .bw-handle{ z-index:5; }
   
               /* Action-Buttons */
-              #bingeSidebar .bw-btn{
+              .bw-sb .bw-btn{
                 width:36px;height:36px;border-radius:12px;border:1px solid rgba(148,163,184,.22);
                 background:rgba(148,163,184,.10); color:#cbd5e1; cursor:pointer;
                 display:flex;align-items:center;justify-content:center;
                 box-shadow:inset 0 -1px rgba(255,255,255,.06);
                 transition: border-color .2s, background .2s, transform .15s;
               }
-              #bingeSidebar .bw-btn:hover{ border-color:rgba(148,163,184,.38); background:rgba(148,163,184,.16); transform:translateY(-1px); }
-              #bingeSidebar .bw-btn:active{ transform:translateY(0); }
-              #bingeSidebar .bw-btn.danger{ border-color:rgba(239,68,68,.25); background:rgba(239,68,68,.10); color:#fecaca; }
-              #bingeSidebar .bw-btn.danger:hover{ border-color:rgba(239,68,68,.45); background:rgba(239,68,68,.16); }
+              .bw-sb .bw-btn:hover{ border-color:rgba(148,163,184,.38); background:rgba(148,163,184,.16); transform:translateY(-1px); }
+              .bw-sb .bw-btn:active{ transform:translateY(0); }
+              .bw-sb .bw-btn.danger{ border-color:rgba(239,68,68,.25); background:rgba(239,68,68,.10); color:#fecaca; }
+              .bw-sb .bw-btn.danger:hover{ border-color:rgba(239,68,68,.45); background:rgba(239,68,68,.16); }
   
               /* Handle */
-              #bingeSidebar .bw-handle{
+              .bw-sb .bw-handle{
                 position:absolute; top:85px; right:-18px; width:32px; height:32px; border-radius:999px;
-                border:1px solid rgba(59,130,246,.6); background:linear-gradient(135deg,rgba(30,41,59,.95),rgba(2,6,23,.95));
-                backdrop-filter:blur(10px); display:flex; align-items:center; justify-content:center; cursor:pointer;
+                border:1px solid rgba(59,130,246,.6); background:linear-gradient(135deg,rgba(30,41,59,.98),rgba(2,6,23,.98));
+                display:flex; align-items:center; justify-content:center; cursor:pointer;
                 box-shadow:0 6px 20px rgba(0,0,0,.4), 0 0 0 2px rgba(59,130,246,.18);
                 transition: transform .2s ease, background .2s ease, border-color .2s ease, box-shadow .2s ease;
               }
-              #bingeSidebar .bw-handle::after{ content:""; position:absolute; inset:-8px; } /* größere Klickfläche */
-              #bingeSidebar .bw-handle:hover{ transform:translateY(-1px); background:linear-gradient(135deg,rgba(30,41,59,1),rgba(15,23,42,1)); border-color:rgba(59,130,246,.85); box-shadow:0 8px 22px rgba(0,0,0,.45), 0 0 0 2px rgba(59,130,246,.3); }
-              #bingeSidebar .chev{ font-size:16px; line-height:1; color:#e2e8f0; text-shadow:0 0 8px rgba(59,130,246,.45); transition: transform .2s ease, color .2s ease; }
-              #bingeSidebar[data-collapsed="1"] .bw-handle .chev{ transform: rotate(180deg); }
+              .bw-sb .bw-handle::after{ content:""; position:absolute; inset:-8px; } /* größere Klickfläche */
+              .bw-sb .bw-handle:hover{ transform:translateY(-1px); background:linear-gradient(135deg,rgba(30,41,59,1),rgba(15,23,42,1)); border-color:rgba(59,130,246,.85); box-shadow:0 8px 22px rgba(0,0,0,.45), 0 0 0 2px rgba(59,130,246,.3); }
+              .bw-sb .chev{ font-size:16px; line-height:1; color:#e2e8f0; text-shadow:0 0 8px rgba(59,130,246,.45); transition: transform .2s ease, color .2s ease; }
+              .bw-sb[data-collapsed="1"] .bw-handle .chev{ transform: rotate(180deg); }
   
               /* Body */
-              #bingeSidebar .bw-body{
+              .bw-sb .bw-body{
                 transition: opacity .2s ease;
                 padding:12px;
                 overflow-y:auto;
@@ -2601,67 +4284,67 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
               }
   
               /* Elemente nur ausblenden, wenn wirklich collapsed UND nicht gepeekt/gehovered */
-              #bingeSidebar[data-collapsed="1"]:not(:hover):not([data-peek="1"]) .bw-actions,
-              #bingeSidebar[data-collapsed="1"]:not(:hover):not([data-peek="1"]) #bwSearch,
-              #bingeSidebar[data-collapsed="1"]:not(:hover):not([data-peek="1"]) #bwSort,
-              #bingeSidebar[data-collapsed="1"]:not(:hover):not([data-peek="1"]) .bw-body{
+              .bw-sb[data-collapsed="1"]:not(:hover):not([data-peek="1"]) .bw-actions,
+              .bw-sb[data-collapsed="1"]:not(:hover):not([data-peek="1"]) #bwSearch,
+              .bw-sb[data-collapsed="1"]:not(:hover):not([data-peek="1"]) #bwSort,
+              .bw-sb[data-collapsed="1"]:not(:hover):not([data-peek="1"]) .bw-body{
                 opacity:0; pointer-events:none;
               }
   
               /* Beim Peek/Hover wieder einblenden (interaktiv) */
-              #bingeSidebar[data-collapsed="1"]:is(:hover,[data-peek="1"]) .bw-actions,
-              #bingeSidebar[data-collapsed="1"]:is(:hover,[data-peek="1"]) #bwSearch,
-              #bingeSidebar[data-collapsed="1"]:is(:hover,[data-peek="1"]) #bwSort,
-              #bingeSidebar[data-collapsed="1"]:is(:hover,[data-peek="1"]) .bw-body{
+              .bw-sb[data-collapsed="1"]:is(:hover,[data-peek="1"]) .bw-actions,
+              .bw-sb[data-collapsed="1"]:is(:hover,[data-peek="1"]) #bwSearch,
+              .bw-sb[data-collapsed="1"]:is(:hover,[data-peek="1"]) #bwSort,
+              .bw-sb[data-collapsed="1"]:is(:hover,[data-peek="1"]) .bw-body{
                 opacity:1; pointer-events:auto;
                 transition: opacity .16s ease .05s;
               }
               
               /* Provider Tabs */
-              #bingeSidebar .bw-provider-tabs {
+              .bw-sb .bw-provider-tabs {
                 border-bottom: 1px solid rgba(255,255,255,.1);
                 margin-bottom: 12px;
               }
               
-              #bingeSidebar .bw-provider-tab {
+              .bw-sb .bw-provider-tab {
                 transition: all .2s ease;
               }
               
-              #bingeSidebar .bw-provider-tab[data-active="1"] {
+              .bw-sb .bw-provider-tab[data-active="1"] {
                 background: rgba(255,255,255,.08) !important;
                 color: #f8fafc !important;
                 border-bottom: 2px solid rgba(148,163,184,.55) !important;
                 box-shadow: inset 0 -2px 0 rgba(148,163,184,.2);
               }
               
-              #bingeSidebar .bw-provider-tab:hover {
+              .bw-sb .bw-provider-tab:hover {
                 background: rgba(255,255,255,.08) !important;
                 color: #f8fafc !important;
               }
               
-              #bingeSidebar .bw-provider-content {
+              .bw-sb .bw-provider-content {
                 display: none;
               }
               
-              #bingeSidebar .bw-provider-content:first-child {
+              .bw-sb .bw-provider-content:first-child {
                 display: flex;
               }
               
               /* Provider Switch Buttons */
-              #bingeSidebar .bw-provider-switch {
+              .bw-sb .bw-provider-switch {
                 border: 1px solid rgba(148,163,184,.2) !important;
                 background: rgba(148,163,184,.08) !important;
                 color: #94a3b8 !important;
               }
               
-              #bingeSidebar .bw-provider-switch.active {
+              .bw-sb .bw-provider-switch.active {
                 border-color: rgba(59,130,246,.7) !important;
                 background: linear-gradient(135deg, rgba(59,130,246,.25), rgba(139,92,246,.25)) !important;
                 color: #f8fafc !important;
                 box-shadow: 0 0 0 1px rgba(59,130,246,.25), 0 6px 16px rgba(15,23,42,.35);
                 position: relative;
               }
-              #bingeSidebar .bw-provider-switch.active::after {
+              .bw-sb .bw-provider-switch.active::after {
                 content: '';
                 position: absolute;
                 inset: -2px;
@@ -2670,90 +4353,131 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                 pointer-events: none;
               }
               
-              #bingeSidebar .bw-provider-switch:hover {
+              .bw-sb .bw-provider-switch:hover {
                 border-color: rgba(255,255,255,.25) !important;
                 background: rgba(255,255,255,.12) !important;
                 transform: translateY(-1px);
               }
 
-              #bingeSidebar .bw-series-settings:hover {
+              .bw-sb .bw-series-settings:hover {
                 background: rgba(59,130,246,.2) !important;
                 border-color: rgba(59,130,246,.55) !important;
                 transform: translateY(-1px);
               }
               
               /* Beautiful Skip Time Input Fields */
-              #bingeSidebar .bw-skip-controls {
+              .bw-sb .bw-skip-controls {
                 transition: all .3s ease;
               }
               
-              #bingeSidebar .bw-skip-controls:hover {
+              .bw-sb .bw-skip-controls:hover {
                 transform: translateY(-1px);
                 box-shadow: 0 4px 12px rgba(59,130,246,.15);
               }
               
-              #bingeSidebar .bw-intro-start,
-              #bingeSidebar .bw-intro-end,
-              #bingeSidebar .bw-end {
+              .bw-sb .bw-intro-start,
+              .bw-sb .bw-intro-end,
+              .bw-sb .bw-end {
                 transition: all .2s ease !important;
               }
               
-              #bingeSidebar .bw-intro-start:focus,
-              #bingeSidebar .bw-intro-end:focus,
-              #bingeSidebar .bw-end:focus {
+              .bw-sb .bw-intro-start:focus,
+              .bw-sb .bw-intro-end:focus,
+              .bw-sb .bw-end:focus {
                 transform: scale(1.02);
                 box-shadow: 0 0 0 2px rgba(59,130,246,.3);
                 border-color: rgba(59,130,246,.6) !important;
               }
               
-              #bingeSidebar .bw-intro-start:hover,
-              #bingeSidebar .bw-intro-end:hover,
-              #bingeSidebar .bw-end:hover {
+              .bw-sb .bw-intro-start:hover,
+              .bw-sb .bw-intro-end:hover,
+              .bw-sb .bw-end:hover {
                 border-color: rgba(59,130,246,.5) !important;
                 background: rgba(59,130,246,.15) !important;
               }
               
-              #bingeSidebar .bw-intro-end:focus {
+              .bw-sb .bw-intro-end:focus {
                 box-shadow: 0 0 0 2px rgba(139,92,246,.3);
                 border-color: rgba(139,92,246,.6) !important;
               }
               
-              #bingeSidebar .bw-intro-end:hover {
+              .bw-sb .bw-intro-end:hover {
                 border-color: rgba(139,92,246,.5) !important;
                 background: rgba(139,92,246,.15) !important;
               }
               
-              #bingeSidebar .bw-end:focus {
+              .bw-sb .bw-end:focus {
                 box-shadow: 0 0 0 2px rgba(239,68,68,.3);
                 border-color: rgba(239,68,68,.6) !important;
               }
               
-              #bingeSidebar .bw-end:hover {
+              .bw-sb .bw-end:hover {
                 border-color: rgba(239,68,68,.5) !important;
                 background: rgba(239,68,68,.15) !important;
               }
               
               /* Input field animations */
-              #bingeSidebar .bw-intro-section,
-              #bingeSidebar .bw-end-section {
+              .bw-sb .bw-intro-section,
+              .bw-sb .bw-end-section {
                 transition: all .2s ease;
               }
               
-              #bingeSidebar .bw-intro-section:hover,
-              #bingeSidebar .bw-end-section:hover {
+              .bw-sb .bw-intro-section:hover,
+              .bw-sb .bw-end-section:hover {
                 transform: translateX(2px);
               }
               
+              /* Serien-Zeilen (Klassen statt Inline-Styles, Provider-Farbe via --bw-pc-bg/--bw-pc-bd) */
+              .bw-sb .bw-provider-content{ flex-direction:column; gap:6px; }
+              .bw-sb .bw-series-item{
+                margin:8px; padding:16px; position:relative; cursor:pointer; border-radius:12px;
+                background:linear-gradient(135deg,rgba(255,255,255,.05),rgba(255,255,255,.02));
+                border:1px solid rgba(255,255,255,.1);
+              }
+              .bw-sb .bw-row-head{ display:flex; justify-content:space-between; align-items:flex-start; margin-bottom:8px; }
+              .bw-sb .bw-row-main{ flex:1; min-width:0; }
+              .bw-sb .bw-row-title{ font-weight:600; font-size:14px; color:#f8fafc; margin-bottom:4px; white-space:nowrap; overflow:hidden; text-overflow:ellipsis; }
+              .bw-sb .bw-row-meta{ font-size:12px; color:#94a3b8; display:flex; align-items:center; gap:8px; }
+              .bw-sb .bw-row-ep{ background:var(--bw-pc-bg); padding:2px 6px; border-radius:4px; border:1px solid var(--bw-pc-bd); }
+              .bw-sb .bw-row-pos{ opacity:.7; }
+              .bw-sb .bw-delete{
+                color:#ef4444; cursor:pointer; padding:8px; border-radius:8px; font-size:12px; margin-left:8px;
+                background:rgba(239,68,68,.1); border:1px solid rgba(239,68,68,.2); transition:all .2s ease;
+              }
+              .bw-sb .bw-row-foot{ display:flex; justify-content:flex-end; margin-top:12px; }
+              .bw-sb .bw-series-settings{
+                padding:6px 10px; border-radius:8px; border:1px solid rgba(59,130,246,.35); background:rgba(59,130,246,.12);
+                color:#93c5fd; font-size:11px; cursor:pointer; transition:all .2s ease;
+              }
+
+              /* Katalog-Autocomplete unter dem Suchfeld */
+              .bw-sb .bw-catalog{
+                position:absolute; left:0; right:0; top:calc(100% + 4px); z-index:6; max-height:280px; overflow-y:auto;
+                background:rgba(2,6,23,.97); border:1px solid rgba(59,130,246,.3); border-radius:10px; padding:4px;
+                box-shadow:0 10px 30px rgba(0,0,0,.45);
+              }
+              .bw-sb .bw-catalog[hidden]{ display:none; }
+              .bw-sb .bw-catalog-head{ font-size:10px; color:#64748b; text-transform:uppercase; letter-spacing:.5px; padding:4px 8px; }
+              .bw-sb .bw-cat-item{ display:flex; justify-content:space-between; gap:8px; padding:7px 8px; border-radius:7px; cursor:pointer; font-size:12px; color:#e2e8f0; }
+              .bw-sb .bw-cat-item:hover{ background:rgba(59,130,246,.16); }
+              .bw-sb .bw-cat-name{ overflow:hidden; text-overflow:ellipsis; white-space:nowrap; }
+              .bw-sb .bw-cat-prov{ flex:0 0 auto; font-size:10px; color:#94a3b8; }
+
+              /* Suche: Treffer-Highlight + Trefferzahl pro Provider-Tab */
+              .bw-sb mark.bw-hl{ background:rgba(250,204,21,.28); color:inherit; border-radius:3px; padding:0 1px; }
+              .bw-sb .bw-provider-tab > div[data-hits]::after{ content:attr(data-hits); font-size:10px; opacity:.75; margin-left:2px; }
+              .bw-sb .bw-provider-tab[data-hits="0"]{ opacity:.55; }
+
               /* Delete button hover effect */
-              #bingeSidebar .bw-delete:hover {
+              .bw-sb .bw-delete:hover {
                 background: rgba(239,68,68,.2) !important;
                 transform: scale(1.1);
                 box-shadow: 0 2px 8px rgba(239,68,68,.3);
               }
               `;
-              d.appendChild(style);
+              root.appendChild(style);
   
-              const tgl = document.getElementById('bwCollapse');
+              const tgl = root.getElementById('bwCollapse');
               const setHandleTitle = () => {
                 const collapsed = d.getAttribute('data-collapsed') === '1';
                 tgl.title = collapsed ? 'Unfold' : 'Collapse';
@@ -2796,14 +4520,14 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
               // Website Selection Switch Management
               function updateProviderSwitch(providerId) {
                 // Alle Switch-Buttons zurücksetzen
-                const switchButtons = document.querySelectorAll('.bw-provider-switch');
+                const switchButtons = root.querySelectorAll('.bw-provider-switch');
                 if (switchButtons.length > 0) {
                   switchButtons.forEach(btn => {
                     btn.classList.remove('active');
                   });
                   
                   // Aktiven Button markieren
-                  const activeBtn = document.querySelector(`.bw-provider-switch[data-provider="${providerId}"]`);
+                  const activeBtn = root.querySelector(`.bw-provider-switch[data-provider="${providerId}"]`);
                   if (activeBtn) {
                     activeBtn.classList.add('active');
                   }
@@ -2819,23 +4543,6 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                 updateUIFromCurrentUrl();
               }, 300);
               
-              // Listen for URL changes (navigation, back/forward buttons)
-              let lastUrl = window.location.href;
-              const urlObserver = new MutationObserver(() => {
-                if (window.location.href !== lastUrl) {
-                  lastUrl = window.location.href;
-                  setTimeout(() => updateUIFromCurrentUrl(), 100);
-                }
-              });
-              
-              // Observe changes to the document
-              urlObserver.observe(document, { subtree: true, childList: true });
-              
-              // Also listen for popstate events (back/forward buttons)
-              window.addEventListener('popstate', () => {
-                setTimeout(() => updateUIFromCurrentUrl(), 100);
-              });
-              
               // Website Switch Click Handler
               d.addEventListener('click', (e) => {
                 const switchBtn = e.target.closest('.bw-provider-switch');
@@ -2877,8 +4584,8 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
               });
                 
               /* Buttons */
-              const btnSkip = document.getElementById('bwSkip');
-              const btnQuit = document.getElementById('bwQuit');
+              const btnSkip = root.getElementById('bwSkip');
+              const btnQuit = root.getElementById('bwQuit');
               if (btnSkip) btnSkip.addEventListener('click', (e)=>{
                 e.preventDefault(); e.stopPropagation();
                 try { localStorage.setItem('bw_skip_now','1'); } catch(_){}
@@ -2893,7 +4600,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
               // Provider Tab Management
               function switchProviderTab(providerId) {
                 // Alle Tabs deaktivieren
-                document.querySelectorAll('.bw-provider-tab').forEach(tab => {
+                root.querySelectorAll('.bw-provider-tab').forEach(tab => {
                   tab.style.background = 'rgba(255,255,255,.05)';
                   tab.style.color = '#94a3b8';
                   tab.style.borderBottom = 'none';
@@ -2901,12 +4608,12 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                 });
                 
                 // Alle Contents ausblenden
-                document.querySelectorAll('.bw-provider-content').forEach(content => {
+                root.querySelectorAll('.bw-provider-content').forEach(content => {
                   content.style.display = 'none';
                 });
                 
                 // Gewählten Tab aktivieren
-                const activeTab = document.querySelector(`[data-provider="${providerId}"]`);
+                const activeTab = root.querySelector(`[data-provider="${providerId}"]`);
                 if (activeTab) {
                   activeTab.style.background = 'rgba(255,255,255,.1)';
                   activeTab.style.color = '#f8fafc';
@@ -2915,10 +4622,11 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                 }
                 
                 // Gewählten Content anzeigen
-                const activeContent = document.querySelector(`.bw-provider-content[data-provider="${providerId}"]`);
+                const activeContent = root.querySelector(`.bw-provider-content[data-provider="${providerId}"]`);
                 if (activeContent) {
                   activeContent.style.display = 'flex';
                 }
+                if (window.__bwRenderWindow) window.__bwRenderWindow();
               }
               
               // Provider Tab Click Handler
@@ -2933,39 +4641,65 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                 }
               });
               
+              // Sortieren/Filtern arbeitet auf den Daten-Arrays der virtualisierten Liste, nicht auf DOM-Knoten
               function onSort(){
-                const mode = document.getElementById('bwSort').value;
-                const activeProvider = localStorage.getItem('bw_active_provider') || 's.to';
-                const list = document.querySelector(`.bw-provider-content[data-provider="${activeProvider}"]`);
-                if (!list) return;
-                
-                const items = Array.from(list.children);
-                items.sort((a,b)=>{
-                  if (mode==='name') return a.dataset.series.localeCompare(b.dataset.series);
-                  const tsA = parseFloat(a.getAttribute('data-ts')||'0');
-                  const tsB = parseFloat(b.getAttribute('data-ts')||'0');
-                  if (tsA !== tsB) return tsB - tsA;
-                  return a.dataset.series.localeCompare(b.dataset.series);
+                const mode = sortMode();
+                Object.values(window.__bwModel.views).forEach(v => {
+                  v.all.sort((a, b) => compareRecs(a, b, mode));
                 });
-                list.replaceChildren(...items);
+                runSearch();
+                renderWindow(true);
               }
               function onFilter(){
-                const q = (document.getElementById('bwSearch').value||'').toLowerCase();
-                const activeProvider = localStorage.getItem('bw_active_provider') || 's.to';
-                const list = document.querySelector(`.bw-provider-content[data-provider="${activeProvider}"]`);
-                if (!list) return;
-                
-                Array.from(list.children).forEach(el=>{
-                  const show = el.dataset.series.toLowerCase().includes(q);
-                  el.style.display = show ? '' : 'none';
-                });
+                runSearch();
+                renderWindow(true);
+                requestCatalog();
+              }
+
+              // Katalog-Autocomplete: Anfrage an Python (bw_catalog_query), Antwort via __bwCatalogResults
+              const catalogBox = root.getElementById('bwCatalog');
+              const hideCatalog = () => { if (catalogBox) { catalogBox.hidden = true; catalogBox.replaceChildren(); } };
+              function requestCatalog(){
+                const q = searchQuery().trim();
+                if (q.length < 2) { hideCatalog(); return; }
+                try { localStorage.setItem('bw_catalog_query', JSON.stringify({ q })); } catch(_) {}
+                window.dispatchEvent(new Event('bw-signal'));
               }
+              window.__bwCatalogResults = function (q, results) {
+                if (!catalogBox || q !== searchQuery().trim()) return; // veraltete Antwort
+                results = fromJson(results);
+                const items = (results || []).map(r => {
+                  const it = document.createElement('div');
+                  it.className = 'bw-cat-item';
+                  it.dataset.slug = r.slug;
+                  it.dataset.provider = r.provider;
+                  const n = document.createElement('span'); n.className = 'bw-cat-name'; n.textContent = r.name;
+                  const p = document.createElement('span'); p.className = 'bw-cat-prov'; p.textContent = r.label || r.provider;
+                  it.append(n, p);
+                  return it;
+                });
+                if (!items.length) { hideCatalog(); return; }
+                const head = document.createElement('div');
+                head.className = 'bw-catalog-head';
+                head.textContent = 'Catalog';
+                catalogBox.replaceChildren(head, ...items);
+                catalogBox.hidden = false;
+              };
+              root.addEventListener('click', (e) => {
+                if (catalogBox && !catalogBox.hidden && !(e.target.closest && e.target.closest('#bwCatalog, #bwSearch'))) hideCatalog();
+              });
+              H.on('sb:catalog-outside', document, 'click', (e) => { if (e.target !== host) hideCatalog(); });
+              d.addEventListener('keydown', (e) => { if (e.key === 'Escape' && e.target && e.target.id === 'bwSearch') hideCatalog(); });
 
-              d.addEventListener('input', (e)=>{ if (e.target && e.target.id==='bwSearch') onFilter(); });
+              // Suche entprellt (Tippen erzeugt nur einen Suchlauf)
+              let searchTimer = null;
+              d.addEventListener('input', (e)=>{
+                if (e.target && e.target.id==='bwSearch') { clearTimeout(searchTimer); searchTimer = setTimeout(onFilter, 120); }
+              });
               d.addEventListener('change', (e)=>{ if (e.target && e.target.id==='bwSort') onSort(); });
 
               const openSeriesSkipPanel = (seriesName, introStart, introEnd, endSkip) => {
-                const existingPanel = document.getElementById('bwSeriesSkipPanel');
+                const existingPanel = root.getElementById('bwSeriesSkipPanel');
                 if (existingPanel) {
                   existingPanel.remove();
                 }
@@ -2991,6 +4725,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                   padding: '16px',
                   zIndex: 2147483647,
                   boxShadow: '0 10px 30px rgba(0,0,0,.4)',
+                  pointerEvents: 'auto',
                 });
 
                 const introSectionHtml = allowIntro ? `
@@ -3045,12 +4780,12 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                   </div>
                 `;
 
-                document.body.appendChild(panel);
+                root.appendChild(panel);
 
                 const closePanel = () => panel.remove();
-                const closeButton = document.getElementById('bwCloseSeriesSkip');
+                const closeButton = root.getElementById('bwCloseSeriesSkip');
                 if (closeButton) closeButton.addEventListener('click', closePanel);
-                const skipDragHandle = document.getElementById('bwSeriesSkipDragHandle');
+                const skipDragHandle = root.getElementById('bwSeriesSkipDragHandle');
                 if (skipDragHandle) {
                   let skipIsDragging = false;
                   let skipDragStartX = 0;
@@ -3069,7 +4804,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                     ev.preventDefault();
                   });
 
-                  document.addEventListener('mousemove', (ev) => {
+                  H.on('skip:drag-move', document, 'mousemove', (ev) => {
                     if (!skipIsDragging) return;
                     const deltaX = ev.clientX - skipDragStartX;
                     const deltaY = ev.clientY - skipDragStartY;
@@ -3079,7 +4814,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                     panel.style.top = newTop + 'px';
                   });
 
-                  document.addEventListener('mouseup', () => {
+                  H.on('skip:drag-up', document, 'mouseup', () => {
                     skipIsDragging = false;
                   });
                 }
@@ -3125,11 +4860,11 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                 const c = sel => e.target.closest && e.target.closest(sel);
 
                 if (c('#bwSettings')) {
-                  const existing = document.getElementById('bwSettingsPanel');
+                  const existing = root.getElementById('bwSettingsPanel');
                   if (existing) { existing.remove(); return; }
                   const p = document.createElement('div');
                   Object.assign(p, { id:'bwSettingsPanel' });
-                  Object.assign(p.style, { position:'fixed', right:'16px', top:'64px', width:'340px', background:'rgba(2,6,23,.94)', border:'1px solid rgba(255,255,255,.12)', borderRadius:'12px', color:'#e2e8f0', padding:'16px', zIndex:2147483647, cursor:'move', userSelect:'none' });
+                  Object.assign(p.style, { position:'fixed', right:'16px', top:'64px', width:'340px', background:'rgba(2,6,23,.94)', border:'1px solid rgba(255,255,255,.12)', borderRadius:'12px', color:'#e2e8f0', padding:'16px', zIndex:2147483647, cursor:'move', userSelect:'none', pointerEvents:'auto' });
                   p.innerHTML = `
                     <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:12px;cursor:move;" id="bwSettingsDragHandle">
                       <div style="font-weight:600">Settings</div>
@@ -3167,7 +4902,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                       <button id="bwSaveSettings" style="padding:6px 10px;border-radius:8px;border:1px solid rgba(59,130,246,.35);background:rgba(59,130,246,.12);color:#93c5fd;cursor:pointer;">Save</button>
                     </div>
                   `;
-                  document.body.appendChild(p);
+                  root.appendChild(p);
                   
                   // Drag and drop functionality
                   let isDragging = false;
@@ -3176,8 +4911,8 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                   let initialLeft = 0;
                   let initialTop = 0;
                   
-                  const dragHandle = document.getElementById('bwSettingsDragHandle');
-                  const panel = document.getElementById('bwSettingsPanel');
+                  const dragHandle = root.getElementById('bwSettingsDragHandle');
+                  const panel = root.getElementById('bwSettingsPanel');
                   
                   // Load saved position or use default
                   let savedPosition = null;
@@ -3213,7 +4948,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                     e.preventDefault();
                   });
                   
-                  document.addEventListener('mousemove', (e) => {
+                  H.on('settings:drag-move', document, 'mousemove', (e) => {
                     if (!isDragging) return;
                     
                     const deltaX = e.clientX - dragStartX;
@@ -3226,7 +4961,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                     panel.style.top = newTop + 'px';
                   });
                   
-                  document.addEventListener('mouseup', () => {
+                  H.on('settings:drag-up', document, 'mouseup', () => {
                     if (isDragging) {
                       // Save the current position when dragging stops
                       try {
@@ -3256,7 +4991,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                     });
                   });
                   
-                  const closeButton = document.getElementById('bwCloseSettings');
+                  const closeButton = root.getElementById('bwCloseSettings');
                   if (closeButton) {
                     closeButton.addEventListener('click', (e) => {
                       e.preventDefault();
@@ -3264,18 +4999,18 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                       p.remove();
                     });
                   }
-                  const saveButton = document.getElementById('bwSaveSettings');
+                  const saveButton = root.getElementById('bwSaveSettings');
                   if (saveButton) {
                     saveButton.addEventListener('click', (e) => {
                       e.preventDefault();
                       e.stopPropagation();
                       const next = {
-                        autoFullscreen: !!document.getElementById('bwOptAutoFullscreen')?.checked,
-                        autoSkipIntro: !!document.getElementById('bwOptAutoSkipIntro')?.checked,
-                        autoSkipEndScreen: !!document.getElementById('bwOptAutoSkipEndScreen')?.checked,
-                        autoNext: !!document.getElementById('bwOptAutoNext')?.checked,
-                        playbackRate: parseFloat(document.getElementById('bwOptPlaybackRate')?.value || '1'),
-                        volume: Math.max(0, Math.min(1, parseFloat(document.getElementById('bwOptVolume')?.value || '1')))
+                        autoFullscreen: !!root.getElementById('bwOptAutoFullscreen')?.checked,
+                        autoSkipIntro: !!root.getElementById('bwOptAutoSkipIntro')?.checked,
+                        autoSkipEndScreen: !!root.getElementById('bwOptAutoSkipEndScreen')?.checked,
+                        autoNext: !!root.getElementById('bwOptAutoNext')?.checked,
+                        playbackRate: parseFloat(root.getElementById('bwOptPlaybackRate')?.value || '1'),
+                        volume: Math.max(0, Math.min(1, parseFloat(root.getElementById('bwOptVolume')?.value || '1')))
                       };
                       localStorage.setItem('bw_settings', JSON.stringify(next));
                       localStorage.setItem('bw_settings_update', JSON.stringify(next));
@@ -3290,7 +5025,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                   
                   try {
                     const s = JSON.parse(localStorage.getItem('bw_settings')||'{}');
-                    const x = id => document.getElementById(id);
+                    const x = id => root.getElementById(id);
                                          if (x('bwOptAutoFullscreen')) x('bwOptAutoFullscreen').checked = (s.autoFullscreen !== false);
                      if (x('bwOptAutoSkipIntro')) x('bwOptAutoSkipIntro').checked = (s.autoSkipIntro !== false);
                      if (x('bwOptAutoSkipEndScreen')) x('bwOptAutoSkipEndScreen').checked = (s.autoSkipEndScreen !== false);
@@ -3298,9 +5033,9 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                     if (x('bwOptPlaybackRate')) x('bwOptPlaybackRate').value = String(s.playbackRate ?? 1);
                     if (x('bwOptVolume')) x('bwOptVolume').value = String(Math.max(0, Math.min(1, s.volume ?? 1)));
                     if (x('bwVolumeVal')) x('bwVolumeVal').textContent = Math.round(parseFloat(x('bwOptVolume').value||'1')*100) + '%';
-                    document.getElementById('bwOptVolume')?.addEventListener('input', (e)=>{
+                    root.getElementById('bwOptVolume')?.addEventListener('input', (e)=>{
                         const v = parseFloat(e.target.value||'1');
-                        const vv = document.getElementById('bwVolumeVal');
+                        const vv = root.getElementById('bwVolumeVal');
                         if (vv) vv.textContent = Math.round(v*100)+'%';
                     });
                   } catch(_){}
@@ -3317,19 +5052,36 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                   return;
                 }
 
+                const cat = c('.bw-cat-item');
+                if (cat) {
+                  if (localStorage.getItem('bw_nav_inflight') === '1') return;
+                  const slug = cat.dataset.slug || '';
+                  const provider = cat.dataset.provider || 's.to';
+                  try {
+                    localStorage.setItem('bw_series', slug);
+                    localStorage.setItem('bw_series_provider', provider);
+                  } catch(_) {}
+                  document.cookie = 'bw_series=' + encodeURIComponent(slug) + '; path=/';
+                  document.cookie = 'bw_series_provider=' + encodeURIComponent(provider) + '; path=/';
+                  hideCatalog();
+                  return;
+                }
+
                 const del = c('.bw-delete');
                 if (del) {
-                  const s = del.getAttribute('data-series');
+                  const s = del.closest('.bw-series-item')?.getAttribute('data-series');
                   if (s) localStorage.setItem('bw_seriesToDelete', s);
                   return;
                 }
 
                 const skipPanelButton = c('.bw-series-settings');
                 if (skipPanelButton) {
-                  const seriesName = skipPanelButton.getAttribute('data-series');
-                  const introStart = parseInt(skipPanelButton.getAttribute('data-intro-start') || '0', 10) || 0;
-                  const introEnd = parseInt(skipPanelButton.getAttribute('data-intro-end') || '0', 10) || 0;
-                  const endSkip = parseInt(skipPanelButton.getAttribute('data-end-skip') || '0', 10) || 0;
+                  const row = skipPanelButton.closest('.bw-series-item');
+                  if (!row) return;
+                  const seriesName = row.getAttribute('data-series');
+                  const introStart = parseInt(row.getAttribute('data-intro-start') || '0', 10) || 0;
+                  const introEnd = parseInt(row.getAttribute('data-intro-end') || '0', 10) || 0;
+                  const endSkip = parseInt(row.getAttribute('data-end-skip') || '0', 10) || 0;
                   if (seriesName) {
                     openSeriesSkipPanel(seriesName, introStart, introEnd, endSkip);
                   }
@@ -3348,8 +5100,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                     if (localStorage.getItem('bw_nav_inflight') === '1') return; // throttle
                     localStorage.setItem('bw_nav_inflight','1');
 
-                    const body = document.getElementById('bwBody');
-                    if (body) { body.style.pointerEvents='none'; body.style.opacity='.6'; }
+                    host.setAttribute('data-busy', '1');
 
                     const s = item.getAttribute('data-series') || '';
                     const provider = item.getAttribute('data-provider') || 's.to';
@@ -3363,7 +5114,7 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                     setTimeout(()=>{ try{
                     if (localStorage.getItem('bw_nav_inflight') === '1') {
                         localStorage.removeItem('bw_nav_inflight');
-                        if (body) { body.style.pointerEvents=''; body.style.opacity=''; }
+                        host.removeAttribute('data-busy');
                     }
                     }catch(_){ } }, 4000);
                     return;
@@ -3408,51 +5159,614 @@ def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) ->
                });
 
               // APIs & Keepalive
-              window.__bwLastHTML = '';
-              window.__bwSetList = function (newHtml) {
-                if (localStorage.getItem('bw_nav_inflight') === '1') return;
-                if (typeof newHtml !== 'string') return;
-                if (window.__bwLastHTML === newHtml) return;
-                const l = document.getElementById('bwSeriesList');
-                if (l) l.innerHTML = newHtml;
-                window.__bwLastHTML = newHtml;
+              // Virtualisierte, keyed Liste: pro Provider ein Daten-Array (sortiert + gefiltert),
+              // im DOM stehen nur die sichtbaren Zeilen + Puffer. __bwRev = zuletzt von Python bestätigter Stand
+              const VROW_BUFFER = 8;
+              window.__bwRev = null;
+              // Revision zusätzlich am DOM, damit Python sie im Signal-Read sieht (auch aus dem Extension-Kontext)
+              const setRev = (v) => {
+                window.__bwRev = v;
+                const sb = document.getElementById('bingeSidebar');
+                if (sb) sb.dataset.rev = (v === null || v === undefined) ? '' : String(v);
+              };
+              // Python schickt Daten als JSON-String (überquert die Content-Script-Grenze ohne Xray-Wrapper)
+              const fromJson = (v) => { if (typeof v !== 'string') return v; try { return JSON.parse(v); } catch(_) { return null; } };
+              const newModel = () => ({ rows: new Map(), views: Object.create(null), pitch: 0, tri: new Map(), q: '', tokens: [] });
+              window.__bwModel = newModel();
+              const sortMode = () => (root.getElementById('bwSort')||{}).value || 'time';
+              const searchQuery = () => ((root.getElementById('bwSearch')||{}).value||'');
+
+              // Suchindex: Namen gefaltet (klein, ohne Akzente, Bindestriche/Satzzeichen → Leerzeichen, Länge wie
+              // das Original → Highlight-Positionen stimmen) + Trigramm-Index über alle Provider
+              const foldName = (s) => {
+                let out = '';
+                for (const ch of String(s)) {
+                  const f = ch.normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase();
+                  let c = ' ';
+                  if (f.length === 1 && /[\\p{L}\\p{N}]/u.test(f)) c = f;
+                  else if (/[\\p{L}\\p{N}]/u.test(ch)) c = ch.toLowerCase();
+                  out += c.length === ch.length ? c : ' '.repeat(ch.length);
+                }
+                return out;
+              };
+              const trigrams = (folded) => {
+                const n = folded.replace(/\\s+/g, ' ').trim();
+                const out = new Set();
+                if (n.length < 3) { if (n) out.add(n); return out; }
+                for (let i = 0; i + 3 <= n.length; i++) out.add(n.substr(i, 3));
+                return out;
+              };
+              const indexRec = (model, rec, add) => {
+                rec.tris.forEach(g => {
+                  let set = model.tri.get(g);
+                  if (add) { if (!set) model.tri.set(g, set = new Set()); set.add(rec); }
+                  else if (set) { set.delete(rec); if (!set.size) model.tri.delete(g); }
+                });
+              };
+              const TRI_MIN = 0.5;
+              // Rang: Namensanfang > Wortanfang > Teilstring > Trigramm-Ähnlichkeit (Tippfehler, "onepiece")
+              const scoreRec = (rec, tokens) => {
+                let score = 0;
+                for (const tok of tokens) {
+                  let sc = 0;
+                  const i = rec.fold.indexOf(tok.t);
+                  if (i === 0) sc = 3;
+                  else if (i > 0) sc = rec.fold[i - 1] === ' ' ? 2 : 1.5;
+                  else if (tok.t.length >= 3) {
+                    let hit = 0;
+                    tok.tris.forEach(g => { if (rec.tris.has(g)) hit++; });
+                    if (hit / tok.tris.size >= TRI_MIN) sc = hit / tok.tris.size;
+                  }
+                  if (!sc) return 0;
+                  score += sc;
+                }
+                return score;
+              };
+              const updateHits = (counts) => {
+                root.querySelectorAll('#bwSeriesList .bw-provider-tab').forEach(tab => {
+                  [tab, tab.firstElementChild].forEach(el => {
+                    if (!el) return;
+                    if (!counts) el.removeAttribute('data-hits');
+                    else el.setAttribute('data-hits', String(counts[tab.dataset.provider] || 0));
+                  });
+                });
+                if (!counts) return;
+                // Aktiver Tab ohne Treffer → zum Tab mit den meisten Treffern wechseln
+                const shown = Array.from(root.querySelectorAll('#bwSeriesList .bw-provider-content')).find(c => c.getClientRects().length);
+                if (shown && !counts[shown.dataset.provider]) {
+                  const best = Object.keys(counts).sort((a, b) => counts[b] - counts[a])[0];
+                  if (best && counts[best]) switchProviderTab(best);
+                }
+              };
+              // Suche über alle Provider; Ergebnis = pro Tab nach Rang (dann Sortiermodus) geordnete visible-Arrays
+              const runSearch = () => {
+                const model = window.__bwModel;
+                const mode = sortMode();
+                const q = foldName(searchQuery()).replace(/\\s+/g, ' ').trim();
+                const views = Object.values(model.views);
+                model.q = q;
+                model.tokens = q ? q.split(' ').map(t => ({ t, tris: trigrams(t) })) : [];
+                if (!q) {
+                  views.forEach(v => { v.visible = v.all.slice(); v.end = -1; });
+                  updateHits(null);
+                  return;
+                }
+                // Kandidaten über den Trigramm-Index des längsten Tokens, sonst (1–2 Zeichen) alle Namen
+                const longest = model.tokens.filter(x => x.t.length >= 3).sort((a, b) => b.t.length - a.t.length)[0];
+                let cands = model.rows.values();
+                if (longest) {
+                  const set = new Set();
+                  longest.tris.forEach(g => (model.tri.get(g) || []).forEach(r => set.add(r)));
+                  cands = set;
+                }
+                const scores = new Map();
+                for (const rec of cands) { const sc = scoreRec(rec, model.tokens); if (sc) scores.set(rec, sc); }
+                const counts = {};
+                views.forEach(v => {
+                  v.visible = v.all.filter(r => scores.has(r)).sort((a, b) => (scores.get(b) - scores.get(a)) || compareRecs(a, b, mode));
+                  v.end = -1;
+                  if (v.all.length) counts[v.all[0].provider] = v.visible.length;
+                });
+                updateHits(counts);
+              };
+              const highlightRow = (rec, model) => {
+                if (rec.hl === model.q) return;
+                rec.hl = model.q;
+                const title = rec.el.querySelector('.bw-row-title');
+                if (!title) return;
+                const ranges = [];
+                model.tokens.forEach(tok => { const i = rec.fold.indexOf(tok.t); if (i >= 0) ranges.push([i, i + tok.t.length]); });
+                ranges.sort((a, b) => a[0] - b[0]);
+                const nodes = [];
+                let pos = 0;
+                ranges.forEach(([a, b]) => {
+                  if (b <= pos) return;
+                  a = Math.max(a, pos);
+                  if (a > pos) nodes.push(document.createTextNode(rec.key.slice(pos, a)));
+                  const m = document.createElement('mark');
+                  m.className = 'bw-hl';
+                  m.textContent = rec.key.slice(a, b);
+                  nodes.push(m);
+                  pos = b;
+                });
+                if (pos < rec.key.length) nodes.push(document.createTextNode(rec.key.slice(pos)));
+                title.replaceChildren(...nodes);
+              };
+              const compareRecs = (a, b, mode) => {
+                if (mode === 'name') return a.key.localeCompare(b.key);
+                if (a.ts !== b.ts) return b.ts - a.ts;
+                return a.key.localeCompare(b.key);
+              };
+              const makeRec = (r) => {
+                const key = String(r.key);
+                const fold = foldName(key);
+                return { key, provider: r.provider, ts: +r.ts || 0, html: r.html, fold, tris: trigrams(fold), el: null, hl: '' };
+              };
+              const viewFor = (provider) => {
+                const views = window.__bwModel.views;
+                return views[provider] || (views[provider] = { all: [], visible: [], win: null, start: 0, end: 0 });
+              };
+              const materialize = (rec) => {
+                if (!rec.el) {
+                  const tpl = document.createElement('template');
+                  tpl.innerHTML = rec.html.trim();
+                  rec.el = tpl.content.firstElementChild;
+                  rec.hl = '';
+                }
+                highlightRow(rec, window.__bwModel);
+                return rec.el;
+              };
+              const renderWindow = (force) => {
+                const body = root.getElementById('bwBody');
+                if (!body) return;
+                const model = window.__bwModel;
+                root.querySelectorAll('#bwSeriesList .bw-provider-content').forEach(content => {
+                  const view = model.views[content.dataset.provider];
+                  if (!view) return;
+                  // ausgeblendeter Tab → keine Knoten vorhalten
+                  if (!content.getClientRects().length) {
+                    if (view.win && view.win.length) {
+                      view.win.forEach(r => { r.el = null; });
+                      content.replaceChildren();
+                      content.style.paddingTop = content.style.paddingBottom = '';
+                    }
+                    view.win = null;
+                    return;
+                  }
+                  const n = view.visible.length;
+                  const pitch = model.pitch || 120;
+                  const offset = content.getBoundingClientRect().top - body.getBoundingClientRect().top + body.scrollTop;
+                  const from = body.scrollTop - offset;
+                  const start = Math.max(0, Math.min(n, Math.floor(from / pitch) - VROW_BUFFER));
+                  const end = Math.max(start, Math.min(n, Math.ceil((from + body.clientHeight) / pitch) + VROW_BUFFER));
+                  if (!force && view.win && view.start === start && view.end === end) return;
+                  const slice = view.visible.slice(start, end);
+                  const keep = new Set(slice);
+                  (view.win || []).forEach(r => { if (!keep.has(r)) r.el = null; });
+                  content.replaceChildren(...slice.map(materialize));
+                  content.style.paddingTop = (start * pitch) + 'px';
+                  content.style.paddingBottom = ((n - end) * pitch) + 'px';
+                  view.win = slice; view.start = start; view.end = end;
+                  // Zeilenabstand einmalig messen (Zeilen haben feste Höhe), dann Fenster korrigieren
+                  if (!model.pitch && slice.length >= 2) {
+                    const measured = slice[1].el.offsetTop - slice[0].el.offsetTop;
+                    if (measured > 0) { model.pitch = measured; renderWindow(true); }
+                  }
+                });
+              };
+              let vRaf = 0;
+              const scheduleWindow = () => {
+                if (!vRaf) vRaf = requestAnimationFrame(() => { vRaf = 0; renderWindow(false); });
+              };
+              const vBody = root.getElementById('bwBody');
+              if (vBody) vBody.addEventListener('scroll', scheduleWindow, {passive:true});
+              // Scroll-Position für die nächste Seite/den nächsten Start merken (Session-Snapshot liest sie mit)
+              let scrollSaveT = 0;
+              if (vBody) vBody.addEventListener('scroll', () => {
+                clearTimeout(scrollSaveT);
+                scrollSaveT = setTimeout(() => {
+                  try { localStorage.setItem('bw_sidebar_scroll', String(Math.round(vBody.scrollTop))); } catch (_) {}
+                }, 300);
+              }, {passive:true});
+              H.on('sb:resize', window, 'resize', scheduleWindow, {passive:true});
+              window.__bwRenderWindow = () => renderWindow(true);
+
+              window.__bwRenderList = function (payload, newRev) {
+                payload = fromJson(payload);
+                if (!payload || typeof payload.shell !== 'string' || !Array.isArray(payload.rows)) return 'bad';
+                const l = root.getElementById('bwSeriesList');
+                if (!l) return 'missing';
+                const body = root.getElementById('bwBody');
+                // Erste Befüllung nach dem Aufbau: gemerkte Scroll-Position der letzten Seite übernehmen
+                const top = body ? (body.scrollTop || (window.__bwModel && window.__bwModel.rows.size ? 0 : +localStorage.getItem('bw_sidebar_scroll') || 0)) : 0;
+                l.innerHTML = payload.shell;
+                const model = window.__bwModel = newModel();
+                payload.rows.forEach(r => {
+                  const rec = makeRec(r);
+                  model.rows.set(rec.key, rec);
+                  indexRec(model, rec, true);
+                  viewFor(rec.provider).all.push(rec);
+                });
+                // Tab, Sortierung und Suche nach dem Neuaufbau wiederherstellen
+                const mode = sortMode();
+                Object.values(model.views).forEach(v => { v.all.sort((a, b) => compareRecs(a, b, mode)); });
+                const active = localStorage.getItem('bw_active_provider');
+                if (active && model.views[active]) switchProviderTab(active);
+                runSearch();
+                renderWindow(true);
+                if (body) { body.scrollTop = top; renderWindow(false); }
+                if (newRev !== undefined) setRev(newRev);
+                return 'ok';
+              };
+              window.__bwSetList = function (payload, newRev) {
+                if (localStorage.getItem('bw_nav_inflight') === '1') return 'busy';
+                return window.__bwRenderList(payload, newRev);
+              };
+              // Patch {base, rev, upserts:[{key, provider, ts, html}], removed:[key]} – ändert nur das Daten-Array,
+              // DOM-Arbeit beschränkt sich auf das sichtbare Fenster
+              window.__bwApplyPatch = function (p) {
+                if (localStorage.getItem('bw_nav_inflight') === '1') return 'busy';
+                p = fromJson(p);
+                if (!p || window.__bwRev === null || window.__bwRev !== p.base) return 'resync';
+                const model = window.__bwModel;
+                const mode = sortMode();
+                const touched = new Set();
+                // Arrays sind nach `mode` sortiert → Position per Binärsuche, kein Neusortieren/-filtern
+                const lowerBound = (arr, rec) => {
+                  let lo = 0, hi = arr.length;
+                  while (lo < hi) { const mid = (lo + hi) >> 1; if (compareRecs(arr[mid], rec, mode) < 0) lo = mid + 1; else hi = mid; }
+                  return lo;
+                };
+                const removeSorted = (arr, rec) => {
+                  let i = lowerBound(arr, rec);
+                  if (arr[i] !== rec) i = arr.indexOf(rec);
+                  if (i >= 0) arr.splice(i, 1);
+                };
+                const drop = (rec) => {
+                  const v = model.views[rec.provider];
+                  if (v) { removeSorted(v.all, rec); if (!model.q) removeSorted(v.visible, rec); touched.add(v); }
+                  indexRec(model, rec, false);
+                  model.rows.delete(rec.key);
+                };
+                (p.removed || []).forEach(k => { const rec = model.rows.get(k); if (rec) drop(rec); });
+                for (const r of (p.upserts || [])) {
+                  if (!model.views[r.provider]) { setRev(null); return 'resync'; }
+                  const old = model.rows.get(String(r.key));
+                  if (old) drop(old);
+                  const rec = makeRec(r);
+                  const v = viewFor(rec.provider);
+                  v.all.splice(lowerBound(v.all, rec), 0, rec);
+                  if (!model.q) v.visible.splice(lowerBound(v.visible, rec), 0, rec);
+                  indexRec(model, rec, true);
+                  model.rows.set(rec.key, rec);
+                  touched.add(v);
+                }
+                // Aktive Suche: Ränge neu bestimmen (Kandidaten über den Index), sonst nur Fenster neu aufbauen
+                if (model.q && touched.size) runSearch();
+                touched.forEach(v => { v.end = -1; });
+                renderWindow(true);
+                setRev(p.rev);
+                return 'ok';
               };
 
-              function ensureSidebar(){
-                if (document.getElementById('bingeSidebar')) return;
-                try { localStorage.setItem('bw_need_reinject','1'); } catch(_){}
-              }
-              const _rs = history.replaceState; history.replaceState = function(){ const r=_rs.apply(this,arguments); setTimeout(ensureSidebar,0); return r; };
-              window.addEventListener('popstate', ensureSidebar);
-              window.addEventListener('hashchange', ensureSidebar);
-            }
+              // Benchmark-Hook (BW_BENCH): scrollt die Liste Frame für Frame; Ergebnis als JSON in data-bench am Host,
+              // weil Python den geschlossenen Shadow-Root nicht erreicht
+              window.__bwBenchScroll = function (stepPx, maxFrames) {
+                const body = root.getElementById('bwBody');
+                if (!body) return 'missing';
+                delete host.dataset.bench;
+                body.scrollTop = 0;
+                const frames = [];
+                let last = 0, maxRows = 0;
+                const step = (t) => {
+                  if (last) frames.push(t - last);
+                  last = t;
+                  root.querySelectorAll('#bwSeriesList .bw-provider-content').forEach(c => { maxRows = Math.max(maxRows, c.childElementCount); });
+                  if (frames.length >= maxFrames || body.scrollTop + body.clientHeight >= body.scrollHeight - 1) {
+                    host.dataset.bench = JSON.stringify({ frames, maxRows, scrollHeight: body.scrollHeight });
+                    return;
+                  }
+                  body.scrollTop += stepPx;
+                  requestAnimationFrame(step);
+                };
+                requestAnimationFrame(step);
+                return 'started';
+              };
 
-            if (typeof html === 'string') {
-              if (window.__bwLastHTML !== html) {
-                const list = document.getElementById('bwSeriesList');
-                if (list) list.innerHTML = html;
-                window.__bwLastHTML = html;
+              // Navigation ohne Reload (pushState/replaceState/popstate/hashchange): URL-abhängige UI nachziehen bzw.
+              // die Sidebar lokal neu aufbauen, falls die Seite sie entfernt hat (Python füllt die Liste, sobald es
+              // die leere Revision in data-rev sieht). Die Hooks gelten pro Fenster, der Callback pro Sidebar-Instanz.
+              let lastUrl = location.href;
+              window.__bwOnUrlChange = () => {
+                if (!document.getElementById('bingeSidebar')) { bwSidebar(null); return; }
+                if (location.href === lastUrl) return;
+                lastUrl = location.href;
+                updateUIFromCurrentUrl();
+              };
+              if (H.once('sb:history')) {
+                const fire = () => setTimeout(() => { if (window.__bwOnUrlChange) window.__bwOnUrlChange(); }, 0);
+                // Im Content-Script die History der Seite patchen (wrappedJSObject/exportFunction), sonst direkt
+                const pageWin = window.wrappedJSObject || window;
+                ['pushState', 'replaceState'].forEach(name => {
+                  try {
+                    const h = pageWin.history, orig = h[name];
+                    const wrapped = function () { const r = orig.apply(this, arguments); fire(); return r; };
+                    if (window.wrappedJSObject && typeof exportFunction === 'function') exportFunction(wrapped, h, { defineAs: name });
+                    else h[name] = wrapped;
+                  } catch (_) {}
+                });
+                H.on('sb:popstate', window, 'popstate', fire);
+                H.on('sb:hashchange', window, 'hashchange', fire);
               }
             }
 
-            function ensureSidebar(){
-            if (document.getElementById('bingeSidebar')) return;
-                try { localStorage.setItem('bw_need_reinject','1'); } catch(_){}
+            if (payload && window.__bwRenderList) {
+              window.__bwRenderList(payload, rev);
             }
-            const _rs = history.replaceState; history.replaceState = function(){ const r=_rs.apply(this,arguments); setTimeout(ensureSidebar,0); return r; };
-            window.addEventListener('popstate', ensureSidebar);
-            window.addEventListener('hashchange', ensureSidebar);
           } catch(e) { console.error('Sidebar injection failed', e); }
-        })(arguments[0]);
-        """,
-            html_concat,
+        }
+"""
+
+# Content-Script der Sidebar-Extension: baut die Sidebar auf jeder Provider-Seite selbst auf und stellt
+# die Listen-APIs per exportFunction in den Seitenkontext (dort ruft Python sie über execute_script auf)
+SIDEBAR_EXTENSION_BOOT_JS = """
+(function () {
+  const boot = () => {
+    bwSidebar(null);
+    const watch = () => { if (document.body && !document.getElementById('bingeSidebar')) bwSidebar(null); };
+    const mo = new MutationObserver(watch);
+    mo.observe(document.documentElement, { childList: true });
+    if (document.body) mo.observe(document.body, { childList: true });
+  };
+  if (document.body) boot(); else document.addEventListener('DOMContentLoaded', boot, { once: true });
+  window.__bwHookCounts = () => JSON.stringify(window.__bwHooks.all());
+  // Einziger Einstieg für Python (execute_script läuft in der Seiten-Welt): nur mit dem Token der Session,
+  // sonst könnte jedes Seiten-Script eigenes HTML in die Sidebar schieben
+  const names = ['__bwSetList', '__bwRenderList', '__bwApplyPatch', '__bwCatalogResults', '__bwBenchScroll', '__bwHookCounts'];
+  if (typeof exportFunction === 'function') {
+    exportFunction((token, name, a, b) => {
+      if (token !== BW_TOKEN || !names.includes(name)) return 'denied';
+      return typeof window[name] === 'function' ? window[name](a, b) : 'missing';
+    }, window, { defineAs: '__bwCall' });
+  }
+})();
+"""
+# Token, mit dem Python die Sidebar-Funktionen der Extension aufruft (bei --connect-existing aus dem Browser-State)
+_SIDEBAR_TOKEN: Dict[str, str] = {"value": secrets.token_hex(16)}
+
+
+def sidebar_js(body: str) -> str:
+    """Stellt execute_script-Code __bwSb(name, a, b) voran: ruft eine Sidebar-Funktion auf – über die Extension
+    (mit Token) oder direkt, wenn die Sidebar injiziert wurde. 'missing', wenn es sie nicht gibt."""
+    return (
+        "const __bwSb = (name, a, b) => window.__bwCall ? window.__bwCall("
+        + json.dumps(_SIDEBAR_TOKEN["value"])
+        + ", name, a, b) : (typeof window[name] === 'function' ? window[name](a, b) : 'missing');\n"
+        + body
+    )
+
+
+def build_sidebar_extension() -> str:
+    """Packt die Sidebar als unsignierte WebExtension (XPI) für install_addon(temporary=True). Dazu kommt die
+    Video-Bridge als Content-Script in den Frames der Provider und der bekannten Hoster, siehe VIDEO_BRIDGE_JS."""
+    matches = [info["base_url"].rstrip("/") + "/*" for info in STREAMING_PROVIDERS.values()]
+    hosters = [f"https://*.{d}/*" for d in HOSTER_DOMAINS]
+    manifest = {
+        "manifest_version": 2,
+        "name": "BingeWatcher Sidebar",
+        "version": "1.0",
+        "browser_specific_settings": {"gecko": {"id": "sidebar@bingewatcher.local"}},
+        "content_scripts": [
+            {"matches": matches, "js": ["sidebar.js"], "run_at": "document_start", "all_frames": False},
+            {
+                "matches": matches + hosters,
+                "js": ["bridge.js"],
+                "run_at": "document_end",
+                "all_frames": True,
+                "match_about_blank": True,
+            },
+        ],
+    }
+    path = os.path.join(tempfile.gettempdir(), "bingewatcher_sidebar.xpi")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("manifest.json", json.dumps(manifest, indent=2))
+        token = "const BW_TOKEN = " + json.dumps(_SIDEBAR_TOKEN["value"]) + ";\n"
+        z.writestr("sidebar.js", token + SIDEBAR_JS + SIDEBAR_EXTENSION_BOOT_JS)
+        z.writestr("bridge.js", VIDEO_BRIDGE_JS)
+    return path
+
+
+def install_sidebar_extension(driver: webdriver.Firefox) -> bool:
+    try:
+        driver.install_addon(build_sidebar_extension(), temporary=True)
+        logging.info("Sidebar extension installed")
+        return True
+    except Exception as e:
+        logging.warning(f"Sidebar extension could not be installed, falling back to script injection: {e}")
+        return False
+
+
+def inject_sidebar(driver: webdriver.Firefox, db: Dict[str, Dict[str, Any]]) -> bool:
+    """Fallback ohne Extension: Sidebar per execute_script in die aktuelle Seite bringen und füllen."""
+    try:
+        driver.switch_to.default_content()
+        rows = sidebar_rows(db)
+        rev = _SIDEBAR_SENT["rev"] + 1
+        payload = sidebar_payload(rows)
+        driver.execute_script(
+            SIDEBAR_JS + "\nbwSidebar(arguments[0], arguments[1]);",
+            json.dumps(payload),
+            rev,
         )
+        _SIDEBAR_SENT.update(rev=rev, rows=rows, providers=_sidebar_providers(rows))
         return True
     except Exception as e:
         logging.error(f"Sidebar injection failed: {e}")
         return False
 
 
+# === IDLE MODE / DIAGNOSTICS --------------------------- ===
+_METRIC_WARNED: set = set()
+
+
+def metric_unavailable(name: str) -> None:
+    """Einmal pro Lauf melden, dass eine Prozess-Metrik mangels Quelle (weder psutil noch /proc) fehlt –
+    ein beendeter Prozess allein ist kein Grund für eine Warnung."""
+    if name in _METRIC_WARNED or psutil is not None or os.path.isdir("/proc"):
+        return
+    _METRIC_WARNED.add(name)
+    logging.warning(f"Firefox {name} is not measurable without psutil (pip install psutil); related stats stay empty")
+
+
+def _proc_children() -> Dict[int, list]:
+    children: Dict[int, list] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+        except Exception:
+            continue
+    return children
+
+
+def browser_pids(driver) -> list:
+    """PID des Firefox-Hauptprozesses plus aller Kindprozesse (Content-Prozesse)."""
+    try:
+        root = int(driver.capabilities.get("moz:processID") or 0)
+    except Exception:
+        root = 0
+    if not root:
+        return []
+    if psutil is not None:
+        try:
+            return [root] + [c.pid for c in psutil.Process(root).children(recursive=True)]
+        except Exception:
+            return [root]
+    if not os.path.isdir("/proc"):
+        metric_unavailable("process tree")
+        return [root]
+    children = _proc_children()
+    pids, todo = [], [root]
+    while todo:
+        pid = todo.pop()
+        pids.append(pid)
+        todo.extend(children.get(pid, []))
+    return pids
+
+
+def process_cpu_seconds(pids: list) -> Optional[float]:
+    """Summierte CPU-Zeit (user+system) der Prozesse; None, wenn nicht ermittelbar."""
+    if not pids:
+        return None
+    total, known = 0.0, False
+    ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+    for pid in pids:
+        try:
+            if psutil is not None:
+                t = psutil.Process(pid).cpu_times()
+                total += t.user + t.system
+            else:
+                with open(f"/proc/{pid}/stat", "r") as f:
+                    fields = f.read().rsplit(")", 1)[1].split()
+                total += (int(fields[11]) + int(fields[12])) / ticks
+            known = True
+        except Exception:
+            continue
+    if not known:
+        metric_unavailable("CPU time")
+    return total if known else None
+
+
+def process_io_bytes(pids: list) -> Optional[tuple]:
+    """Summierte Platten-I/O (gelesene, geschriebene Bytes) der Prozesse; None, wenn nicht ermittelbar."""
+    read = write = 0
+    known = False
+    for pid in pids:
+        try:
+            if psutil is not None:
+                io = psutil.Process(pid).io_counters()
+                read += io.read_bytes
+                write += io.write_bytes
+            else:
+                with open(f"/proc/{pid}/io", "r") as f:
+                    fields = dict(line.split(":", 1) for line in f if ":" in line)
+                read += int(fields["read_bytes"])
+                write += int(fields["write_bytes"])
+            known = True
+        except Exception:
+            continue
+    if pids and not known:
+        metric_unavailable("disk I/O")
+    return (read, write) if known else None
+
+
+IDLE_STATS: Dict[str, float] = {"wall": 0.0, "py_cpu": 0.0, "ff_cpu": 0.0, "ff_wall": 0.0, "waits": 0}
+_IDLE_MARK: Dict[str, Any] = {}
+
+
+def format_idle_stats(stats: Dict[str, float]) -> str:
+    wall = max(stats["wall"], 1e-6)
+    out = f"{stats['wall']:.0f}s idle, Python {100 * stats['py_cpu'] / wall:.2f}% CPU"
+    if stats["ff_wall"] > 0:
+        out += f", Firefox {100 * stats['ff_cpu'] / stats['ff_wall']:.2f}% CPU"
+    return out
+
+
+def wait_for_page_activity(driver, timeout: float) -> bool:
+    """Blockiert ereignisgesteuert im Top-Dokument, bis der User mit der Seite/Sidebar interagiert
+    oder navigiert wird – oder bis timeout. True = geweckt."""
+    try:
+        driver.switch_to.default_content()
+        return bool(
+            driver.execute_async_script(
+                HOOKS_JS + """
+                const done = arguments[arguments.length - 1];
+                const H = window.__bwHooks;
+                const evs = ['click', 'input', 'change', 'keyup', 'popstate', 'hashchange', 'pagehide', 'storage', 'bw-signal'];
+                let fired = false;
+                const finish = (woke) => {
+                  if (fired) return; fired = true;
+                  evs.forEach(e => H.off('idle:' + e));
+                  H.clear('idle:timeout'); done(woke);
+                };
+                // kurz verzögert, damit die Sidebar-Handler ihre bw_*-Keys vorher schreiben
+                const onEv = () => setTimeout(() => finish(true), 50);
+                evs.forEach(e => H.on('idle:' + e, window, e, onEv, true));
+                H.after('idle:timeout', arguments[0], () => finish(false));
+            """,
+                int(timeout * 1000),
+            )
+        )
+    except Exception:
+        # Dokument wurde entladen (Navigation) → wach
+        return True
+
+
+def idle_wait(driver) -> bool:
+    """Idle-Modus: wartet auf Aktivität und verbucht die CPU-Zeit von Python und Firefox in IDLE_STATS.
+    Solange die Schleife idle bleibt, zählen auch die Durchläufe zwischen zwei Wartephasen mit."""
+    if _IDLE_MARK:
+        pids, py0, ff0, t0 = _IDLE_MARK["pids"], _IDLE_MARK["py"], _IDLE_MARK["ff"], _IDLE_MARK["t"]
+    else:
+        pids = browser_pids(driver)
+        py0, ff0, t0 = time.process_time(), process_cpu_seconds(pids), time.monotonic()
+    woke = wait_for_page_activity(driver, IDLE_WAIT_MAX)
+    py1, ff1, t1 = time.process_time(), process_cpu_seconds(pids), time.monotonic()
+    IDLE_STATS["wall"] += t1 - t0
+    IDLE_STATS["py_cpu"] += py1 - py0
+    IDLE_STATS["waits"] += 1
+    if ff0 is not None and ff1 is not None:
+        IDLE_STATS["ff_cpu"] += max(0.0, ff1 - ff0)
+        IDLE_STATS["ff_wall"] += t1 - t0
+    _IDLE_MARK.clear()
+    if not woke:
+        _IDLE_MARK.update({"pids": pids, "py": py1, "ff": ff1, "t": t1})
+    return woke
+
+
 def clear_nav_lock(driver):
     try:
         driver.switch_to.default_content()
@@ -3460,8 +5774,8 @@ def clear_nav_lock(driver):
             """
             try { localStorage.removeItem('bw_nav_inflight'); } catch(_){}
             try {
-              const b = document.getElementById('bwBody');
-              if (b){ b.style.pointerEvents=''; b.style.opacity=''; }
+              const sb = document.getElementById('bingeSidebar');
+              if (sb) sb.removeAttribute('data-busy');
             } catch(_){}
         """
         )
@@ -3469,231 +5783,985 @@ def clear_nav_lock(driver):
         pass
 
 
-# === MAIN ===
-def main() -> None:
-    global should_quit
-    logging.info("BingeWatcher is starting...")
-    restarts = 0
-    driver: Optional[webdriver.Firefox] = None
-    
+# === MEMORY GOVERNOR --------------------------- ===
+# (Sekunden seit Start, MB, Anlass) – Anlass: "tick" (Health-Check), "episode" (zwischen zwei Folgen), Aktion
+MEMORY_SAMPLES: list = []
+MEMORY_ACTIONS: Dict[str, int] = {"minimize": 0, "recycle": 0}
+
+
+def process_memory_bytes(pids: list) -> Optional[int]:
+    """Speicher der Prozesse: PSS (teilt gemeinsame Seiten auf, kein Doppelzählen), sonst RSS bzw. unter Windows
+    das Working Set (psutil); None, wenn unbekannt."""
+    total, known = 0, False
+    for pid in pids:
+        try:
+            # smaps_rollup ist unter Linux billiger und genauer als psutil.memory_full_info()
+            with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+                pss = next(line for line in f if line.startswith("Pss:"))
+            total += int(pss.split()[1]) * 1024
+            known = True
+            continue
+        except Exception:
+            pass
+        try:
+            if psutil is not None:
+                total += psutil.Process(pid).memory_info().rss
+            else:
+                with open(f"/proc/{pid}/status", "r") as f:
+                    rss = next(line for line in f if line.startswith("VmRSS:"))
+                total += int(rss.split()[1]) * 1024
+            known = True
+        except Exception:
+            continue
+    if pids and not known:
+        metric_unavailable("memory")
+    return total if known else None
+
+
+def sample_memory(driver, reason: str = "tick") -> Optional[float]:
+    """Misst den Firefox-Speicher lokal (/proc bzw. psutil, kein Round-Trip in die Seite) und merkt das Sample."""
+    used = process_memory_bytes(browser_pids(driver))
+    if used is None:
+        return None
+    mb = used / (1024 * 1024)
+    t = time.perf_counter() - _STARTUP_T0
+    if len(MEMORY_SAMPLES) < 20000:
+        MEMORY_SAMPLES.append((t, mb, reason))
+    if MEMORY_LOG:
+        try:
+            with open(MEMORY_LOG, "a", encoding="utf-8") as f:
+                f.write(f"{time.time():.0f},{t:.1f},{mb:.1f},{reason}\n")
+        except Exception:
+            pass
+    return mb
+
+
+def minimize_memory(driver) -> bool:
+    """Wie 'Minimize memory usage' in about:memory (GC/CC + Caches leeren in allen Prozessen).
+    Braucht den Chrome-Kontext von Marionette; neuere Firefox-Versionen erlauben ihn nur mit System-Zugriff."""
+    try:
+        with driver.context(driver.CONTEXT_CHROME):
+            driver.execute_async_script(
+                """
+                const done = arguments[arguments.length - 1];
+                const mgr = Cc['@mozilla.org/memory-reporter-manager;1'].getService(Ci.nsIMemoryReporterManager);
+                mgr.minimizeMemoryUsage(() => done(true));
+            """
+            )
+        return True
+    except Exception as e:
+        logging.debug(f"Minimize memory unavailable: {e}")
+        return False
+
+
+def recycle_tab(driver) -> bool:
+    """Ersetzt den aktuellen Tab durch einen frischen: Player-Instanzen, MSE-Puffer und alle Listener der
+    Seite verschwinden mit dem alten Content-Prozess. Nur zwischen zwei Folgen aufrufen (danach wird navigiert)."""
+    try:
+        old = driver.current_window_handle
+        driver.switch_to.new_window("tab")
+        new = driver.current_window_handle
+        driver.switch_to.window(old)
+        driver.close()
+        driver.switch_to.window(new)
+        claim_main_window(driver, new)
+        return True
+    except Exception as e:
+        logging.warning(f"Tab recycle failed: {e}")
+        try:
+            driver.switch_to.window(driver.window_handles[-1])
+        except Exception:
+            pass
+        return False
+
+
+def govern_memory(driver) -> Optional[str]:
+    """Sicherer Punkt zwischen zwei Folgen: über MEM_SOFT_MB Minimize-Memory, über MEM_HARD_MB (auch danach
+    noch) den Tab recyceln. Gibt die ausgeführte Aktion zurück."""
+    if MEM_SOFT_MB <= 0 and MEM_HARD_MB <= 0:
+        return None
+    before = sample_memory(driver, "episode")
+    if before is None:
+        return None
+    action, now = None, before
+    hard = MEM_HARD_MB > 0 and before >= MEM_HARD_MB
+    if not hard and MEM_SOFT_MB > 0 and before >= MEM_SOFT_MB:
+        if minimize_memory(driver):
+            action = "minimize"
+            MEMORY_ACTIONS["minimize"] += 1
+            now = sample_memory(driver, action) or before
+        else:
+            hard = True  # Minimize nicht verfügbar → gleich die härtere Stufe
+    if hard and recycle_tab(driver):
+        action = "recycle"
+        MEMORY_ACTIONS["recycle"] += 1
+        time.sleep(0.5)  # alter Content-Prozess beendet sich asynchron
+        now = sample_memory(driver, action) or now
+    if action:
+        logging.info(f"Memory governor: {action} at {before:.0f} MB → {now:.0f} MB")
+    return action
+
+
+def format_memory_stats(samples: list, actions: Dict[str, int], width: int = 48) -> str:
+    """Verlauf als Sparkline (gleich breite Zeit-Buckets, Maximum je Bucket) plus Eckwerte."""
+    mbs = [mb for _, mb, _ in samples]
+    t_end = samples[-1][0]
+    t0 = samples[0][0]
+    span = max(t_end - t0, 1e-9)
+    buckets = [0.0] * width
+    for t, mb, _ in samples:
+        i = min(width - 1, int((t - t0) / span * width))
+        buckets[i] = max(buckets[i], mb)
+    lo, hi = min(mbs), max(mbs)
+    bars = "▁▂▃▄▅▆▇█"
+    last = buckets[0]
+    line = ""
+    for b in buckets:
+        last = b or last
+        line += bars[int((last - lo) / (hi - lo) * (len(bars) - 1))] if hi > lo else bars[0]
+    return (
+        f"start {mbs[0]:.0f} MB, peak {hi:.0f} MB, end {mbs[-1]:.0f} MB over {(t_end - t0) / 3600:.1f} h "
+        f"({len(samples)} samples; {actions['minimize']} minimize, {actions['recycle']} recycle) {line}"
+    )
+
+
+# === WINDOW REAPER --------------------------- ===
+# session_id → {"main": Wiedergabe-Tab}
+_WINDOWS: Dict[str, Dict[str, Any]] = {}
+REAPED: Dict[str, float] = {"runs": 0, "windows": 0, "mb": 0.0}
+
+
+def _window_slot(driver) -> Dict[str, Any]:
+    return _WINDOWS.setdefault(driver.session_id, {"main": None})
+
+
+def claim_main_window(driver, handle: Optional[str] = None) -> Optional[str]:
+    """Merkt den Tab, in dem gespielt wird (Standard: der aktuelle). Selenium wechselt nie von selbst in Popups,
+    der aktuelle Handle ist also der richtige, solange niemand anders umschaltet."""
+    try:
+        handle = handle or driver.current_window_handle
+    except Exception:
+        return None
+    _window_slot(driver)["main"] = handle
+    return handle
+
+
+def reap_windows(driver) -> int:
+    """Schließt alle Fenster/Tabs außer dem Wiedergabe-Tab, wechselt zurück in den Wiedergabe-Tab
+    (Marionette holt ihn dabei auch in den Vordergrund) und loggt, wie viel Speicher frei wurde.
+    Normalfall (nur ein Handle) kostet einen einzigen Round-Trip."""
+    if not REAP_WINDOWS:
+        return 0
+    try:
+        handles = driver.window_handles
+    except Exception:
+        return 0
+    slot = _window_slot(driver)
+    main = slot["main"]
+    if main not in handles:
+        # Noch nie gesetzt oder der Tab ist weg (recycelt/geschlossen): aktuellen bzw. ältesten übernehmen
+        try:
+            main = driver.current_window_handle
+        except Exception:
+            main = None
+        if main not in handles:
+            main = handles[0] if handles else None
+        slot["main"] = main
+    strays = [h for h in handles if h != main]
+    if not strays:
+        return 0
+    pids = browser_pids(driver)
+    before = process_memory_bytes(pids)
+    closed = 0
+    for handle in strays:
+        try:
+            driver.switch_to.window(handle)
+            driver.close()
+            closed += 1
+        except Exception as e:
+            logging.debug(f"Closing window {handle} failed: {e}")
     try:
-        driver = start_browser()
-        if not safe_navigate(driver, START_URL):
-            raise BingeWatcherError("Home page could not be loaded")
+        driver.switch_to.window(main)
+        driver.switch_to.default_content()
+    except Exception as e:
+        logging.warning(f"Returning to the playback tab failed: {e}")
+    freed = ""
+    if before is not None:
+        time.sleep(0.5)  # Content-Prozesse beenden sich asynchron
+        after = process_memory_bytes(browser_pids(driver))
+        if after is not None:
+            mb = max(0.0, (before - after) / (1024 * 1024))
+            REAPED["mb"] += mb
+            freed = f", freed {mb:.0f} MB"
+    REAPED["runs"] += 1
+    REAPED["windows"] += closed
+    logging.info(f"Window reaper: closed {closed}/{len(strays)} stray windows{freed}")
+    return closed
+
+
+def format_reap_stats(stats: Dict[str, float]) -> str:
+    return f"{stats['windows']:.0f} stray windows closed in {stats['runs']:.0f} passes, {stats['mb']:.0f} MB reclaimed"
+
+
+# === WATCHDOG --------------------------- ===
+# timeouts: Befehle über ihrer Frist; resets/reloads/recoveries: ausgeführte Eskalationsstufen;
+# stalls: (Schleife, Sekunden) für jede Lücke zwischen zwei Herzschlägen, die länger als CALL_DEADLINE war
+WATCHDOG_STATS: Dict[str, Any] = {"timeouts": 0, "resets": 0, "reloads": 0, "recoveries": 0, "stalls": []}
+# Zustand der Befehle: steckt der Driver gerade in einem Frame, wie viele Fristen in Folge gerissen,
+# läuft gerade eine Eskalation (deren eigene Befehle eskalieren nicht erneut)
+_CALLS: Dict[str, Any] = {"frame": False, "streak": 0, "busy": False}
+
+
+def apply_call_deadlines(driver) -> None:
+    """Setzt die Fristen der Session: execute_(async_)script bricht Firefox selbst nach dem Script-Timeout ab,
+    driver.get nach dem Page-Load-Timeout. Ab Selenium 4.26 bekommt auch die HTTP-Verbindung zum geckodriver
+    eine Frist; ältere Versionen warten dort unbegrenzt (dann greift nur der Watchdog-Thread)."""
+    script = max(CALL_DEADLINE, IDLE_WAIT_MAX + 5)
+    try:
+        driver.set_script_timeout(script)
+        driver.set_page_load_timeout(PAGE_LOAD_DEADLINE)
+    except Exception as e:
+        logging.debug(f"Setting driver timeouts failed: {e}")
+    cfg = getattr(driver.command_executor, "_client_config", None)
+    if cfg is not None:
+        try:
+            cfg.timeout = max(script, PAGE_LOAD_DEADLINE) + 15
+        except Exception:
+            pass
+
+
+def _is_call_timeout(command: str, e: Exception) -> bool:
+    """Script-/Befehls-Timeout (W3C "script timeout") oder HTTP-Timeout zum geckodriver. Selenium bildet
+    "script timeout" und den Page-Load-"timeout" auf dieselbe TimeoutException ab; Page-Load-Timeouts
+    (Navigation, "Timeout loading page ...") zählen nicht – safe_navigate versucht es selbst erneut."""
+    if isinstance(e, TimeoutException):
+        return command != "get" and "loading page" not in str(getattr(e, "msg", "") or "").lower()
+    return isinstance(e, socket.timeout) or type(e).__name__ == "ReadTimeoutError"
+
+
+def guard_driver(driver) -> None:
+    """Hängt sich (wie count_frame_switches) vor jeden Befehl des Drivers: Fristen setzen, Frame-Kontext
+    mitführen und bei einer gerissenen Frist eskalieren. Die Exception geht danach unverändert an den Aufrufer."""
+    apply_call_deadlines(driver)
+    execute = driver.execute
+
+    def guarded(command, params=None):
+        try:
+            res = execute(command, params)
+        except Exception as e:
+            if not _CALLS["busy"] and _is_call_timeout(command, e):
+                escalate_timeout(driver, command, e)
+            raise
+        if not _CALLS["busy"]:
+            _CALLS["streak"] = 0
+        if command == "switchToFrame":
+            _CALLS["frame"] = bool(params and params.get("id") is not None)
+        return res
+
+    driver.execute = guarded
+
+
+def reload_player_frame(driver) -> bool:
+    """Lädt den größten iframe (Player) aus dem Top-Dokument neu; mit Fission läuft er in eigenem Prozess,
+    das geht also auch, wenn der Frame selbst hängt."""
+    return bool(
+        driver.execute_script(
+            """
+            let best = null, area = 0;
+            for (const f of document.querySelectorAll('iframe')) {
+              const r = f.getBoundingClientRect();
+              if (r.width * r.height > area && f.src && !f.src.startsWith('about:')) { best = f; area = r.width * r.height; }
+            }
+            if (!best) return false;
+            best.src = best.src;
+            return true;
+        """
+        )
+    )
+
+
+def recover_browser(driver, why: str) -> None:
+    """Letzte Stufe: Browser-Prozesse beenden. Der nächste Befehl scheitert mit einem Session-Fehler und die
+    Hauptschleife übernimmt wie nach einem Absturz (Reserve-Browser bzw. Neustart, Folge fortsetzen)."""
+    WATCHDOG_STATS["recoveries"] += 1
+    logging.error(f"Watchdog: {why} – killing the browser ({kill_browser(driver)} processes) to recover")
+
 
+def escalate_timeout(driver, command: str, e: Exception) -> None:
+    """Eskalation nach einer gerissenen Frist: Firefox hat das Script bereits abgebrochen → zurück ins
+    Top-Dokument; hing der Befehl im Frame (oder wiederholt) → Player-Frame neu laden und Bridge neu
+    verbinden; dreimal in Folge bzw. Browser reagiert nicht mehr → Browser-Failover."""
+    WATCHDOG_STATS["timeouts"] += 1
+    _CALLS["streak"] += 1
+    streak, in_frame = _CALLS["streak"], _CALLS["frame"]
+    logging.warning(f"Watchdog: {command} missed its deadline ({type(e).__name__}, {streak} in a row)")
+    _CALLS["busy"] = True
+    try:
+        driver.switch_to.default_content()
+        _CALLS["frame"] = False
+        WATCHDOG_STATS["resets"] += 1
+        if in_frame or streak >= 2:
+            if reload_player_frame(driver):
+                WATCHDOG_STATS["reloads"] += 1
+                time.sleep(1.0)
+                attach_video_bridge(driver)
+        if streak >= 3 or not is_browser_responsive(driver):
+            recover_browser(driver, f"{streak} deadlines missed in a row")
+    except Exception as err:
+        recover_browser(driver, f"escalation failed ({type(err).__name__})")
+    finally:
+        _CALLS["busy"] = False
+
+
+class Watchdog:
+    """Herzschläge der Haupt- und der Playback-Schleife, überwacht aus einem eigenen Thread.
+    Einen blockierten Befehl kann man von außen nicht abbrechen (geckodriver arbeitet die Befehle einer Session
+    nacheinander ab), daher: nach CALL_DEADLINE melden, wo die Schleife steckt; nach STALL_AFTER den Browser
+    beenden, damit der blockierte Befehl zurückkehrt und die Hauptschleife den Failover macht."""
+
+    def __init__(self):
+        self._beat: Optional[tuple] = None  # (Schleife, monotonic, driver, Thread-ID)
+        self._handled: Dict[str, Any] = {"warn": None, "kill": None}
+        self._thread: Optional[threading.Thread] = None
+
+    def _close_gap(self) -> None:
+        last = self._beat
+        if last:
+            gap = time.monotonic() - last[1]
+            if gap > CALL_DEADLINE and len(WATCHDOG_STATS["stalls"]) < 10000:
+                WATCHDOG_STATS["stalls"].append((last[0], round(gap, 1)))
+
+    def beat(self, loop: str, driver) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return  # z. B. safe_navigate im Standby-Thread
+        self._close_gap()
+        self._beat = (loop, time.monotonic(), driver, threading.get_ident())
+
+    def pause(self) -> None:
+        """Vor absichtlich langen Phasen ohne Schleife (Browser-Neustart): Lücke verbuchen, Überwachung ruht."""
+        self._close_gap()
+        self._beat = None
+
+    def start(self) -> None:
+        if STALL_AFTER > 0 and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="bw-watchdog", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        # Ein einzelner Befehl darf bis zu seinem Page-Load-Timeout laufen, bevor der Browser beendet wird
+        limit = max(STALL_AFTER, PAGE_LOAD_DEADLINE + CALL_DEADLINE)
         while not should_quit:
+            time.sleep(2)
+            beat = self._beat
+            if not beat:
+                continue
+            loop, t, driver, ident = beat
+            age = time.monotonic() - t
+            if age > CALL_DEADLINE and self._handled["warn"] is not beat:
+                self._handled["warn"] = beat
+                frame = sys._current_frames().get(ident)
+                where = traceback.extract_stack(frame)[-1] if frame else None
+                logging.warning(
+                    f"Watchdog: {loop} loop stuck for {age:.0f}s"
+                    + (f" in {where.name} (line {where.lineno})" if where else "")
+                )
+            if age > limit and self._handled["kill"] is not beat:
+                self._handled["kill"] = beat
+                recover_browser(driver, f"{loop} loop stuck for {age:.0f}s")
+
+
+WATCHDOG = Watchdog()
+
+
+def format_watchdog_stats(stats: Dict[str, Any]) -> str:
+    gaps = sorted(g for _, g in stats["stalls"])
+    out = (
+        f"{stats['timeouts']} missed deadlines ({stats['resets']} context resets, {stats['reloads']} frame reloads), "
+        f"{stats['recoveries']} browser recoveries, {len(gaps)} stalls"
+    )
+    if gaps:
+        out += f" (median {gaps[len(gaps) // 2]:.0f}s, max {gaps[-1]:.0f}s)"
+    return out
+
+
+# === DRIVER ACTOR --------------------------- ===
+class DriverActor:
+    """WebDriver ist nicht thread-safe, und der Frame-Kontext ist Zustand der Session. Deshalb gehört der Driver
+    genau einem Thread: der Haupt-/Playback-Schleife, die ohnehin fast alle Befehle absetzt. Hintergrund-Threads
+    reichen Aufträge (fn(driver)) ein und warten auf ein Future; die Schleife arbeitet sie in serve() ab, das
+    an ihren Wartestellen statt time.sleep läuft – immer im Top-Dokument, jeder Auftrag am Stück.
+    Kleinere priority zuerst; gleicher key, solange noch in der Queue → gleiches Future (identische Lesezugriffe
+    werden zusammengelegt)."""
+
+    def __init__(self):
+        self._cv = threading.Condition()
+        self._queue: list = []  # Heap: (priority, seq, key, fn, future, eingereiht)
+        self._pending: Dict[Any, Future] = {}
+        self._seq = 0
+        self._closed = False
+        self.stats: Dict[str, float] = {"jobs": 0, "coalesced": 0, "failed": 0, "wait": 0.0, "max_wait": 0.0}
+
+    def submit(self, fn, priority: int = 5, key: Any = None) -> Future:
+        with self._cv:
+            if key is not None and key in self._pending:
+                self.stats["coalesced"] += 1
+                return self._pending[key]
+            fut: Future = Future()
+            if self._closed:
+                fut.cancel()
+                return fut
+            self._seq += 1
+            heapq.heappush(self._queue, (priority, self._seq, key, fn, fut, time.monotonic()))
+            if key is not None:
+                self._pending[key] = fut
+            self._cv.notify()
+            return fut
+
+    def call(self, fn, priority: int = 5, key: Any = None, timeout: Optional[float] = None) -> Any:
+        """Einreichen und auf das Ergebnis warten. Nicht vom Besitzer-Thread aus (der würde auf sich selbst warten)."""
+        if threading.current_thread() is threading.main_thread():
+            raise RuntimeError("DriverActor.call from the owner thread – use the driver directly")
+        return self.submit(fn, priority, key).result(timeout if timeout is not None else CALL_DEADLINE * 4)
+
+    def serve(self, driver, timeout: float = 0.0) -> int:
+        """Nur vom Besitzer-Thread: wartet bis zu timeout Sekunden und arbeitet dabei eingehende Aufträge ab.
+        timeout=0 leert nur die Queue. Gibt die Anzahl ausgeführter Aufträge zurück."""
+        end = time.monotonic() + timeout
+        done = 0
+        while True:
+            with self._cv:
+                while not self._queue:
+                    left = end - time.monotonic()
+                    if left <= 0 or self._closed:
+                        return done
+                    self._cv.wait(left)
+                _, _, key, fn, fut, queued = heapq.heappop(self._queue)
+                if key is not None:
+                    self._pending.pop(key, None)
+            if not fut.set_running_or_notify_cancel():
+                continue
+            wait = time.monotonic() - queued
+            self.stats["wait"] += wait
+            self.stats["max_wait"] = max(self.stats["max_wait"], wait)
+            self.stats["jobs"] += 1
+            done += 1
             try:
-                driver.switch_to.default_content()
-                db = load_progress()
+                if _CALLS["frame"]:
+                    driver.switch_to.default_content()
+                fut.set_result(fn(driver))
+            except Exception as e:
+                self.stats["failed"] += 1
+                fut.set_exception(e)
+            except BaseException as e:  # Strg+C: Wartende nicht hängen lassen, aber weiterreichen
+                fut.set_exception(e)
+                raise
+            finally:
+                # Auftrag hat in einen Frame gewechselt → Schleife bekommt den Driver im Top-Dokument zurück
+                if _CALLS["frame"]:
+                    try:
+                        driver.switch_to.default_content()
+                    except Exception:
+                        pass
 
-                if not driver.execute_script(
-                    "return !!document.getElementById('bingeSidebar');"
-                ):
-                    settings = get_settings(driver)
-                    inject_sidebar(driver, load_progress())
-                    sync_settings_to_localstorage(driver)
+    def close(self) -> None:
+        """Beim Beenden: offene Aufträge abbrechen, damit kein Hintergrund-Thread ewig wartet."""
+        with self._cv:
+            self._closed = True
+            for *_, fut, _ in self._queue:
+                fut.cancel()
+            self._queue.clear()
+            self._pending.clear()
+            self._cv.notify_all()
 
-                # Quit via localStorage
-                try:
-                    qls = driver.execute_script(
-                        "try { return localStorage.getItem('bw_quit'); } catch(e) { return null; }"
-                    )
-                    if qls == "1":
-                        driver.execute_script(
-                            "try { localStorage.removeItem('bw_quit'); } catch(e) {}"
-                        )
-                        should_quit = True
-                        break
-                except Exception:
-                    pass
 
-                # Quit via cookie
-                if get_cookie(driver, "bw_quit") == "1":
-                    delete_cookie(driver, "bw_quit")
-                    should_quit = True
-                    break
+DRIVER_ACTOR = DriverActor()
 
-                # Handle deletion
-                try:
-                    tod = driver.execute_script(
-                        """
-                        let s = localStorage.getItem('bw_seriesToDelete');
-                        if (s) localStorage.removeItem('bw_seriesToDelete');
-                        return s;
-                        """
-                    )
-                    if tod:
-                        handle_list_item_deletion(str(tod))
-                        settings = get_settings(driver)
-                        inject_sidebar(driver, load_progress())
-                        sync_settings_to_localstorage(driver)
-                        html = build_items_html(load_progress(), settings)
-                        driver.execute_script(
-                            "if (window.__bwSetList){window.__bwSetList(arguments[0]);}",
-                            html,
-                        )
-                        continue
-                except Exception:
-                    pass
 
-                try:
-                    need = driver.execute_script(
-                        """
-                        let v = localStorage.getItem('bw_need_reinject');
-                        if (v) localStorage.removeItem('bw_need_reinject');
-                        return v;
-                    """
-                    )
-                    if need:
-                        settings = get_settings(driver)
-                        inject_sidebar(driver, load_progress())
-                        sync_settings_to_localstorage(driver)
-                        html = build_items_html(load_progress(), settings)
-                        driver.execute_script(
-                            "if (window.__bwSetList){window.__bwSetList(arguments[0]);}",
-                            html,
-                        )
-                except Exception:
-                    pass
+def format_actor_stats(stats: Dict[str, float]) -> str:
+    return (
+        f"{stats['jobs']:.0f} jobs ({stats['coalesced']:.0f} coalesced reads, {stats['failed']:.0f} failed), "
+        f"queue wait avg {1000 * stats['wait'] / max(stats['jobs'], 1):.0f} ms, max {1000 * stats['max_wait']:.0f} ms"
+    )
 
-                # Handle UI update needed (from settings panel save)
-                try:
-                    ui_update_needed = driver.execute_script(
-                        """
-                        let r = localStorage.getItem('bw_ui_update_needed');
-                        if (r) localStorage.removeItem('bw_ui_update_needed');
-                        return r;
-                    """
-                    )
-                    if ui_update_needed:
-                        # UI sofort aktualisieren, um neue Eingabefelder anzuzeigen/verstecken
-                        try:
-                            html = build_items_html(load_progress(), get_settings(driver))
-                            driver.execute_script(
-                                "if (window.__bwSetList){window.__bwSetList(arguments[0]);}",
-                                html,
-                            )
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
 
-                # Handle settings updates (from settings panel)
-                try:
-                    upd = read_localstorage_value(driver, "bw_settings_update")
-                    if upd:
-                        data = json.loads(upd)
-                        save_settings_file(data)
+# === BENCHMARKS (BW_BENCH=1) --------------------------- ===
+def _percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
 
-                        try:
-                            driver.execute_script(
-                                "localStorage.setItem('bw_settings', arguments[0]);",
-                                json.dumps(load_settings_file()),
-                            )
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
 
-                # Handle intro start updates (from sidebar input) – normalisieren + live anwenden
-                try:
-                    upd = read_localstorage_value(driver, "bw_intro_start_update")
-                    if upd:
-                        data = json.loads(upd)
-                        ser_raw = data.get("series", "")
-                        secs_raw = data.get("seconds", 0)
-                        ser = norm_series_key(ser_raw)
-                        try:
-                            secs = max(0, int(float(secs_raw)))
-                        except Exception:
-                            secs = 0
+def _bench_library(count: int) -> Dict[str, Dict[str, Any]]:
+    now = time.time()
+    return {
+        f"Benchmark Serie {i:05d}": {
+            "season": 1 + i % 9,
+            "episode": 1 + i % 24,
+            "position": i % 1500,
+            "timestamp": now - i,
+            "provider": "s.to" if i % 4 else "aniworld.to",
+        }
+        for i in range(count)
+    }
 
-                        if ser:
-                            # Get current end time to preserve it
-                            current_end = get_intro_skip_end_seconds(ser)
-                            set_intro_skip_seconds(ser, secs, current_end)
 
-                            # UI sofort aktualisieren
-                            html = build_items_html(load_progress(), get_settings(driver))
-                            driver.execute_script(
-                                "if (window.__bwSetList){window.__bwSetList(arguments[0]);}",
-                                html,
-                            )
-                except Exception:
-                    pass
+def bench_sidebar_payload(driver: webdriver.Firefox, count: int = 10000) -> Optional[Dict[str, Any]]:
+    """Misst Payload-Größe (Voll-Update und Ein-Zeilen-Patch) und die Apply-Zeit im Browser."""
+    lib = _bench_library(count)
+    rows = sidebar_rows(lib)
+    payload = sidebar_payload(rows)
+    first = next(iter(lib))
+    changed = dict(rows)
+    changed[first] = sidebar_rows({first: dict(lib[first], position=lib[first]["position"] + 5)})[first]
+    upserts, removed = diff_sidebar_rows(rows, changed)
+    patch = {"base": -1, "rev": -2, "upserts": upserts, "removed": removed}
+    payload_json, patch_json = json.dumps(payload), json.dumps(patch)
+    result = {
+        "rows": count,
+        "full_bytes": len(payload_json),
+        "patch_bytes": len(patch_json),
+        "row_bytes": sum(len(r[2]) for r in rows.values()) / max(1, count),
+    }
+    try:
+        driver.switch_to.default_content()
+        full_ms, patch_ms = driver.execute_script(
+            sidebar_js(
+                """
+            let t = performance.now();
+            if (__bwSb('__bwRenderList', arguments[0], -1) === 'missing') return [null, null];
+            const full = performance.now() - t;
+            t = performance.now();
+            __bwSb('__bwApplyPatch', arguments[1]);
+            return [full, performance.now() - t];
+            """
+            ),
+            payload_json,
+            patch_json,
+        )
+        result["full_apply_ms"] = full_ms
+        result["patch_apply_ms"] = patch_ms
+    except Exception as e:
+        logging.warning(f"[bench] sidebar payload failed: {e}")
+    finally:
+        refresh_sidebar(driver, force=True)
+    return result
 
-                # Handle intro end updates (from sidebar input) – normalisieren + live anwenden
-                try:
-                    upd = read_localstorage_value(driver, "bw_intro_end_update")
-                    if upd:
-                        data = json.loads(upd)
-                        ser_raw = data.get("series", "")
-                        secs_raw = data.get("seconds", 0)
-                        ser = norm_series_key(ser_raw)
-                        try:
-                            secs = max(0, int(float(secs_raw)))
-                        except Exception:
-                            secs = 0
 
-                        if ser:
-                            # Get current start time to preserve it
-                            current_start = get_intro_skip_seconds(ser)
-                            set_intro_skip_seconds(ser, current_start, secs)
+def bench_sidebar_scroll(driver: webdriver.Firefox, count: int = 10000, step_px: int = 240) -> Optional[Dict[str, Any]]:
+    """Lädt `count` synthetische Serien in die Sidebar, scrollt sie Frame für Frame durch und misst
+    Frame-Zeiten sowie die Zahl gleichzeitig materialisierter Zeilen."""
+    fake = _bench_library(count)
+    try:
+        driver.switch_to.default_content()
+        t0 = time.perf_counter()
+        driver.execute_script(
+            sidebar_js("return __bwSb('__bwRenderList', arguments[0], null);"),
+            json.dumps(sidebar_payload(sidebar_rows(fake))),
+        )
+        render_ms = (time.perf_counter() - t0) * 1000
+        # Die Liste liegt im geschlossenen Shadow-Root: Scrollen übernimmt der Hook der Sidebar,
+        # das Ergebnis kommt über data-bench am Host zurück
+        started = driver.execute_script(
+            sidebar_js("return __bwSb('__bwBenchScroll', arguments[0], arguments[1]);"),
+            step_px,
+            600,
+        )
+        if started != "started":
+            return None
+        res = driver.execute_async_script(
+            """
+            const done = arguments[arguments.length - 1];
+            const poll = () => {
+              const sb = document.getElementById('bingeSidebar');
+              const r = sb && sb.dataset.bench;
+              if (!sb) { done(null); return; }
+              if (r) { delete sb.dataset.bench; done(JSON.parse(r)); return; }
+              setTimeout(poll, 50);
+            };
+            poll();
+            """
+        )
+    except Exception as e:
+        logging.warning(f"[bench] sidebar scroll failed: {e}")
+        return None
+    finally:
+        # Seite hat jetzt Fake-Daten → Revision verwerfen, echte Liste komplett neu setzen
+        refresh_sidebar(driver, force=True)
 
-                            # UI sofort aktualisieren
-                            html = build_items_html(load_progress(), get_settings(driver))
-                            driver.execute_script(
-                                "if (window.__bwSetList){window.__bwSetList(arguments[0]);}",
-                                html,
-                            )
-                except Exception:
-                    pass
+    if not res:
+        return None
+    frames = [float(f) for f in res.get("frames") or []]
+    return {
+        "rows": count,
+        "render_ms": render_ms,
+        "frames": len(frames),
+        "frame_avg_ms": sum(frames) / len(frames) if frames else 0.0,
+        "frame_p95_ms": _percentile(frames, 95),
+        "frame_max_ms": max(frames) if frames else 0.0,
+        "slow_frames": sum(1 for f in frames if f > 1000 / 60 * 1.5),
+        "dom_rows": int(res.get("maxRows") or 0),
+    }
 
-                # Handle end screen updates (from sidebar input) – normalisieren + live anwenden
-                try:
-                    upd = read_localstorage_value(driver, "bw_end_update")
-                    if upd:
-                        data = json.loads(upd)
-                        ser_raw = data.get("series", "")
-                        secs_raw = data.get("seconds", 0)
-                        ser = norm_series_key(ser_raw)
-                        try:
-                            secs = max(0, int(float(secs_raw)))
-                        except Exception:
-                            secs = 0
 
-                        if ser:
-                            set_end_skip_seconds(ser, secs)
+def bench_page_impact(driver: webdriver.Firefox, nodes: int = 4000, frames: int = 120) -> Optional[Dict[str, Any]]:
+    """Busy-Fixture in der aktuellen Seite (viele Knoten, DOM-Mutationen und seitenweite Style-Invalidierung
+    pro Frame) jeweils mit sichtbarer und ausgeblendeter Sidebar: Frame-Zeiten, lange Frames (> 50 ms)
+    und die Dauer der erzwungenen Style-Neuberechnung."""
+    try:
+        driver.switch_to.default_content()
+        res = driver.execute_async_script(
+            """
+            const done = arguments[arguments.length - 1];
+            const nodes = arguments[0], frames = arguments[1];
+            const sb = document.getElementById('bingeSidebar');
+            const css = document.createElement('style');
+            css.textContent = '.bwfx-flip * { outline-color: rgb(1,1,1); } .bwfx.on { color: rgb(2,2,2); }';
+            document.head.appendChild(css);
+            const fx = document.createElement('div');
+            fx.style.cssText = 'position:absolute;left:0;top:0;width:100%;opacity:.01;pointer-events:none;';
+            const cells = [];
+            for (let i = 0; i < nodes; i++) {
+              const c = document.createElement('span');
+              c.className = 'bwfx c' + (i % 7);
+              c.textContent = 'item ' + i;
+              fx.appendChild(c); cells.push(c);
+            }
+            document.body.appendChild(fx);
+            const run = (cb) => {
+              const frameTimes = [], recalc = [];
+              let last = 0, n = 0;
+              const step = (t) => {
+                if (last) frameTimes.push(t - last);
+                last = t;
+                for (let k = 0; k < 200; k++) {
+                  const c = cells[(n * 200 + k) % cells.length];
+                  c.textContent = 'item ' + n + '-' + k;
+                  c.classList.toggle('on');
+                }
+                const t0 = performance.now();
+                document.documentElement.classList.toggle('bwfx-flip');
+                void getComputedStyle(cells[n % cells.length]).outlineColor;
+                void document.body.offsetHeight;
+                recalc.push(performance.now() - t0);
+                if (++n >= frames) { cb({ frames: frameTimes, recalc }); return; }
+                requestAnimationFrame(step);
+              };
+              requestAnimationFrame(step);
+            };
+            const prev = sb ? sb.style.display : '';
+            run(withSb => {
+              if (sb) sb.style.display = 'none';
+              run(withoutSb => {
+                if (sb) sb.style.display = prev;
+                fx.remove(); css.remove();
+                document.documentElement.classList.remove('bwfx-flip');
+                done({ sidebar: !!sb, with: withSb, without: withoutSb });
+              });
+            });
+            """,
+            nodes,
+            frames,
+        )
+    except Exception as e:
+        logging.warning(f"[bench] page impact failed: {e}")
+        return None
+    if not res:
+        return None
+
+    def summary(run: Dict[str, Any]) -> Dict[str, float]:
+        ft = [float(f) for f in run.get("frames") or []]
+        rc = [float(r) for r in run.get("recalc") or []]
+        return {
+            "frame_avg_ms": sum(ft) / len(ft) if ft else 0.0,
+            "frame_p95_ms": _percentile(ft, 95),
+            "long_frames": sum(1 for f in ft if f > 50),
+            "recalc_avg_ms": sum(rc) / len(rc) if rc else 0.0,
+            "recalc_p95_ms": _percentile(rc, 95),
+        }
 
-                            # UI sofort aktualisieren
-                            html = build_items_html(load_progress(), get_settings(driver))
-                            driver.execute_script(
-                                "if (window.__bwSetList){window.__bwSetList(arguments[0]);}",
-                                html,
-                            )
+    return {
+        "nodes": nodes,
+        "sidebar": bool(res.get("sidebar")),
+        "with": summary(res.get("with") or {}),
+        "without": summary(res.get("without") or {}),
+    }
+
+
+def bench_profile_launch(runs: int = 2) -> Dict[str, Dict[str, float]]:
+    """Startzeit und Platten-I/O mit vollem Profil (Selenium kopiert + zippt es) gegen die schlanke RAM-Kopie.
+    Startet dafür eigene headless Firefox-Instanzen; I/O = Python (Vorbereitung) + Firefox bis kurz nach dem Start."""
+    out: Dict[str, Dict[str, float]] = {}
+    for mode in ("full", "slim"):
+        launch, prepared, io_read, io_write = [], [], [], []
+        for _ in range(runs):
+            before = process_io_bytes([os.getpid()]) or (0, 0)
+            t0 = time.perf_counter()
+            work = clone_profile() if mode == "slim" else None
+            driver = None
+            try:
+                options = webdriver.FirefoxOptions()
+                options.add_argument("-headless")
+                apply_profile(options, work)
+                driver = webdriver.Firefox(service=Service(executable_path=GECKO_DRIVER_PATH), options=options)
+                driver.get("about:blank")
+                launch.append(time.perf_counter() - t0)
+                prepared.append(dir_size(work or PROFILE_DIR)[0])
+                after = process_io_bytes([os.getpid()]) or (0, 0)
+                ff = process_io_bytes(browser_pids(driver)) or (0, 0)
+                io_read.append(after[0] - before[0] + ff[0])
+                io_write.append(after[1] - before[1] + ff[1])
+            except Exception as e:
+                logging.debug(f"Profile bench ({mode}) failed: {e}")
+            finally:
+                try:
+                    if driver:
+                        driver.quit()
                 except Exception:
                     pass
+                release_profile(work, sync=False)
+        if launch:
+            out[mode] = {
+                "launch_s": sum(launch) / len(launch),
+                "profile_kb": sum(prepared) / len(prepared) / 1024,
+                "read_kb": sum(io_read) / len(io_read) / 1024,
+                "write_kb": sum(io_write) / len(io_write) / 1024,
+            }
+    return out
 
-                # Manual selection via cookie or localStorage
-                sel = get_cookie(driver, "bw_series")
-                series_provider = get_cookie(driver, "bw_series_provider")
 
-                # Fallback: LS lesen, falls Cookie nicht ankam
-                if not sel:
-                    try:
-                        sel = driver.execute_script(
-                            "try { return localStorage.getItem('bw_series'); } catch(e) { return null; }"
+def _bench_enter_frame(driver) -> bool:
+    # Wechselt absichtlich in einen Frame und bleibt dort – der Actor muss das Top-Dokument wiederherstellen
+    try:
+        driver.switch_to.frame(0)
+        return True
+    except Exception:
+        return False
+
+
+def bench_driver_actor(driver: webdriver.Firefox, producers: int = 8, jobs: int = 40) -> Dict[str, Any]:
+    """Stresstest des Driver-Actors: mehrere Produzenten-Threads reichen gleichzeitig Aufträge ein (zusammen-
+    gelegte Lesezugriffe, zweiteilige Aufträge, Aufträge, die im Frame stehen bleiben), der Haupt-Thread bedient
+    sie und setzt dazwischen eigene Befehle ab. Zählt Aufträge, die nicht am Stück liefen oder nicht im
+    Top-Dokument starteten, und eigene Befehle, die nicht im Top-Dokument landeten."""
+    driver.switch_to.default_content()
+    url = driver.execute_script("return document.URL")
+    before = dict(DRIVER_ACTOR.stats)
+    errors = {"value": 0, "frame": 0, "failed": 0}
+
+    def producer(i: int) -> Dict[str, int]:
+        bad = {"value": 0, "frame": 0}
+        for j in range(jobs):
+            if j % 4 == 0:
+                seen = DRIVER_ACTOR.call(lambda d: d.execute_script("return document.URL"), key="bench:url")
+                bad["value"] += seen != url
+                continue
+            if j % 5 == 0:
+                DRIVER_ACTOR.call(_bench_enter_frame)
+                continue
+
+            def job(d, tag=f"{i}:{j}"):
+                top = d.execute_script("return window === window.top")
+                d.execute_script("window.__bwActorTag = arguments[0];", tag)
+                return top, d.execute_script("return window.__bwActorTag;") == tag
+
+            top, atomic = DRIVER_ACTOR.call(job)
+            bad["frame"] += not top
+            bad["value"] += not atomic
+        return bad
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=producers, thread_name_prefix="bw-bench") as pool:
+        futs = [pool.submit(producer, i) for i in range(producers)]
+        while not all(f.done() for f in futs):
+            DRIVER_ACTOR.serve(driver, 0.02)
+            errors["frame"] += not driver.execute_script("return window === window.top")
+        for f in futs:
+            try:
+                bad = f.result()
+                errors["value"] += bad["value"]
+                errors["frame"] += bad["frame"]
+            except Exception as e:
+                logging.debug(f"Actor bench producer failed: {e}")
+                errors["failed"] += 1
+    st = DRIVER_ACTOR.stats
+    ran = st["jobs"] - before["jobs"]
+    return {
+        "producers": producers,
+        "submitted": producers * jobs,
+        "jobs": ran,
+        "coalesced": st["coalesced"] - before["coalesced"],
+        "wall_s": time.perf_counter() - t0,
+        "wait_avg_ms": 1000 * (st["wait"] - before["wait"]) / max(ran, 1),
+        "wait_max_ms": 1000 * st["max_wait"],
+        **errors,
+    }
+
+
+def run_benchmarks(driver: webdriver.Firefox) -> None:
+    inject_sidebar(driver, load_progress())
+    pi = bench_page_impact(driver)
+    if pi:
+        w, wo = pi["with"], pi["without"]
+        logging.info(
+            f"[bench] page impact, {pi['nodes']} busy nodes (sidebar {'present' if pi['sidebar'] else 'missing'}): "
+            f"frames avg {w['frame_avg_ms']:.1f} / {wo['frame_avg_ms']:.1f} ms, p95 {w['frame_p95_ms']:.1f} / "
+            f"{wo['frame_p95_ms']:.1f} ms, long {w['long_frames']} / {wo['long_frames']}; style recalc avg "
+            f"{w['recalc_avg_ms']:.2f} / {wo['recalc_avg_ms']:.2f} ms, p95 {w['recalc_p95_ms']:.2f} / "
+            f"{wo['recalc_p95_ms']:.2f} ms (with / without sidebar)"
+        )
+    r = bench_sidebar_scroll(driver)
+    if r:
+        logging.info(
+            f"[bench] sidebar scroll, {r['rows']} rows: initial render {r['render_ms']:.0f} ms, "
+            f"{r['frames']} frames avg {r['frame_avg_ms']:.1f} ms / p95 {r['frame_p95_ms']:.1f} ms / "
+            f"max {r['frame_max_ms']:.1f} ms, {r['slow_frames']} slow, max {r['dom_rows']} rows in DOM"
+        )
+    p = bench_sidebar_payload(driver)
+    if p:
+        logging.info(
+            f"[bench] sidebar payload, {p['rows']} rows: full {p['full_bytes'] / 1024:.0f} KB "
+            f"({p['row_bytes']:.0f} B/row), 1-row patch {p['patch_bytes']} B; "
+            f"apply full {p.get('full_apply_ms') or 0:.1f} ms, patch {p.get('patch_apply_ms') or 0:.1f} ms"
+        )
+    a = bench_driver_actor(driver)
+    logging.info(
+        f"[bench] driver actor: {a['submitted']} submissions from {a['producers']} threads → {a['jobs']} jobs "
+        f"({a['coalesced']} coalesced) in {a['wall_s']:.2f}s, queue wait avg {a['wait_avg_ms']:.1f} ms / "
+        f"max {a['wait_max_ms']:.0f} ms; errors: {a['value']} torn, {a['frame']} off-top, {a['failed']} failed"
+    )
+    for mode, s in bench_profile_launch().items():
+        logging.info(
+            f"[bench] profile {mode}: launch {s['launch_s']:.2f}s, profile {s['profile_kb']:.0f} KB, "
+            f"disk read {s['read_kb']:.0f} KB / write {s['write_kb']:.0f} KB"
+        )
+
+
+# === MAIN ===
+def main() -> None:
+    global should_quit, is_playing
+    logging.info("BingeWatcher is starting...")
+    restarts = 0
+    last_restart = 0.0
+    drilled = False
+    last_reap = time.time()
+    recovery: Optional[Dict[str, Any]] = None
+    idle_passes = 0
+    driver: Optional[webdriver.Firefox] = None
+    startup_mark("imports (selenium) + module init")
+
+    try:
+        # Fortschritt + Sidebar-Zeilen vorbereiten, während Firefox hochfährt
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            prefetch = pool.submit(prefetch_startup_data)
+            driver = start_browser()
+            # Lief beim letzten Beenden eine Folge: direkt dorthin, Startseite und Sidebar-Auswahl entfallen
+            recovery = session_resume_job() if RESUME_SESSION and not BENCH else None
+            if recovery:
+                recovery.update(t0=_STARTUP_T0, how="Session snapshot restored")
+            elif CONNECT_EXISTING and on_provider_page(driver):
+                # Angedockt: offenen Tab samt Sidebar weiterverwenden, nichts neu laden
+                arm_window_close_guard(driver)
+            elif not safe_navigate(driver, START_URL, settle=0):
+                raise BingeWatcherError("Home page could not be loaded")
+            else:
+                startup_mark("navigate start page")
+            try:
+                start_db: Optional[Dict[str, Dict[str, Any]]] = prefetch.result()
+            except Exception as e:
+                logging.debug(f"Startup prefetch failed: {e}")
+                start_db = None
+            startup_mark("wait for prefetch")
+        if BENCH:
+            run_benchmarks(driver)
+
+        WATCHDOG.start()
+        while not should_quit:
+            WATCHDOG.beat("main", driver)
+            try:
+                db = start_db if start_db is not None else load_progress()
+                start_db = None
+                busy = False
+
+                # Nach Failover/Neustart: unterbrochene Folge an der gespeicherten Position fortsetzen
+                if recovery:
+                    job, recovery = recovery, None
+                    info = STREAMING_PROVIDERS.get(job["provider"], STREAMING_PROVIDERS["s.to"])
+                    target_url = info["episode_url_template"].format(
+                        series=job["series"], season=job["season"], episode=job["episode"]
+                    )
+                    if safe_navigate(driver, target_url, settle=0):
+                        hint = job.get("hint") or {}
+                        restore_sidebar_view(driver, hint)
+                        startup_mark("navigate to episode (session snapshot)")
+                        logging.info(
+                            f"{job['how']} in {time.perf_counter() - job['t0']:.2f}s, resuming "
+                            f"{job['series']} S{job['season']}E{job['episode']} at {job['position']}s"
                         )
-                    except Exception:
-                        sel = None
-                
-                if not series_provider:
+                        finish_startup(resumed=True)
+                        play_episodes_loop(
+                            driver, job["series"], job["season"], job["episode"], job["position"], job["provider"],
+                            hint=hint,
+                        )
+                        end_playback()
+                    continue
+
+                # Alle Sidebar-Signale (bw_*-Cookies + localStorage) in einem Round-Trip lesen und verbrauchen
+                sig = read_main_signals(driver)
+
+                if not sig.get("sidebar"):
+                    # Fallback ohne Extension: Sidebar per Script einsetzen
+                    if inject_sidebar(driver, db):
+                        finish_startup()
+                    sync_settings_to_localstorage(driver)
+                    busy = True
+                elif sig.get("rev") != str(_SIDEBAR_SENT["rev"]):
+                    # Sidebar steht schon (Extension / lokal neu aufgebaut), nur die Liste füllen
+                    if refresh_sidebar(driver, db, force=True):
+                        finish_startup()
+                    sync_settings_to_localstorage(driver)
+                    busy = True
+
+                if sig.get("quit"):
+                    should_quit = True
+                    break
+
+                refresh_list = False
+
+                # Handle deletion
+                if sig.get("del"):
+                    handle_list_item_deletion(str(sig["del"]))
+                    refresh_list = True
+
+                # Handle settings updates (from settings panel)
+                if sig.get("settings"):
+                    busy = True
                     try:
-                        series_provider = driver.execute_script(
-                            "try { return localStorage.getItem('bw_series_provider'); } catch(e) { return null; }"
+                        save_settings_file(json.loads(sig["settings"]))
+                        driver.execute_script(
+                            "localStorage.setItem('bw_settings', arguments[0]);",
+                            json.dumps(load_settings_file()),
                         )
                     except Exception:
-                        series_provider = None
+                        pass
+
+                # Handle UI update needed (from settings panel save)
+                if sig.get("ui_update"):
+                    refresh_list = True
+
+                # Handle intro start/end + end screen updates (from sidebar input) – normalisieren + live anwenden
+                if apply_skip_time_updates(sig):
+                    refresh_list = True
+
+                if refresh_list:
+                    busy = True
+                    db = load_progress()
+                    # UI sofort aktualisieren
+                    refresh_sidebar(driver, db)
+
+                # Manual selection via cookie or localStorage (bereits in read_main_signals aufgeräumt)
+                sel = sig.get("sel")
+                series_provider = sig.get("sel_provider")
 
                 if sel:
                     try:
@@ -3702,19 +6770,11 @@ def main() -> None:
                         pass
 
                     sel = norm_series_key(sel)
-
-                    # Aufräumen (beides)
-                    delete_cookie(driver, "bw_series")
-                    delete_cookie(driver, "bw_series_provider")
-                    try:
-                        driver.execute_script(
-                            "try { localStorage.removeItem('bw_series'); } catch(e) {}"
-                        )
-                        driver.execute_script(
-                            "try { localStorage.removeItem('bw_series_provider'); } catch(e) {}"
-                        )
-                    except Exception:
-                        pass
+                    if series_provider:
+                        try:
+                            series_provider = unquote(series_provider)
+                        except Exception:
+                            pass
 
                     sdata = db.get(sel)
                     if sdata:
@@ -3729,37 +6789,31 @@ def main() -> None:
                     if series_provider and series_provider in STREAMING_PROVIDERS:
                         selected_provider = series_provider
                     else:
-                        try:
-                            selected_provider = driver.execute_script(
-                                "try { return localStorage.getItem('bw_website_switch') || 's.to'; } catch(e) { return 's.to'; }"
-                            )
-                        except Exception:
-                            selected_provider = "s.to"
+                        selected_provider = sig.get("website") or "s.to"
                     
                     # Verwende den ausgewählten Provider für die Navigation
                     provider_info = STREAMING_PROVIDERS.get(selected_provider, STREAMING_PROVIDERS["s.to"])
                     target_url = provider_info["episode_url_template"].format(
                         series=sel, season=season, episode=episode
                     )
+                    idle_passes = 0
+                    _IDLE_MARK.clear()
                     if safe_navigate(driver, target_url):
                         play_episodes_loop(driver, sel, season, episode, position, selected_provider)
+                        end_playback()
                     continue
 
                 # Auto detect if user navigated into an episode
-                ser, se, ep, detected_provider = parse_episode_info(driver.current_url or "")
+                here = driver.current_url or ""
+                ser, se, ep, detected_provider = parse_episode_info(here)
                 if ser and se and ep:
                     # Verwende den erkannten Provider oder den ausgewählten Provider
-                    try:
-                        selected_provider = driver.execute_script(
-                            "try { return localStorage.getItem('bw_website_switch') || 's.to'; } catch(e) { return 's.to'; }"
-                        )
-                        # Wenn der erkannte Provider mit dem ausgewählten übereinstimmt oder kein Provider erkannt wurde
-                        if detected_provider == selected_provider or not detected_provider:
-                            provider = selected_provider
-                        else:
-                            provider = detected_provider
-                    except Exception:
-                        provider = detected_provider or "s.to"
+                    selected_provider = sig.get("website") or "s.to"
+                    # Wenn der erkannte Provider mit dem ausgewählten übereinstimmt oder kein Provider erkannt wurde
+                    if detected_provider == selected_provider or not detected_provider:
+                        provider = selected_provider
+                    else:
+                        provider = detected_provider
                     
                     sdata = load_progress().get(ser, {})
                     if (
@@ -3769,28 +6823,77 @@ def main() -> None:
                         pos = int(sdata.get("position", 0))
                     else:
                         pos = 0
+                    idle_passes = 0
+                    _IDLE_MARK.clear()
                     play_episodes_loop(driver, ser, se, ep, pos, provider)
+                    end_playback()
                     continue
 
-                time.sleep(0.8)
+                # Reserve-Browser erst nach dem Start hochziehen (konkurriert sonst um CPU/Platte)
+                if _STARTUP_LAST["done"]:
+                    ensure_standby()
+                    # BW_BENCH + BW_STANDBY: einmal den aktiven Browser abschießen und den Failover messen
+                    if BENCH and not drilled and standby_ready():
+                        drilled = True
+                        logging.info(f"[bench] failover drill: killed {kill_browser(driver)} browser processes")
+
+                # Auch ohne laufende Folge ab und zu Popups/fremde Tabs einsammeln
+                if not busy and time.time() - last_reap > HEALTH_CHECK_INTERVAL:
+                    last_reap = time.time()
+                    reap_windows(driver)
+
+                # Katalog-Autocomplete beantworten; veraltete Kataloge im Leerlauf nachladen
+                if sig.get("catalog"):
+                    answer_catalog_query(driver, sig["catalog"])
+                    busy = True
+                elif not busy and schedule_catalog_refresh(here):
+                    busy = True  # der Katalog-Thread braucht den Driver-Actor → nicht in den Idle-Modus
+
+                # Idle-Modus: nichts zu tun und keine Episode offen → ereignisgesteuert warten statt 0.8s-Polling
+                if busy:
+                    idle_passes = 0
+                    _IDLE_MARK.clear()
+                else:
+                    idle_passes += 1
+                if idle_passes >= IDLE_AFTER_PASSES:
+                    DRIVER_ACTOR.serve(driver)
+                    if idle_wait(driver):
+                        idle_passes = 0
+                else:
+                    DRIVER_ACTOR.serve(driver, 0.8)
             except (InvalidSessionIdException, WebDriverException) as e:
                 logging.warning(f"Session error: {e}. Restarting Firefox...")
-                try:
-                    if driver:
-                        driver.quit()
-                except Exception:
-                    pass
+                WATCHDOG.pause()
+                t0 = time.perf_counter()
+                quit_browser(driver)
+                # Nur Abstürze kurz hintereinander zählen; eine Session, die 10 min lief, setzt zurück
+                if time.time() - last_restart > 600:
+                    restarts = 0
                 if restarts >= 2:
                     logging.error("Too many restarts, giving up.")
                     should_quit = True
                     break
                 restarts += 1
-                driver = start_browser()
-                if not safe_navigate(driver, START_URL):
-                    logging.error("Restarted, but start page failed.")
-                    should_quit = True
-                    break
-                arm_window_close_guard(driver)
+                last_restart = time.time()
+                driver = promote_standby()
+                standby = driver is not None
+                if not standby:
+                    driver = start_browser()
+                    if not safe_navigate(driver, START_URL):
+                        logging.error("Restarted, but start page failed.")
+                        should_quit = True
+                        break
+                    arm_window_close_guard(driver)
+                idle_passes = 0
+                _IDLE_MARK.clear()
+                how = "Recovered on " + ("standby browser" if standby else "fresh browser")
+                # Lief gerade eine Folge, dort weitermachen (Snapshot: genaue Position, Hoster, Vollbild-Weg)
+                recovery = session_resume_job(current_series) if is_playing else None
+                is_playing = False
+                if recovery:
+                    recovery.update(t0=t0, how=how)
+                else:
+                    logging.info(f"{how} in {time.perf_counter() - t0:.2f}s")
                 continue
             except Exception as e:
                 logging.warning(f"Main-Loop Warning: {e}")
@@ -3801,13 +6904,39 @@ def main() -> None:
     except Exception as e:
         logging.error(f"Fatal: {e}")
     finally:
-        try:
-            if driver:
-                driver.quit()
-        except Exception:
-            pass
+        drop_standby()
+        if TICK_STATS:
+            logging.info(f"Playback tick totals: {format_tick_stats(TICK_STATS)}")
+        if IDLE_STATS["waits"]:
+            logging.info(f"Idle mode: {format_idle_stats(IDLE_STATS)}")
+        if len(MEMORY_SAMPLES) > 1:
+            logging.info(f"Firefox memory: {format_memory_stats(MEMORY_SAMPLES, MEMORY_ACTIONS)}")
+        if REAPED["runs"]:
+            logging.info(f"Window reaper: {format_reap_stats(REAPED)}")
+        if WATCHDOG_STATS["timeouts"] or WATCHDOG_STATS["stalls"] or WATCHDOG_STATS["recoveries"]:
+            logging.info(f"Watchdog: {format_watchdog_stats(WATCHDOG_STATS)}")
+        DRIVER_ACTOR.close()
+        flush_io()
+        if DRIVER_ACTOR.stats["jobs"]:
+            logging.info(f"Driver actor: {format_actor_stats(DRIVER_ACTOR.stats)}")
+        quit_browser(driver)
         logging.info("BingeWatcher finished")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BingeWatcher")
+    parser.add_argument("--startup-profile", action="store_true", help="log a per-phase startup timeline")
+    parser.add_argument(
+        "--connect-existing", action="store_true", help="attach to the persistent Firefox (started on demand)"
+    )
+    parser.add_argument(
+        "--browser", choices=("start", "stop", "status"), help="manage the persistent Firefox and exit"
+    )
+    args = parser.parse_args()
+    if args.startup_profile:
+        STARTUP_PROFILE = True
+    if args.connect_existing:
+        CONNECT_EXISTING = True
+    if args.browser:
+        sys.exit(supervise_browser(args.browser))
     main()
@@ -0,0 +1,59 @@
+import importlib.util
+import os
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "s.toBot.py")
+
+
+@pytest.fixture(scope="session")
+def bw():
+    """s.toBot.py als Modul (der Punkt im Dateinamen verhindert einen normalen Import)."""
+    spec = importlib.util.spec_from_file_location("s_to_bot", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeDriver:
+    """Minimaler WebDriver-Ersatz: merkt sich Aufrufe, statt einen Browser zu steuern."""
+
+    def __init__(self, session_id="fake", alive=True):
+        self.session_id = session_id
+        self.alive = alive
+        self.calls = []
+        self.switch_to = self
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("session deleted")
+        return "https://s.to/"
+
+    @property
+    def current_window_handle(self):
+        return "main"
+
+    def default_content(self):
+        self.calls.append("default_content")
+
+    def maximize_window(self):
+        self.calls.append("maximize")
+
+    def set_window_position(self, x, y):
+        self.calls.append("position")
+
+    def set_window_size(self, w, h):
+        self.calls.append("size")
+
+    def fullscreen_window(self):
+        self.calls.append("fullscreen")
+
+    def quit(self):
+        self.calls.append("quit")
+        self.alive = False
+
+
+@pytest.fixture
+def fake_driver():
+    return FakeDriver()
@@ -0,0 +1,129 @@
+import json
+import os
+
+import pytest
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def fixture_html(name):
+    with open(os.path.join(FIXTURES, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def s_to(bw):
+    return bw.parse_catalog_html(fixture_html("s_to_serien.html"), "s.to")
+
+
+@pytest.fixture
+def aniworld(bw):
+    return bw.parse_catalog_html(fixture_html("aniworld_animes.html"), "aniworld.to")
+
+
+@pytest.fixture
+def index(bw, s_to, aniworld):
+    return bw.CatalogIndex({"s.to": {"series": s_to}, "aniworld.to": {"series": aniworld}})
+
+
+@pytest.fixture
+def catalog_file(bw, tmp_path, monkeypatch):
+    path = tmp_path / "catalog.json"
+    monkeypatch.setattr(bw, "CATALOG_FILE", str(path))
+    monkeypatch.setattr(bw, "_CATALOG", {})
+    return path
+
+
+def names(results):
+    return [r["name"] for r in results]
+
+
+def test_parse_series_index(s_to):
+    assert s_to == [
+        ["breaking-bad", "Breaking Bad", "Breaking Bad – Die komplette Serie"],
+        ["better-call-saul", "Better Call Saul"],
+        ["bad-sisters", "Bad Sisters"],
+        ["law-order", "Law & Order", "Law & Order"],
+        ["haus-des-geldes", "Haus des Geldes", "La casa de papel, Money Heist"],
+        ["pokemon", "Pokémon"],
+        ["dark", "Dark"],
+        ["the-dark-crystal", "Der dunkle Kristall: Ära des Widerstands"],
+    ]
+
+
+def test_parse_skips_episode_and_foreign_links(s_to, aniworld):
+    slugs = [item[0] for item in s_to]
+    assert "one-piece" not in slugs  # /anime/stream/ gehört zu aniworld.to
+    assert "empty-title" not in slugs
+    assert slugs.count("breaking-bad") == 1
+    assert [item[0] for item in aniworld] == ["one-piece", "attack-on-titan", "naruto-shippuden", "naruto"]
+
+
+def test_parse_empty_page(bw):
+    assert bw.parse_catalog_html("", "s.to") == []
+    assert bw.parse_catalog_html(None, "aniworld.to") == []
+
+
+def test_search_prefix_before_inner_word(index):
+    assert names(index.search("bad")) == ["Bad Sisters", "Breaking Bad"]
+
+
+def test_search_shorter_name_wins_tie(index):
+    assert names(index.search("naruto")) == ["Naruto", "Naruto Shippuden"]
+
+
+def test_search_name_before_alternative_title(index):
+    assert names(index.search("dark")) == ["Dark", "Der dunkle Kristall: Ära des Widerstands"]
+
+
+def test_search_alternative_titles_and_accents(index):
+    assert names(index.search("money heist")) == ["Haus des Geldes"]
+    assert names(index.search("kyojin")) == ["Attack on Titan"]
+    assert names(index.search("pokemon")) == ["Pokémon"]
+    assert names(index.search("law order")) == ["Law & Order"]
+
+
+def test_search_tolerates_typos(index):
+    assert names(index.search("breakng bad")) == ["Breaking Bad"]
+
+
+def test_search_reports_provider_and_slug(index):
+    assert index.search("one piece") == [{"provider": "aniworld.to", "slug": "one-piece", "name": "One Piece"}]
+
+
+def test_search_limits(index):
+    assert index.search("b") == []
+    assert index.search("xyz") == []
+    assert names(index.search("bad", limit=1)) == ["Bad Sisters"]
+
+
+def test_save_load_round_trip(bw, catalog_file, s_to, aniworld):
+    assert bw.load_catalog() == {}
+    assert bw.save_catalog("s.to", s_to)
+    assert bw.save_catalog("aniworld.to", aniworld)
+    raw = json.loads(catalog_file.read_text(encoding="utf-8"))
+    assert raw["s.to"]["series"] == s_to
+    assert raw["aniworld.to"]["series"] == aniworld
+    bw._CATALOG.clear()
+    data = bw.load_catalog()
+    assert data["s.to"]["series"] == s_to and data["aniworld.to"]["series"] == aniworld
+    assert names(bw.catalog_search("call saul")) == ["Better Call Saul"]
+
+
+def test_save_rebuilds_search_index(bw, catalog_file, s_to, aniworld):
+    bw.save_catalog("s.to", s_to)
+    assert bw.catalog_search("naruto") == []
+    bw.save_catalog("aniworld.to", aniworld)
+    assert names(bw.catalog_search("naruto")) == ["Naruto", "Naruto Shippuden"]
+
+
+@pytest.mark.parametrize("content", ["{broken", "[]"])
+def test_load_corrupt_catalog(bw, catalog_file, content):
+    catalog_file.write_text(content, encoding="utf-8")
+    assert bw.load_catalog() == {}
+    assert bw.catalog_search("dark") == []
+
+
+def test_index_skips_malformed_entries(bw):
+    index = bw.CatalogIndex({"s.to": {"series": [["dark", "Dark"], ["broken"], None, 5]}, "aniworld.to": None})
+    assert names(index.search("dark")) == ["Dark"]
@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def actor(bw):
+    actor = bw.DriverActor()
+    yield actor
+    actor.close()
+
+
+def test_serve_runs_jobs_by_priority_then_fifo(actor, fake_driver):
+    order = []
+    for name, prio in [("a", 5), ("b", 1), ("c", 5), ("d", 0), ("e", 1)]:
+        actor.submit(lambda d, n=name: order.append(n), priority=prio)
+    assert actor.serve(fake_driver) == 5
+    assert order == ["d", "b", "e", "a", "c"]
+
+
+def test_jobs_receive_driver_and_resolve_futures(actor, fake_driver):
+    fut = actor.submit(lambda d: d.session_id)
+    assert not fut.done()
+    actor.serve(fake_driver)
+    assert fut.result(0) == "fake"
+
+
+def test_same_key_coalesces_while_queued(actor, fake_driver):
+    runs = []
+    first = actor.submit(lambda d: runs.append(1) or "state", key="state")
+    second = actor.submit(lambda d: runs.append(2) or "other", key="state")
+    assert second is first
+    assert actor.stats["coalesced"] == 1
+    actor.serve(fake_driver)
+    assert runs == [1] and second.result(0) == "state"
+    # Nach dem Abarbeiten gibt es für denselben Key wieder einen neuen Auftrag
+    third = actor.submit(lambda d: "again", key="state")
+    assert third is not first
+    actor.serve(fake_driver)
+    assert third.result(0) == "again"
+
+
+def test_failing_job_sets_exception_and_queue_continues(actor, fake_driver):
+    def boom(d):
+        raise ValueError("boom")
+
+    bad = actor.submit(boom, priority=0)
+    good = actor.submit(lambda d: 42, priority=1)
+    assert actor.serve(fake_driver) == 2
+    with pytest.raises(ValueError):
+        bad.result(0)
+    assert good.result(0) == 42
+    assert actor.stats["failed"] == 1 and actor.stats["jobs"] == 2
+
+
+def test_driver_returned_in_top_document_after_frame_job(bw, actor, fake_driver, monkeypatch):
+    monkeypatch.setitem(bw._CALLS, "frame", True)
+    actor.submit(lambda d: None)
+    actor.serve(fake_driver)
+    assert fake_driver.calls == ["default_content", "default_content"]
+
+
+def test_call_from_background_thread(actor, fake_driver):
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(v=actor.call(lambda d: d.session_id, timeout=5)))
+    worker.start()
+    deadline = time.monotonic() + 5
+    while worker.is_alive() and time.monotonic() < deadline:
+        actor.serve(fake_driver, 0.05)
+    worker.join(1)
+    assert result == {"v": "fake"}
+
+
+def test_call_from_owner_thread_is_refused(actor):
+    with pytest.raises(RuntimeError):
+        actor.call(lambda d: None)
+
+
+def test_close_cancels_pending_and_later_jobs(actor, fake_driver):
+    runs = []
+    pending = actor.submit(lambda d: runs.append(1), key="k")
+    actor.close()
+    assert pending.cancelled()
+    late = actor.submit(lambda d: runs.append(2))
+    assert late.cancelled()
+    started = time.monotonic()
+    assert actor.serve(fake_driver, 2.0) == 0
+    assert time.monotonic() - started < 1.0
+    assert runs == []
+
+
+def test_close_wakes_waiting_serve(actor, fake_driver):
+    threading.Timer(0.1, actor.close).start()
+    started = time.monotonic()
+    assert actor.serve(fake_driver, 5.0) == 0
+    assert time.monotonic() - started < 2.0
+
+
+def test_cancelled_future_is_skipped(actor, fake_driver):
+    runs = []
+    fut = actor.submit(lambda d: runs.append(1))
+    fut.cancel()
+    assert actor.serve(fake_driver) == 0
+    assert runs == []
@@ -0,0 +1,148 @@
+import json
+import time
+
+import pytest
+
+from conftest import FakeDriver
+
+
+@pytest.fixture
+def stats_file(bw, tmp_path, monkeypatch):
+    path = tmp_path / "hoster_stats.json"
+    monkeypatch.setattr(bw, "HOSTER_STATS_FILE", str(path))
+    return path
+
+
+def test_rank_fast_known_hosters_first(bw):
+    stats = {
+        "VOE": {"samples": 4, "ttff_avg": 3.0},
+        "Vidoza": {"samples": 4, "ttff_avg": 1.2},
+    }
+    assert bw.rank_hosters(["VOE", "Doodstream", "Vidoza"], stats) == ["Vidoza", "VOE", "Doodstream"]
+
+
+def test_rank_unknown_keep_page_order(bw):
+    assert bw.rank_hosters(["VOE", "Doodstream", "Vidoza"], {}) == ["VOE", "Doodstream", "Vidoza"]
+
+
+def test_rank_stalls_penalize(bw):
+    stats = {
+        "VOE": {"samples": 2, "ttff_avg": 1.0, "stalls": 6},
+        "Vidoza": {"samples": 2, "ttff_avg": 2.0, "stalls": 0},
+    }
+    assert bw.rank_hosters(["VOE", "Vidoza"], stats) == ["Vidoza", "VOE"]
+
+
+def test_rank_unhealthy_last(bw):
+    stats = {
+        "VOE": {"samples": 4, "ttff_avg": 0.5, "err_232011": 2, "failed": 1},
+        "Vidoza": {"samples": 4, "ttff_avg": 5.0},
+    }
+    assert bw.rank_hosters(["VOE", "Doodstream", "Vidoza"], stats) == ["Vidoza", "Doodstream", "VOE"]
+
+
+def test_record_ttff_decays_towards_new_samples(bw, stats_file):
+    bw.record_hoster_sample("VOE", ttff=10.0)
+    assert bw.load_hoster_stats()["VOE"]["ttff_avg"] == 10.0
+    for _ in range(10):
+        bw.record_hoster_sample("VOE", ttff=1.0)
+    entry = bw.load_hoster_stats()["VOE"]
+    assert entry["samples"] == 11
+    assert entry["ttff_count"] == 11
+    assert 1.0 < entry["ttff_avg"] < 1.3
+
+
+def test_record_counts_errors_and_failures(bw, stats_file):
+    bw.record_hoster_sample("VOE", ttff=None, stalls=2, error_232011=True, fullscreen_ok=False)
+    bw.record_hoster_sample("VOE", failed=True)
+    entry = bw.load_hoster_stats()["VOE"]
+    assert entry["samples"] == 2
+    assert entry["stalls"] == 2
+    assert entry["err_232011"] == 1
+    assert entry["failed"] == 1
+    assert entry["fs_attempts"] == 1 and "fs_ok" not in entry
+    assert "ttff_avg" not in entry
+    assert bw.hoster_error_rate(entry) == 1.0
+
+
+def test_record_without_hoster_is_ignored(bw, stats_file):
+    assert bw.record_hoster_sample("", ttff=1.0) is False
+    assert not stats_file.exists()
+
+
+def test_missing_stats_file(bw, stats_file):
+    assert bw.load_hoster_stats() == {}
+    assert bw.rank_hosters(["VOE", "Vidoza"]) == ["VOE", "Vidoza"]
+
+
+@pytest.mark.parametrize("content", ["{not json", "[1, 2, 3]", ""])
+def test_corrupt_stats_file(bw, stats_file, content):
+    stats_file.write_text(content, encoding="utf-8")
+    assert bw.load_hoster_stats() == {}
+    assert bw.record_hoster_sample("VOE", ttff=2.0) is True
+    assert json.loads(stats_file.read_text(encoding="utf-8"))["VOE"]["ttff_avg"] == 2.0
+
+
+def test_corrupt_entry_is_replaced(bw, stats_file):
+    stats_file.write_text(json.dumps({"VOE": "garbage"}), encoding="utf-8")
+    assert bw.record_hoster_sample("VOE", ttff=2.0) is True
+    assert bw.load_hoster_stats()["VOE"]["samples"] == 1
+
+
+class HosterPage(FakeDriver):
+    """Episodenseite mit mehreren Hostern; jeder zeigt sein erstes Bild erst delay Sekunden nach dem Wechsel."""
+
+    def __init__(self, delays):
+        super().__init__()
+        self.delays = delays
+        self.active = next(iter(delays))
+        self.switched_at = time.time()
+        self.switches = []
+
+    def execute_script(self, script, *args):
+        if "data-link-target" in script:  # list_episode_hosters
+            return [{"name": n, "target": f"/redirect/{n}", "lang": "1", "active": n == self.active}
+                    for n in self.delays]
+        if "frame.src" in script:  # Hoster-Wechsel in select_fastest_hoster
+            self.active = args[0].rsplit("/", 1)[1]
+            self.switched_at = time.time()
+            self.switches.append(self.active)
+            return True
+        return None
+
+    def execute_async_script(self, script, op, args, ms):  # video_call über die Bridge
+        if op == "firstFrame":
+            return {"ok": True, "value": time.time() - self.switched_at >= self.delays[self.active]}
+        return {"ok": True, "value": False}
+
+
+def test_ttff_follows_hoster_latency_and_fastest_is_picked(bw, stats_file, monkeypatch):
+    monkeypatch.setattr(bw, "AUTO_HOSTER", True)
+    page = HosterPage({"VOE": 0.45, "Vidoza": 0.05, "Doodstream": 0.25})
+    measured = {}
+    for name in ["VOE", "Vidoza", "Doodstream"]:
+        started = time.time()
+        assert bw.select_fastest_hoster(page, prefer=name) == name
+        measured[name] = bw.time_to_first_frame(page, started, timeout=3)
+        bw.record_hoster_sample(name, ttff=measured[name])
+    stats = bw.load_hoster_stats()
+    assert sorted(measured, key=measured.get) == ["Vidoza", "Doodstream", "VOE"]
+    recorded = [stats[n]["ttff_avg"] for n in ("Vidoza", "Doodstream", "VOE")]
+    assert recorded == sorted(recorded)
+    assert recorded == pytest.approx(sorted(measured.values()), abs=1e-3)
+    assert measured["VOE"] >= 0.45
+    # Nächste Folge: ohne Vorgabe wird der schnellste Hoster gewählt
+    assert bw.select_fastest_hoster(page) == "Vidoza"
+    assert page.switches[-1] == "Vidoza"
+
+
+def test_ttff_excludes_setup_time(bw):
+    page = HosterPage({"VOE": 0.3})
+    started = time.time()
+    ttff = bw.time_to_first_frame(page, started, setup=0.2, timeout=3)
+    assert 0.05 <= ttff < 0.3
+
+
+def test_ttff_timeout(bw):
+    page = HosterPage({"VOE": 10})
+    assert bw.time_to_first_frame(page, time.time(), timeout=0.3) is None
@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+from conftest import FakeDriver
+
+
+@pytest.fixture
+def standby(bw, monkeypatch):
+    """Reserve-Browser-Slot mit gefälschtem Start statt echtem Firefox."""
+    launched = []
+
+    def launch():
+        driver = FakeDriver(session_id=f"standby-{len(launched)}")
+        launched.append(driver)
+        return driver
+
+    monkeypatch.setattr(bw, "STANDBY_BROWSER", True)
+    monkeypatch.setattr(bw, "HEADLESS", False)
+    monkeypatch.setattr(bw, "WAIT_TIMEOUT", 1)
+    monkeypatch.setattr(bw, "should_quit", False)
+    monkeypatch.setattr(bw, "_launch_standby", launch)
+    monkeypatch.setattr(bw, "_WINDOWS", {})
+    monkeypatch.setitem(bw._STANDBY, "future", None)
+    monkeypatch.delenv("BW_KIOSK", raising=False)
+    yield launched
+    bw.drop_standby()
+
+
+def test_promote_without_standby(bw, standby):
+    assert bw.promote_standby() is None
+    assert standby == []
+
+
+def test_ensure_standby_starts_once(bw, standby):
+    bw.ensure_standby()
+    first = bw._STANDBY["future"]
+    bw.ensure_standby()
+    assert bw._STANDBY["future"] is first
+    first.result(5)
+    assert bw.standby_ready()
+    assert len(standby) == 1
+
+
+def test_ensure_standby_disabled(bw, standby, monkeypatch):
+    monkeypatch.setattr(bw, "STANDBY_BROWSER", False)
+    bw.ensure_standby()
+    assert bw._STANDBY["future"] is None
+
+
+def test_promote_shows_and_claims_standby(bw, standby):
+    bw.ensure_standby()
+    driver = bw.promote_standby()
+    assert driver is standby[0]
+    assert bw._STANDBY["future"] is None
+    assert "maximize" in driver.calls and "quit" not in driver.calls
+    assert bw._WINDOWS[driver.session_id]["main"] == "main"
+    # Einmal übernommen, ist der Slot leer, bis ensure_standby neu startet
+    assert bw.promote_standby() is None
+
+
+def test_promote_waits_for_starting_standby(bw, standby, monkeypatch):
+    release = threading.Event()
+    launch = bw._launch_standby
+
+    def slow_launch():
+        release.wait(5)
+        return launch()
+
+    monkeypatch.setattr(bw, "_launch_standby", slow_launch)
+    bw.ensure_standby()
+    assert not bw.standby_ready()
+    threading.Timer(0.1, release.set).start()
+    assert bw.promote_standby() is standby[0]
+
+
+def test_promote_failed_launch(bw, standby, monkeypatch):
+    def broken():
+        raise RuntimeError("geckodriver missing")
+
+    monkeypatch.setattr(bw, "_launch_standby", broken)
+    bw.ensure_standby()
+    bw._STANDBY["future"].exception(5)
+    assert not bw.standby_ready()
+    assert bw.promote_standby() is None
+    assert bw._STANDBY["future"] is None
+
+
+def test_promote_dead_standby_is_quit(bw, standby):
+    bw.ensure_standby()
+    bw._STANDBY["future"].result(5).alive = False
+    assert bw.promote_standby() is None
+    assert "quit" in standby[0].calls
+
+
+def test_drop_standby_quits_browser(bw, standby):
+    bw.ensure_standby()
+    bw.drop_standby()
+    assert bw._STANDBY["future"] is None
+    assert standby[0].calls == ["quit"]
+
+
+def test_drop_standby_waits_for_starting_browser(bw, standby, monkeypatch):
+    release = threading.Event()
+    launch = bw._launch_standby
+
+    def slow_launch():
+        release.wait(5)
+        return launch()
+
+    monkeypatch.setattr(bw, "_launch_standby", slow_launch)
+    bw.ensure_standby()
+    threading.Timer(0.1, release.set).start()
+    bw.drop_standby()
+    assert standby[0].calls == ["quit"]
+
+
+def test_drop_without_standby(bw, standby):
+    bw.drop_standby()
+    assert standby == []
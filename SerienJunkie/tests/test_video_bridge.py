@@ -0,0 +1,68 @@
+import inspect
+import re
+
+from conftest import FakeDriver
+
+
+def bridge_ops(bw):
+    body = bw.VIDEO_BRIDGE_JS.split("const ops = {", 1)[1].split("\n  };", 1)[0]
+    return set(re.findall(r"^    (\w+):", body, re.M))
+
+
+def test_every_video_call_op_exists_in_bridge(bw):
+    source = inspect.getsource(bw)
+    used = set(re.findall(r'video_call\(\s*driver,\s*"(\w+)"', source))
+    assert {"pos", "state", "jwError", "armSkip"} <= used
+    assert sorted(used - bridge_ops(bw)) == []
+
+
+def test_frame_ops_are_bridge_ops(bw):
+    frame_ops = re.search(r"const FRAME_OPS = \[([^\]]*)\]", bw.VIDEO_BRIDGE_JS).group(1)
+    names = set(re.findall(r"'(\w+)'", frame_ops))
+    assert "jwError" in names
+    assert names <= bridge_ops(bw)
+
+
+class ErrorPageDriver(FakeDriver):
+    """Bridge antwortet nicht (kein <video> → kein hello); der JW-Fehler steht im zweiten Player-iframe."""
+
+    def __init__(self, error_frame):
+        super().__init__()
+        self.error_frame = error_frame
+        self.inside = None
+
+    def execute_async_script(self, script, *args):
+        return {"ok": False, "error": "no-frame"}
+
+    def execute_script(self, script, *args):
+        return self.inside is not None and self.inside == self.error_frame
+
+    def find_elements(self, by, value):
+        return ["ads", "player"]
+
+    def frame(self, element):  # switch_to.frame
+        self.inside = element
+
+    def default_content(self):
+        super().default_content()
+        self.inside = None
+
+
+def test_detect_232011_falls_back_to_frames(bw):
+    driver = ErrorPageDriver("player")
+    assert bw.detect_232011(driver) is True
+    assert driver.inside is None  # zurück im Top-Dokument
+
+
+def test_detect_232011_without_error(bw):
+    driver = ErrorPageDriver("elsewhere")
+    assert bw.detect_232011(driver) is False
+
+
+def test_detect_232011_prefers_bridge_answer(bw):
+    class BridgeDriver(FakeDriver):
+        def execute_async_script(self, script, *args):
+            assert args[0] == "jwError"
+            return {"ok": True, "value": True}
+
+    assert bw.detect_232011(BridgeDriver()) is True
@@ -6,7 +6,7 @@ cd /d "%~dp0SerienJunkie"
 echo Starting Binge Watching...
 
 REM === Required Python modules ===
-set modules=selenium configparser
+set modules=selenium configparser psutil
 
 REM === Check Python installation ===
 python --version >nul 2>&1